@@ -1,381 +1,851 @@
-"""
-The MIT License (MIT)
-
-Copyright (c) 2021-present beastmatser
-Copyright (c) 2023-present Yumax-panda
-
-Permission is hereby granted, free of charge, to any person obtaining a
-copy of this software and associated documentation files (the "Software"),
-to deal in the Software without restriction, including without limitation
-the rights to use, copy, modify, merge, publish, distribute, sublicense,
-and/or sell copies of the Software, and to permit persons to whom the
-Software is furnished to do so, subject to the following conditions:
-The above copyright notice and this permission notice shall be included in
-all copies or substantial portions of the Software.
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
-OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
-FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
-DEALINGS IN THE SOFTWARE.
-"""
-
-from __future__ import annotations
-from typing import Optional, Final, Any, Type, TypeVar, Union
-import aiohttp
-
-from objects import (
-    BaseObject,
-    Berry,
-    BerryFirmness,
-    BerryFlavor,
-    ContestType,
-    ContestEffect,
-    SuperContestEffect,
-    EncounterMethod,
-    EncounterCondition,
-    EncounterConditionValue,
-    EvolutionChain,
-    EvolutionTrigger,
-    Generation,
-    Pokedex,
-    Version,
-    VersionGroup,
-    Item,
-    ItemAttribute,
-    ItemCategory,
-    ItemFlingEffect,
-    ItemPocket,
-    Location,
-    LocationArea,
-    PalParkArea,
-    Region,
-    Machine,
-    Move,
-    MoveAilment,
-    MoveBattleStyle,
-    MoveCategory,
-    MoveDamageClass,
-    MoveLearnMethod,
-    MoveTarget,
-    Language,
-    Url
-)
-
-from objects.pokemon import (
-    Ability,
-    Characteristic,
-    EggGroup,
-    Gender,
-    GrowthRate,
-    Nature,
-    PokeathlonStat,
-    Pokemon,
-    LocationAreaEncounter,
-    PokemonColor,
-    PokemonForm,
-    PokemonHabitat,
-    PokemonShape,
-    PokemonSpecies,
-    Stat
-)
-from objects.pokemon import Type as PokemonTypePayload
-from cache import Cache, cached_resource
-
-
-BASE_URL: Final[str] = 'https://pokeapi.co/api/v2'
-
-Param = Union[str, int]
-JsonResponse = Union[list, dict[str, Any]]
-T = TypeVar('T', bound=BaseObject)
-
-
-class HttpClient:
-
-    def __init__(
-        self,
-        *,
-        session: Optional[aiohttp.ClientSession]
-    ) -> None:
-        self._session = session or aiohttp.ClientSession()
-        self.inexistent_endpoints: list[str] = []
-
-    async def close(self) -> None:
-        if self._session is not None:
-            await self._session.close()
-
-    async def get(self, endpoint: str) -> Optional[JsonResponse]:
-        async with self._session.get(f'{BASE_URL}/{endpoint}') as response:
-            if endpoint in self.inexistent_endpoints:
-                return None
-            if response.status != 200:
-                self.inexistent_endpoints.append(endpoint)
-                return None
-            else:
-                return await response.json()
-
-class Client:
-
-    http: HttpClient
-    _cache: Cache
-
-    def __init__(
-        self,
-        *,
-        session: Optional[aiohttp.ClientSession] = None,
-    ) -> None:
-        self.http: HttpClient = HttpClient(session=session)
-        self._cache: Cache = Cache()
-        Url.link(self)
-
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, *args):
-        await self.close()
-
-    async def close(self):
-        await self.http.close()
-
-    async def _fetch(self, url: str, cls: Type[T]) -> Union[T, list[T], None]:
-        """fetch response from Poke API and change JSONResponse into each classes
-
-        Parameters
-        ----------
-        url: :class:`str`
-            The API's endpoint url
-        cls: :class:`Type[T]`
-            class after changing
-
-        Returns
-        -------
-        :class:`T | list[T] | None`
-            the same type as argument `cls`
-        """
-
-        if (data := await self.http.get(url)) is None:
-            return None
-
-        if isinstance(data, list):
-            return cls.loads_list(data)
-        else:
-            return cls.loads(data)
-
-
-    """Berries (Group)"""
-    @cached_resource(endpoint='berry')
-    async def get_berry(self, id_or_name: Param) -> Optional[Berry]:
-        return await self._fetch(f'berry/{id_or_name}', Berry)
-
-    @cached_resource(endpoint='berry-firmness')
-    async def get_berry_firmness(self, id_or_name: Param) -> Optional[BerryFirmness]:
-        return await self._fetch(f'berry-firmness/{id_or_name}', BerryFirmness)
-
-    @cached_resource(endpoint='berry-flavor')
-    async def get_berry_flavor(self, id_or_name: Param) -> Optional[BerryFlavor]:
-        return await self._fetch(f'berry-flavor/{id_or_name}', BerryFlavor)
-
-
-    """Contests (Group)"""
-    @cached_resource(endpoint='contest-type')
-    async def get_contest_type(self, id_or_name: Param) -> Optional[ContestType]:
-        return await self._fetch(f'contest-type/{id_or_name}', ContestType)
-
-    @cached_resource(endpoint='contest-effect')
-    async def get_contest_effect(self, id_or_name: Param) -> Optional[ContestEffect]:
-        return await self._fetch(f'contest-effect/{id_or_name}', ContestEffect)
-
-    @cached_resource(endpoint='super-contest-effect')
-    async def get_super_contest_effect(self, id: Param) -> Optional[SuperContestEffect]:
-        return await self._fetch(f'super-contest-effect/{id}', SuperContestEffect)
-
-
-    """Encounters (Group)"""
-    @cached_resource(endpoint='encounter-method')
-    async def get_encounter_method(self, id_or_name: Param) -> Optional[EncounterMethod]:
-        return await self._fetch(f'encounter-method/{id_or_name}', EncounterMethod)
-
-    @cached_resource(endpoint='encounter-condition')
-    async def get_encounter_condition(self, id_or_name: Param) -> Optional[EncounterCondition]:
-        return await self._fetch(f'encounter-condition/{id_or_name}', EncounterCondition)
-
-    @cached_resource(endpoint='encounter-condition-value')
-    async def get_encounter_condition_value(self, id_or_name: Param) -> Optional[EncounterConditionValue]:
-        return await self._fetch(f'encounter-condition-value/{id_or_name}', EncounterConditionValue)
-
-
-    """Evolution (Group)"""
-    @cached_resource(endpoint='evolution-chain')
-    async def get_evolution_chain(self, id: Param) -> Optional[EvolutionChain]:
-        return await self._fetch(f'evolution-chain/{id}', EvolutionChain)
-
-    @cached_resource(endpoint='evolution-trigger')
-    async def get_evolution_trigger(self, id_or_name: Param) -> Optional[EvolutionTrigger]:
-        return await self._fetch(f'evolution-trigger/{id_or_name}', EvolutionTrigger)
-
-
-    """Games (Group)"""
-    @cached_resource(endpoint='generation')
-    async def get_generation(self, id_or_name: Param) -> Optional[Generation]:
-        return await self._fetch(f'generation/{id_or_name}', Generation)
-
-    @cached_resource(endpoint='pokedex')
-    async def get_pokedex(self, id_or_name: Param) -> Optional[Pokedex]:
-        return await self._fetch(f'pokedex/{id_or_name}', Pokedex)
-
-    @cached_resource(endpoint='version')
-    async def get_version(self, id_or_name: Param) -> Optional[Version]:
-        return await self._fetch(f'version/{id_or_name}', Version)
-
-    @cached_resource(endpoint='version-group')
-    async def get_version_group(self, id_or_name: Param) -> Optional[VersionGroup]:
-        return await self._fetch(f'version-group/{id_or_name}', VersionGroup)
-
-
-    """Items (Group)"""
-    @cached_resource(endpoint='item')
-    async def get_item(self, id_or_name: Param) -> Optional[Item]:
-        return await self._fetch(f'item/{id_or_name}', Item)
-
-    @cached_resource(endpoint='item-attribute')
-    async def get_item_attribute(self, id_or_name: Param) -> Optional[ItemAttribute]:
-        return await self._fetch(f'item-attribute/{id_or_name}', ItemAttribute)
-
-    @cached_resource(endpoint='item-category')
-    async def get_item_category(self, id_or_name: Param) -> Optional[ItemCategory]:
-        return await self._fetch(f'item-category/{id_or_name}', ItemCategory)
-
-    @cached_resource(endpoint='item-fling-effect')
-    async def get_item_fling_effect(self, id_or_name: Param) -> Optional[ItemFlingEffect]:
-        return await self._fetch(f'item-fling-effect/{id_or_name}', ItemFlingEffect)
-
-    @cached_resource(endpoint='item-pocket')
-    async def get_item_pocket(self, id_or_name: Param) -> Optional[ItemPocket]:
-        return await self._fetch(f'item-pocket/{id_or_name}', ItemPocket)
-
-
-    """Locations (Group)"""
-    @cached_resource(endpoint='location')
-    async def get_location(self, id_or_name: Param) -> Optional[Location]:
-        return await self._fetch(f'location/{id_or_name}', Location)
-
-    @cached_resource(endpoint='location-area')
-    async def get_location_area(self, id_or_name: Param) -> Optional[LocationArea]:
-        return await self._fetch(f'location-area/{id_or_name}', LocationArea)
-
-    @cached_resource(endpoint='pal-park-area')
-    async def get_pal_park_area(self, id_or_name: Param) -> Optional[PalParkArea]:
-        return await self._fetch(f'pal-park-area/{id_or_name}', PalParkArea)
-
-    @cached_resource(endpoint='region')
-    async def get_region(self, id_or_name: Param) -> Optional[Region]:
-        return await self._fetch(f'region/{id_or_name}', Region)
-
-
-    """Machines (Group)"""
-    @cached_resource(endpoint='machine')
-    async def get_machine(self, id: Param) -> Optional[Machine]:
-        return await self._fetch(f'machine/{id}', Machine)
-
-
-    """Moves (Group)"""
-    @cached_resource(endpoint='move')
-    async def get_move(self, id_or_name: Param) -> Optional[Move]:
-        return await self._fetch(f'move/{id_or_name}', Move)
-
-    @cached_resource(endpoint='move-ailment')
-    async def get_move_ailment(self, id_or_name: Param) -> Optional[MoveAilment]:
-        return await self._fetch(f'move-ailment/{id_or_name}', MoveAilment)
-
-    @cached_resource(endpoint='move-battle-style')
-    async def get_move_battle_style(self, id_or_name: Param) -> Optional[MoveBattleStyle]:
-        return await self._fetch(f'move-battle-style/{id_or_name}', MoveBattleStyle)
-
-    @cached_resource(endpoint='move-category')
-    async def get_move_category(self, id_or_name: Param) -> Optional[MoveCategory]:
-        return await self._fetch(f'move-category/{id_or_name}', MoveCategory)
-
-    @cached_resource(endpoint='move-damage-class')
-    async def get_move_damage_class(self, id_or_name: Param) -> Optional[MoveDamageClass]:
-        return await self._fetch(f'move-damage-class/{id_or_name}', MoveDamageClass)
-
-    @cached_resource(endpoint='move-learn-method')
-    async def get_move_learn_method(self, id_or_name: Param) -> Optional[MoveLearnMethod]:
-        return await self._fetch(f'move-learn-method/{id_or_name}', MoveLearnMethod)
-
-    @cached_resource(endpoint='move-target')
-    async def get_move_target(self, id_or_name: Param) -> Optional[MoveTarget]:
-        return await self._fetch(f'move-target/{id_or_name}', MoveTarget)
-
-
-    """Pokémon (Group)"""
-    @cached_resource(endpoint='ability')
-    async def get_ability(self, id_or_name: Param) -> Optional[Ability]:
-        return await self._fetch(f'ability/{id_or_name}', Ability)
-
-    @cached_resource(endpoint='characteristic')
-    async def get_characteristic(self, id_or_name: Param) -> Optional[Characteristic]:
-        return await self._fetch(f'characteristic/{id_or_name}', Characteristic)
-
-    @cached_resource(endpoint='egg-group')
-    async def get_egg_group(self, id_or_name: Param) -> Optional[EggGroup]:
-        return self._fetch(f'egg-group/{id_or_name}', EggGroup)
-
-    @cached_resource(endpoint='gender')
-    async def get_gender(self, id_or_name: Param) -> Optional[Gender]:
-        return self._fetch(f'gender/{id_or_name}', Gender)
-
-    @cached_resource(endpoint='growth-rate')
-    async def get_growth_rate(self, id_or_name: Param) -> Optional[GrowthRate]:
-        return self._fetch(f'growth-rate/{id_or_name}', GrowthRate)
-
-    @cached_resource(endpoint='nature')
-    async def get_nature(self, id_or_name: Param) -> Optional[Nature]:
-        return self._fetch(f'nature/{id_or_name}', Nature)
-
-    @cached_resource(endpoint='pokeathlon-stat')
-    async def get_pokeathlon_stat(self, id_or_name: Param) -> Optional[PokeathlonStat]:
-        return await self._fetch(f'pokeathlon-stat/{id_or_name}', PokeathlonStat)
-
-    @cached_resource(endpoint='pokemon')
-    async def get_pokemon(self, id_or_name: Param) -> Optional[Pokemon]:
-        return await self._fetch(f'pokemon/{id_or_name}', Pokemon)
-
-    @cached_resource(endpoint='pokemon-encounters')
-    async def get_pokemon_encounters(self, id_or_name: Param) -> list[LocationAreaEncounter]:
-        return (await self._fetch(f'pokemon/{id_or_name}/encounters', LocationAreaEncounter)) or []
-
-    @cached_resource(endpoint='pokemon-color')
-    async def get_pokemon_color(self, id_or_name: Param) -> Optional[PokemonColor]:
-        return await self._fetch(f'pokemon-color/{id_or_name}', PokemonColor)
-
-    @cached_resource(endpoint='pokemon-form')
-    async def get_pokemon_form(self, id_or_name: Param) -> Optional[PokemonForm]:
-        return await self._fetch(f'pokemon-form/{id_or_name}', PokemonForm)
-
-    @cached_resource(endpoint='pokemon-habitat')
-    async def get_pokemon_habitat(self, id_or_name: Param) -> Optional[PokemonHabitat]:
-        return await self._fetch(f'pokemon-habitat/{id_or_name}', PokemonHabitat)
-
-    @cached_resource(endpoint='pokemon-shape')
-    async def get_pokemon_shape(self, id_or_name: Param) -> Optional[PokemonShape]:
-        return await self._fetch(f'pokemon-shape/{id_or_name}')
-
-    @cached_resource(endpoint='pokemon-species')
-    async def get_pokemon_species(self, id_or_name: Param) -> Optional[PokemonSpecies]:
-        return await self._fetch(f'pokemon-species/{id_or_name}', PokemonSpecies)
-
-    @cached_resource(endpoint='stat')
-    async def get_stat(self, id_or_name: Param) -> Optional[Stat]:
-        return await self._fetch(f'stat/{id_or_name}', Stat)
-
-    @cached_resource(endpoint='type')
-    async def get_type(self, id_or_name: Param) -> Optional[PokemonTypePayload]:
-        return await self._fetch(f'type/{id_or_name}', PokemonTypePayload)
-
-
-    """Utility (Group)"""
-    @cached_resource(endpoint='language')
-    async def get_language(self, id_or_name: Param) -> Optional[Language]:
-        return await self._fetch(f'language/{id_or_name}', Language)
\ No newline at end of file
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present beastmatser
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+import asyncio
+import time
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterable,
+    Type,
+    TypeVar,
+    Union
+)
+import aiohttp
+
+import objects
+import objects.pokemon
+from objects import (
+    BaseObject,
+    NamedAPIResource,
+    NamedAPIResourceList,
+    Url
+)
+from cache import Cache, DiskCache, NegativeCache, cached_resource
+from decoder import Decoder, loads
+from executor import DecodeExecutor, load
+from pool import ConnectionPool
+from ratelimit import RateLimiter
+from retry import RetryPolicy, parse_retry_after
+import snapshot
+from transport import BASE_URL, HttpTransport, Transport
+
+if TYPE_CHECKING:
+    from objects import (
+        Berry,
+        BerryFirmness,
+        BerryFlavor,
+        ContestType,
+        ContestEffect,
+        SuperContestEffect,
+        EncounterMethod,
+        EncounterCondition,
+        EncounterConditionValue,
+        EvolutionChain,
+        EvolutionTrigger,
+        Generation,
+        Pokedex,
+        Version,
+        VersionGroup,
+        Item,
+        ItemAttribute,
+        ItemCategory,
+        ItemFlingEffect,
+        ItemPocket,
+        Location,
+        LocationArea,
+        PalParkArea,
+        Region,
+        Machine,
+        Move,
+        MoveAilment,
+        MoveBattleStyle,
+        MoveCategory,
+        MoveDamageClass,
+        MoveLearnMethod,
+        MoveTarget,
+        Language
+    )
+    from objects.pokemon import (
+        Ability,
+        Characteristic,
+        EggGroup,
+        Gender,
+        GrowthRate,
+        Nature,
+        PokeathlonStat,
+        Pokemon,
+        LocationAreaEncounter,
+        PokemonColor,
+        PokemonForm,
+        PokemonHabitat,
+        PokemonShape,
+        PokemonSpecies,
+        Stat
+    )
+    from objects.pokemon import Type as PokemonTypePayload
+
+Param = Union[str, int]
+JsonResponse = Union[list, dict[str, Any]]
+T = TypeVar('T', bound=BaseObject)
+Getter = Callable[[Param], Coroutine[Any, Any, Any]]
+
+
+def __getattr__(name: str) -> Any:
+    """The models are imported on first use, but are still reachable from this module."""
+
+    if name == 'PokemonTypePayload':
+        return objects.pokemon.Type
+
+    for package in (objects, objects.pokemon):
+        if name in package._models:
+            return getattr(package, name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+class HTTPException(Exception):
+    """Raised when a request keeps failing after all its retries
+
+    Attributes
+    ----------
+    endpoint: :class:`str`
+        the requested endpoint
+    status: :class:`Optional[int]`
+        the status of the last response, `None` if the connection failed or it is unknown
+    """
+
+    def __init__(self, endpoint: str, status: Optional[int], reason: Optional[str] = None) -> None:
+        self.endpoint: str = endpoint
+        self.status: Optional[int] = status
+        super().__init__(f'{endpoint}: {reason or ("connection failed" if status is None else status)}')
+
+
+class HttpClient:
+
+    def __init__(
+        self,
+        *,
+        session: Optional[aiohttp.ClientSession],
+        pool: Optional[ConnectionPool] = None,
+        transport: Optional[Transport] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        decoder: Optional[Decoder] = None
+    ) -> None:
+        self.transport: Transport = transport if transport is not None else HttpTransport(session=session, pool=pool)
+        self.inexistent_endpoints: NegativeCache = negative_cache if negative_cache is not None else NegativeCache()
+        self.retry: RetryPolicy = retry if retry is not None else RetryPolicy()
+        self.rate_limiter: RateLimiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.decoder: Decoder = decoder or loads
+        self.retries: int = 0
+
+    async def close(self) -> None:
+        await self.transport.close()
+
+    async def get(self, endpoint: str, *, raw: bool = False) -> Union[JsonResponse, bytes, None]:
+        """request an endpoint of Poke API, retrying transient failures
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            the endpoint, such as `pokemon/1`
+        raw: :class:`bool`
+            whether to return the body without parsing it
+
+        Returns
+        -------
+        :class:`Union[JsonResponse, bytes, None]`
+            the response, `None` if the endpoint does not exist
+
+        Raises
+        ------
+        :class:`HTTPException`
+            the request still failed after all its retries
+        """
+
+        if endpoint in self.inexistent_endpoints:
+            return None
+
+        attempt: int = 0
+        waited: float = 0.0
+
+        while True:
+            status: Optional[int] = None
+            retry_after: Optional[float] = None
+            error: Optional[Exception] = None
+
+            await self.rate_limiter.acquire()
+            started = time.monotonic()
+            throttled = cancelled = False
+
+            try:
+                response = await self.transport.request(endpoint)
+
+                if response.status == 200:
+                    return response.body if raw else self.decoder(response.body)
+
+                throttled = response.status == 429
+
+                if response.status == 404:
+                    self.inexistent_endpoints.add(endpoint)
+                    return None
+
+                if not self.retry.is_retryable(status := response.status):
+                    return None
+
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                throttled = isinstance(e, asyncio.TimeoutError)
+                error = e
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                if cancelled:
+                    self.rate_limiter.discard()
+                else:
+                    self.rate_limiter.release(time.monotonic() - started, throttled)
+
+            if (delay := self.retry.delay(attempt, waited, retry_after)) is None:
+                raise HTTPException(endpoint, status) from error
+
+            await asyncio.sleep(delay)
+            attempt += 1
+            waited += delay
+            self.retries += 1
+
+class Client:
+
+    http: HttpClient
+    _cache: Cache
+    _disk: Optional[DiskCache]
+
+    def __init__(
+        self,
+        *,
+        session: Optional[aiohttp.ClientSession] = None,
+        pool: Optional[ConnectionPool] = None,
+        transport: Optional[Transport] = None,
+        cache: Optional[Cache] = None,
+        disk_cache: Optional[Union[DiskCache, str]] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        decoder: Optional[Decoder] = None,
+        concurrency: int = 10,
+        lazy: bool = False,
+        intern: bool = False,
+        executor: Optional[DecodeExecutor] = None,
+    ) -> None:
+        self.http: HttpClient = HttpClient(
+            session=session,
+            pool=pool,
+            transport=transport,
+            negative_cache=negative_cache,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            decoder=decoder
+        )
+        self.concurrency: int = concurrency
+        self.lazy: bool = lazy
+        self.intern: bool = intern
+        self.executor: Optional[DecodeExecutor] = executor
+        self._cache: Cache = cache if cache is not None else Cache()
+        self._disk: Optional[DiskCache] = DiskCache(disk_cache) if isinstance(disk_cache, str) else disk_cache
+        Url.link(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        await self.http.close()
+
+        if self._disk is not None:
+            self._disk.close()
+
+    def save_cache(self, path: str, *, format: str = 'objects') -> int:
+        """write the resources of the cache into a snapshot file, see :func:`snapshot.save`
+
+        Parameters
+        ----------
+        path: :class:`str`
+            the path of the snapshot
+        format: :class:`str`
+            `objects` to pickle the models, the fastest to load,
+            or `json` to keep their JSON, which can be loaded after the models change
+
+        Returns
+        -------
+        :class:`int`
+            the number of resources written
+        """
+
+        return snapshot.save(path, self._cache, format=format)
+
+    def load_cache(self, path: str) -> int:
+        """put the resources of a snapshot file into the cache, so that they are served without requests
+
+        Parameters
+        ----------
+        path: :class:`str`
+            the path of a snapshot written by :meth:`save_cache`
+
+        Returns
+        -------
+        :class:`int`
+            the number of resources read
+
+        Raises
+        ------
+        ValueError
+            the file is not a valid snapshot
+        """
+
+        return snapshot.load(path, self._cache, lazy=self.lazy, intern=self.intern)
+
+    async def _fetch(
+        self,
+        url: str,
+        cls: Type[T],
+        fields: Optional[Iterable[str]] = None
+    ) -> Union[T, list[T], None]:
+        """fetch response from Poke API and change JSONResponse into each classes
+
+        The disk cache is looked up first if the client has one,
+        and the responses from Poke API are stored into it.
+        With an executor, the large responses are decoded in worker processes.
+
+        Parameters
+        ----------
+        url: :class:`str`
+            The API's endpoint url
+        cls: :class:`Type[T]`
+            class after changing
+        fields: :class:`Optional[Iterable[str]]`
+            the fields to keep, all if `None`
+
+        Returns
+        -------
+        :class:`T | list[T] | None`
+            the same type as argument `cls`
+        """
+
+        # with an executor the bodies are parsed along with the decoding
+        raw = self.executor is not None
+        data = await self._disk.get(url, raw=raw) if self._disk is not None else None
+
+        if data is None:
+            if (data := await self.http.get(url, raw=raw)) is None:
+                return None
+            if self._disk is not None:
+                await self._disk.put(url, data)
+
+        if raw:
+            return await self.executor.decode(cls, data, lazy=self.lazy, intern=self.intern, fields=fields)
+
+        return load(cls, data, lazy=self.lazy, intern=self.intern, fields=fields)
+
+    @cached_property
+    def _getters(self) -> dict[str, Getter]:
+        return {
+            method.endpoint: getattr(self, name)
+            for name, method in vars(Client).items()
+            if hasattr(method, 'endpoint')
+        }
+
+    async def iter_many(
+        self,
+        endpoint: str,
+        ids: Iterable[Param],
+        *,
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[tuple[Param, Any]]:
+        """fetch many resources of the same endpoint, yielding each one as soon as it is ready
+
+        Duplicated ids are fetched once, cached resources are yielded first
+        and the others are fetched concurrently.
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            The API's endpoint, such as `pokemon` or `move`
+        ids: :class:`Iterable[Param]`
+            ids or names of the resources
+        concurrency: :class:`Optional[int]`
+            the maximum number of requests at the same time, `Client.concurrency` if `None`
+
+        Yields
+        ------
+        :class:`tuple[Param, Any]`
+            the id or name and the resource, in completion order
+        """
+
+        if (getter := self._getters.get(endpoint)) is None:
+            raise ValueError(f'Unknown endpoint: {endpoint}')
+
+        misses: list[Param] = []
+
+        for id_or_name in {str(i): i for i in ids}.values():
+            if (key := f'{endpoint}/{id_or_name}') in self._cache:
+                yield id_or_name, self._cache.get(key)
+            else:
+                misses.append(id_or_name)
+
+        if concurrency is None:
+            concurrency = self.concurrency
+        elif concurrency < 1:
+            raise ValueError(f'concurrency must be at least 1, got {concurrency}')
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(id_or_name: Param) -> tuple[Param, Any]:
+            async with semaphore:
+                return id_or_name, await getter(id_or_name)
+
+        tasks = [asyncio.ensure_future(fetch(id_or_name)) for id_or_name in misses]
+
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_many(
+        self,
+        endpoint: str,
+        ids: Iterable[Param],
+        *,
+        concurrency: Optional[int] = None
+    ) -> list[Any]:
+        """fetch many resources of the same endpoint
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            The API's endpoint, such as `pokemon` or `move`
+        ids: :class:`Iterable[Param]`
+            ids or names of the resources
+        concurrency: :class:`Optional[int]`
+            the maximum number of requests at the same time, `Client.concurrency` if `None`
+
+        Returns
+        -------
+        :class:`list[Any]`
+            the resources in the same order as `ids`
+        """
+
+        ids = list(ids)
+        results = {
+            str(id_or_name): obj
+            async for id_or_name, obj in self.iter_many(endpoint, ids, concurrency=concurrency)
+        }
+        return [results[str(id_or_name)] for id_or_name in ids]
+
+    async def get_resource_list(
+        self,
+        endpoint: str,
+        *,
+        limit: int = 20,
+        offset: int = 0
+    ) -> Optional[NamedAPIResourceList]:
+        """fetch one page of the resources of an endpoint
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            The API's endpoint, such as `pokemon` or `move`
+        limit: :class:`int`
+            the number of resources in the page
+        offset: :class:`int`
+            the index of the first resource of the page
+
+        Returns
+        -------
+        :class:`Optional[NamedAPIResourceList]`
+            the page, `None` if the endpoint does not exist
+        """
+
+        return await self._fetch(f'{endpoint}?limit={limit}&offset={offset}', NamedAPIResourceList)
+
+    async def iter_resources(
+        self,
+        endpoint: str,
+        *,
+        page_size: int = 100,
+        resolve: bool = False,
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[Any]:
+        """iterate over all the resources of an endpoint
+
+        The next page is fetched while the current one is consumed.
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            The API's endpoint, such as `pokemon` or `move`
+        page_size: :class:`int`
+            the number of resources fetched per request
+        resolve: :class:`bool`
+            whether to fetch each resource instead of yielding its reference
+        concurrency: :class:`Optional[int]`
+            the maximum number of requests at the same time when `resolve` is `True`,
+            `Client.concurrency` if `None`
+
+        Yields
+        ------
+        :class:`NamedAPIResource | APIResource | Any`
+            the references, or the resources if `resolve` is `True`, in the API's order
+
+        Raises
+        ------
+        :class:`HTTPException`
+            a page after the first could not be fetched, the listing would be incomplete
+        """
+
+        offset = 0
+        page: Optional[asyncio.Future[Optional[NamedAPIResourceList]]] = asyncio.ensure_future(
+            self.get_resource_list(endpoint, limit=page_size, offset=offset)
+        )
+
+        try:
+            while page is not None:
+                if (resources := await page) is None:
+                    # only a missing first page means that the endpoint does not exist
+                    if offset == 0:
+                        return
+
+                    path = f'{endpoint}?limit={page_size}&offset={offset}'
+                    raise HTTPException(
+                        path,
+                        404 if path in self.http.inexistent_endpoints else None,
+                        'the page could not be fetched, the listing is incomplete'
+                    )
+
+                offset += page_size
+                page = asyncio.ensure_future(
+                    self.get_resource_list(endpoint, limit=page_size, offset=offset)
+                ) if resources.next is not None else None
+
+                if resolve:
+                    for obj in await self.get_many(
+                        endpoint,
+                        [resource._id for resource in resources.results],
+                        concurrency=concurrency
+                    ):
+                        yield obj
+                else:
+                    for resource in resources.results:
+                        yield resource
+        finally:
+            if page is not None:
+                page.cancel()
+
+
+    """Berries (Group)"""
+    @cached_resource(endpoint='berry')
+    async def get_berry(self, id_or_name: Param) -> Optional[Berry]:
+        return await self._fetch(f'berry/{id_or_name}', objects.Berry)
+
+    @cached_resource(endpoint='berry-firmness')
+    async def get_berry_firmness(self, id_or_name: Param) -> Optional[BerryFirmness]:
+        return await self._fetch(f'berry-firmness/{id_or_name}', objects.BerryFirmness)
+
+    @cached_resource(endpoint='berry-flavor')
+    async def get_berry_flavor(self, id_or_name: Param) -> Optional[BerryFlavor]:
+        return await self._fetch(f'berry-flavor/{id_or_name}', objects.BerryFlavor)
+
+
+    """Contests (Group)"""
+    @cached_resource(endpoint='contest-type')
+    async def get_contest_type(self, id_or_name: Param) -> Optional[ContestType]:
+        return await self._fetch(f'contest-type/{id_or_name}', objects.ContestType)
+
+    @cached_resource(endpoint='contest-effect')
+    async def get_contest_effect(self, id_or_name: Param) -> Optional[ContestEffect]:
+        return await self._fetch(f'contest-effect/{id_or_name}', objects.ContestEffect)
+
+    @cached_resource(endpoint='super-contest-effect')
+    async def get_super_contest_effect(self, id: Param) -> Optional[SuperContestEffect]:
+        return await self._fetch(f'super-contest-effect/{id}', objects.SuperContestEffect)
+
+
+    """Encounters (Group)"""
+    @cached_resource(endpoint='encounter-method')
+    async def get_encounter_method(self, id_or_name: Param) -> Optional[EncounterMethod]:
+        return await self._fetch(f'encounter-method/{id_or_name}', objects.EncounterMethod)
+
+    @cached_resource(endpoint='encounter-condition')
+    async def get_encounter_condition(self, id_or_name: Param) -> Optional[EncounterCondition]:
+        return await self._fetch(f'encounter-condition/{id_or_name}', objects.EncounterCondition)
+
+    @cached_resource(endpoint='encounter-condition-value')
+    async def get_encounter_condition_value(self, id_or_name: Param) -> Optional[EncounterConditionValue]:
+        return await self._fetch(f'encounter-condition-value/{id_or_name}', objects.EncounterConditionValue)
+
+
+    """Evolution (Group)"""
+    @cached_resource(endpoint='evolution-chain')
+    async def get_evolution_chain(self, id: Param) -> Optional[EvolutionChain]:
+        return await self._fetch(f'evolution-chain/{id}', objects.EvolutionChain)
+
+    @cached_resource(endpoint='evolution-trigger')
+    async def get_evolution_trigger(self, id_or_name: Param) -> Optional[EvolutionTrigger]:
+        return await self._fetch(f'evolution-trigger/{id_or_name}', objects.EvolutionTrigger)
+
+
+    """Games (Group)"""
+    @cached_resource(endpoint='generation')
+    async def get_generation(self, id_or_name: Param) -> Optional[Generation]:
+        return await self._fetch(f'generation/{id_or_name}', objects.Generation)
+
+    @cached_resource(endpoint='pokedex')
+    async def get_pokedex(self, id_or_name: Param) -> Optional[Pokedex]:
+        return await self._fetch(f'pokedex/{id_or_name}', objects.Pokedex)
+
+    @cached_resource(endpoint='version')
+    async def get_version(self, id_or_name: Param) -> Optional[Version]:
+        return await self._fetch(f'version/{id_or_name}', objects.Version)
+
+    @cached_resource(endpoint='version-group')
+    async def get_version_group(self, id_or_name: Param) -> Optional[VersionGroup]:
+        return await self._fetch(f'version-group/{id_or_name}', objects.VersionGroup)
+
+
+    """Items (Group)"""
+    @cached_resource(endpoint='item')
+    async def get_item(self, id_or_name: Param) -> Optional[Item]:
+        return await self._fetch(f'item/{id_or_name}', objects.Item)
+
+    @cached_resource(endpoint='item-attribute')
+    async def get_item_attribute(self, id_or_name: Param) -> Optional[ItemAttribute]:
+        return await self._fetch(f'item-attribute/{id_or_name}', objects.ItemAttribute)
+
+    @cached_resource(endpoint='item-category')
+    async def get_item_category(self, id_or_name: Param) -> Optional[ItemCategory]:
+        return await self._fetch(f'item-category/{id_or_name}', objects.ItemCategory)
+
+    @cached_resource(endpoint='item-fling-effect')
+    async def get_item_fling_effect(self, id_or_name: Param) -> Optional[ItemFlingEffect]:
+        return await self._fetch(f'item-fling-effect/{id_or_name}', objects.ItemFlingEffect)
+
+    @cached_resource(endpoint='item-pocket')
+    async def get_item_pocket(self, id_or_name: Param) -> Optional[ItemPocket]:
+        return await self._fetch(f'item-pocket/{id_or_name}', objects.ItemPocket)
+
+
+    """Locations (Group)"""
+    @cached_resource(endpoint='location')
+    async def get_location(self, id_or_name: Param) -> Optional[Location]:
+        return await self._fetch(f'location/{id_or_name}', objects.Location)
+
+    @cached_resource(endpoint='location-area')
+    async def get_location_area(self, id_or_name: Param) -> Optional[LocationArea]:
+        return await self._fetch(f'location-area/{id_or_name}', objects.LocationArea)
+
+    @cached_resource(endpoint='pal-park-area')
+    async def get_pal_park_area(self, id_or_name: Param) -> Optional[PalParkArea]:
+        return await self._fetch(f'pal-park-area/{id_or_name}', objects.PalParkArea)
+
+    @cached_resource(endpoint='region')
+    async def get_region(self, id_or_name: Param) -> Optional[Region]:
+        return await self._fetch(f'region/{id_or_name}', objects.Region)
+
+
+    """Machines (Group)"""
+    @cached_resource(endpoint='machine')
+    async def get_machine(self, id: Param) -> Optional[Machine]:
+        return await self._fetch(f'machine/{id}', objects.Machine)
+
+
+    """Moves (Group)"""
+    @cached_resource(endpoint='move', model=objects.Move)
+    async def get_move(
+        self,
+        id_or_name: Param,
+        *,
+        fields: Optional[Iterable[str]] = None
+    ) -> Optional[Move]:
+        return await self._fetch(f'move/{id_or_name}', objects.Move, fields)
+
+    @cached_resource(endpoint='move-ailment')
+    async def get_move_ailment(self, id_or_name: Param) -> Optional[MoveAilment]:
+        return await self._fetch(f'move-ailment/{id_or_name}', objects.MoveAilment)
+
+    @cached_resource(endpoint='move-battle-style')
+    async def get_move_battle_style(self, id_or_name: Param) -> Optional[MoveBattleStyle]:
+        return await self._fetch(f'move-battle-style/{id_or_name}', objects.MoveBattleStyle)
+
+    @cached_resource(endpoint='move-category')
+    async def get_move_category(self, id_or_name: Param) -> Optional[MoveCategory]:
+        return await self._fetch(f'move-category/{id_or_name}', objects.MoveCategory)
+
+    @cached_resource(endpoint='move-damage-class')
+    async def get_move_damage_class(self, id_or_name: Param) -> Optional[MoveDamageClass]:
+        return await self._fetch(f'move-damage-class/{id_or_name}', objects.MoveDamageClass)
+
+    @cached_resource(endpoint='move-learn-method')
+    async def get_move_learn_method(self, id_or_name: Param) -> Optional[MoveLearnMethod]:
+        return await self._fetch(f'move-learn-method/{id_or_name}', objects.MoveLearnMethod)
+
+    @cached_resource(endpoint='move-target')
+    async def get_move_target(self, id_or_name: Param) -> Optional[MoveTarget]:
+        return await self._fetch(f'move-target/{id_or_name}', objects.MoveTarget)
+
+
+    """Pokémon (Group)"""
+    @cached_resource(endpoint='ability')
+    async def get_ability(self, id_or_name: Param) -> Optional[Ability]:
+        return await self._fetch(f'ability/{id_or_name}', objects.pokemon.Ability)
+
+    @cached_resource(endpoint='characteristic')
+    async def get_characteristic(self, id_or_name: Param) -> Optional[Characteristic]:
+        return await self._fetch(f'characteristic/{id_or_name}', objects.pokemon.Characteristic)
+
+    @cached_resource(endpoint='egg-group')
+    async def get_egg_group(self, id_or_name: Param) -> Optional[EggGroup]:
+        return await self._fetch(f'egg-group/{id_or_name}', objects.pokemon.EggGroup)
+
+    @cached_resource(endpoint='gender')
+    async def get_gender(self, id_or_name: Param) -> Optional[Gender]:
+        return await self._fetch(f'gender/{id_or_name}', objects.pokemon.Gender)
+
+    @cached_resource(endpoint='growth-rate')
+    async def get_growth_rate(self, id_or_name: Param) -> Optional[GrowthRate]:
+        return await self._fetch(f'growth-rate/{id_or_name}', objects.pokemon.GrowthRate)
+
+    @cached_resource(endpoint='nature')
+    async def get_nature(self, id_or_name: Param) -> Optional[Nature]:
+        return await self._fetch(f'nature/{id_or_name}', objects.pokemon.Nature)
+
+    @cached_resource(endpoint='pokeathlon-stat')
+    async def get_pokeathlon_stat(self, id_or_name: Param) -> Optional[PokeathlonStat]:
+        return await self._fetch(f'pokeathlon-stat/{id_or_name}', objects.pokemon.PokeathlonStat)
+
+    @cached_resource(endpoint='pokemon', model=objects.pokemon.Pokemon)
+    async def get_pokemon(
+        self,
+        id_or_name: Param,
+        *,
+        fields: Optional[Iterable[str]] = None
+    ) -> Optional[Pokemon]:
+        return await self._fetch(f'pokemon/{id_or_name}', objects.pokemon.Pokemon, fields)
+
+    @cached_resource(endpoint='pokemon-encounters')
+    async def get_pokemon_encounters(self, id_or_name: Param) -> list[LocationAreaEncounter]:
+        return (await self._fetch(f'pokemon/{id_or_name}/encounters', objects.pokemon.LocationAreaEncounter)) or []
+
+    @cached_resource(endpoint='pokemon-color')
+    async def get_pokemon_color(self, id_or_name: Param) -> Optional[PokemonColor]:
+        return await self._fetch(f'pokemon-color/{id_or_name}', objects.pokemon.PokemonColor)
+
+    @cached_resource(endpoint='pokemon-form')
+    async def get_pokemon_form(self, id_or_name: Param) -> Optional[PokemonForm]:
+        return await self._fetch(f'pokemon-form/{id_or_name}', objects.pokemon.PokemonForm)
+
+    @cached_resource(endpoint='pokemon-habitat')
+    async def get_pokemon_habitat(self, id_or_name: Param) -> Optional[PokemonHabitat]:
+        return await self._fetch(f'pokemon-habitat/{id_or_name}', objects.pokemon.PokemonHabitat)
+
+    @cached_resource(endpoint='pokemon-shape')
+    async def get_pokemon_shape(self, id_or_name: Param) -> Optional[PokemonShape]:
+        return await self._fetch(f'pokemon-shape/{id_or_name}', objects.pokemon.PokemonShape)
+
+    @cached_resource(endpoint='pokemon-species', model=objects.pokemon.PokemonSpecies)
+    async def get_pokemon_species(
+        self,
+        id_or_name: Param,
+        *,
+        fields: Optional[Iterable[str]] = None
+    ) -> Optional[PokemonSpecies]:
+        return await self._fetch(f'pokemon-species/{id_or_name}', objects.pokemon.PokemonSpecies, fields)
+
+    @cached_resource(endpoint='stat')
+    async def get_stat(self, id_or_name: Param) -> Optional[Stat]:
+        return await self._fetch(f'stat/{id_or_name}', objects.pokemon.Stat)
+
+    @cached_resource(endpoint='type', model=objects.pokemon.Type)
+    async def get_type(
+        self,
+        id_or_name: Param,
+        *,
+        fields: Optional[Iterable[str]] = None
+    ) -> Optional[PokemonTypePayload]:
+        return await self._fetch(f'type/{id_or_name}', objects.pokemon.Type, fields)
+
+
+    """Batches"""
+    async def get_ability_many(self, ids: Iterable[Param]) -> list[Optional[Ability]]:
+        return await self.get_many('ability', ids)
+
+    async def get_item_many(self, ids: Iterable[Param]) -> list[Optional[Item]]:
+        return await self.get_many('item', ids)
+
+    async def get_move_many(self, ids: Iterable[Param]) -> list[Optional[Move]]:
+        return await self.get_many('move', ids)
+
+    async def get_pokemon_many(self, ids: Iterable[Param]) -> list[Optional[Pokemon]]:
+        return await self.get_many('pokemon', ids)
+
+    async def get_pokemon_species_many(self, ids: Iterable[Param]) -> list[Optional[PokemonSpecies]]:
+        return await self.get_many('pokemon-species', ids)
+
+    async def get_type_many(self, ids: Iterable[Param]) -> list[Optional[PokemonTypePayload]]:
+        return await self.get_many('type', ids)
+
+
+    """Listings"""
+    def iter_ability(self, **kwargs: Any) -> AsyncIterator[Union[NamedAPIResource[Ability], Ability]]:
+        return self.iter_resources('ability', **kwargs)
+
+    def iter_item(self, **kwargs: Any) -> AsyncIterator[Union[NamedAPIResource[Item], Item]]:
+        return self.iter_resources('item', **kwargs)
+
+    def iter_move(self, **kwargs: Any) -> AsyncIterator[Union[NamedAPIResource[Move], Move]]:
+        return self.iter_resources('move', **kwargs)
+
+    def iter_pokemon(self, **kwargs: Any) -> AsyncIterator[Union[NamedAPIResource[Pokemon], Pokemon]]:
+        return self.iter_resources('pokemon', **kwargs)
+
+    def iter_pokemon_species(self, **kwargs: Any) -> AsyncIterator[Union[NamedAPIResource[PokemonSpecies], PokemonSpecies]]:
+        return self.iter_resources('pokemon-species', **kwargs)
+
+    def iter_type(self, **kwargs: Any) -> AsyncIterator[Union[NamedAPIResource[PokemonTypePayload], PokemonTypePayload]]:
+        return self.iter_resources('type', **kwargs)
+
+
+    """Utility (Group)"""
+    @cached_resource(endpoint='language')
+    async def get_language(self, id_or_name: Param) -> Optional[Language]:
+        return await self._fetch(f'language/{id_or_name}', objects.Language)
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from benchmarks.payloads import load_payloads
+import decoder
+import objects
+import objects.pokemon
+from objects import BaseObject, interning, lazy_decoding, peek
+
+
+DESCRIPTION = """Microbenchmark of the `loads` methods of the models on recorded responses.
+
+    python -m benchmarks.decode <api-data directory or cassette> [--only pokemon,move] [--output decode.json]
+
+With `--lazy`, the large fields are kept as raw JSON (see `objects.common.lazy_decoding`).
+With `--intern`, identical small objects are shared (see `objects.common.interning`),
+the bytes retained then show the memory of a warm cache holding every resource.
+For each endpoint, reports the resources and the model objects (every nested `BaseObject`)
+decoded per second, the memory blocks allocated and the bytes retained per resource,
+and the peak memory while decoding.
+"""
+
+MODELS: dict[str, Callable[[Any], Any]] = {
+    'ability': objects.pokemon.Ability.loads,
+    'berry': objects.Berry.loads,
+    'berry-firmness': objects.BerryFirmness.loads,
+    'berry-flavor': objects.BerryFlavor.loads,
+    'characteristic': objects.pokemon.Characteristic.loads,
+    'contest-effect': objects.ContestEffect.loads,
+    'contest-type': objects.ContestType.loads,
+    'egg-group': objects.pokemon.EggGroup.loads,
+    'encounter-condition': objects.EncounterCondition.loads,
+    'encounter-condition-value': objects.EncounterConditionValue.loads,
+    'encounter-method': objects.EncounterMethod.loads,
+    'evolution-chain': objects.EvolutionChain.loads,
+    'evolution-trigger': objects.EvolutionTrigger.loads,
+    'gender': objects.pokemon.Gender.loads,
+    'generation': objects.Generation.loads,
+    'growth-rate': objects.pokemon.GrowthRate.loads,
+    'item': objects.Item.loads,
+    'item-attribute': objects.ItemAttribute.loads,
+    'item-category': objects.ItemCategory.loads,
+    'item-fling-effect': objects.ItemFlingEffect.loads,
+    'item-pocket': objects.ItemPocket.loads,
+    'language': objects.Language.loads,
+    'location': objects.Location.loads,
+    'location-area': objects.LocationArea.loads,
+    'machine': objects.Machine.loads,
+    'move': objects.Move.loads,
+    'move-ailment': objects.MoveAilment.loads,
+    'move-battle-style': objects.MoveBattleStyle.loads,
+    'move-category': objects.MoveCategory.loads,
+    'move-damage-class': objects.MoveDamageClass.loads,
+    'move-learn-method': objects.MoveLearnMethod.loads,
+    'move-target': objects.MoveTarget.loads,
+    'nature': objects.pokemon.Nature.loads,
+    'pal-park-area': objects.PalParkArea.loads,
+    'pokeathlon-stat': objects.pokemon.PokeathlonStat.loads,
+    'pokedex': objects.Pokedex.loads,
+    'pokemon': objects.pokemon.Pokemon.loads,
+    'pokemon-color': objects.pokemon.PokemonColor.loads,
+    'pokemon-encounters': objects.pokemon.LocationAreaEncounter.loads_list,
+    'pokemon-form': objects.pokemon.PokemonForm.loads,
+    'pokemon-habitat': objects.pokemon.PokemonHabitat.loads,
+    'pokemon-shape': objects.pokemon.PokemonShape.loads,
+    'pokemon-species': objects.pokemon.PokemonSpecies.loads,
+    'region': objects.Region.loads,
+    'stat': objects.pokemon.Stat.loads,
+    'super-contest-effect': objects.SuperContestEffect.loads,
+    'type': objects.pokemon.Type.loads,
+    'version': objects.Version.loads,
+    'version-group': objects.VersionGroup.loads,
+}
+
+
+def model_of(endpoint: str) -> Optional[str]:
+    """Returns the key of :data:`MODELS` decoding a response, such as `pokemon` for `pokemon/1`."""
+
+    parts = endpoint.split('?')[0].split('/')
+
+    if len(parts) == 3 and parts[0] == 'pokemon' and parts[2] == 'encounters':
+        return 'pokemon-encounters'
+    if len(parts) == 2 and parts[0] in MODELS:
+        return parts[0]
+    return None
+
+
+def count_objects(obj: Any) -> int:
+    """Counts the `BaseObject` reachable from `obj`, itself included.
+    :class:`Lazy` fields are not decoded and not counted."""
+
+    count = 0
+    stack = [obj]
+
+    while stack:
+        o = stack.pop()
+
+        if isinstance(o, list):
+            stack.extend(o)
+        elif isinstance(o, BaseObject):
+            count += 1
+            for cls in type(o).__mro__:
+                for attr in getattr(cls, '__slots__', ()):
+                    if isinstance(var := peek(o, attr), (list, BaseObject)):
+                        stack.append(var)
+            if hasattr(o, '__dict__'):
+                stack.extend(v for v in o.__dict__.values() if isinstance(v, (list, BaseObject)))
+
+    return count
+
+
+def measure(loads: Callable[[Any], Any], payloads: list[Any], repeat: int) -> dict[str, float]:
+    best = float('inf')
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for payload in payloads:
+            loads(payload)
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    decoded = [loads(payload) for payload in payloads]
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks
+
+    models = sum(map(count_objects, decoded))
+    n = len(payloads)
+
+    return {
+        'resources': n,
+        'models': models,
+        'seconds': best,
+        'resources_per_second': n / best,
+        'models_per_second': models / best,
+        'blocks_per_resource': blocks / n,
+        'bytes_per_resource': retained / n,
+        'peak_bytes': peak
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=DESCRIPTION, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('source', help='api-data directory or cassette')
+    parser.add_argument('--only', type=lambda s: s.split(','), default=None, help='endpoints to measure')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--lazy', action='store_true', help='keep the large fields as raw JSON')
+    parser.add_argument('--intern', action='store_true', help='share identical small objects')
+    parser.add_argument('--output', default=None, help='path of the JSON report')
+    args = parser.parse_args()
+
+    payloads: dict[str, list[Any]] = {}
+
+    for endpoint, body in load_payloads(args.source).items():
+        if (model := model_of(endpoint)) is not None and (args.only is None or model in args.only):
+            payloads.setdefault(model, []).append(decoder.loads(body))
+
+    results: dict[str, dict[str, float]] = {}
+    print(f'{"endpoint":<26} {"resources":>9} {"res/s":>10} {"models/s":>11} {"blocks/res":>11} {"KiB/res":>9}')
+
+    for model in sorted(payloads):
+        with lazy_decoding(args.lazy), interning(args.intern):
+            result = results[model] = measure(MODELS[model], payloads[model], args.repeat)
+        print(
+            f'{model:<26} {result["resources"]:>9} {result["resources_per_second"]:>10.0f} '
+            f'{result["models_per_second"]:>11.0f} {result["blocks_per_resource"]:>11.0f} '
+            f'{result["bytes_per_resource"] / 1024:>9.1f}'
+        )
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
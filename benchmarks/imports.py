@@ -0,0 +1,119 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Optional
+
+
+DESCRIPTION = """Measures the cold import time of the package.
+
+    python -m benchmarks.imports [--repeat 10] [--budget objects=30,api=150] [--output imports.json]
+
+Each statement runs in a fresh interpreter, which reports how long it took
+and how many modules of `objects` it loaded. The best time of `--repeat` runs is kept.
+The models are imported on first use (see `objects/__init__.py`),
+`all models` shows what every import used to cost.
+With `--budget`, the exit status is 1 if a statement is slower than its budget in milliseconds,
+so a job can guard the gain.
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS: dict[str, str] = {
+    'objects': 'import objects',
+    'objects.pokemon': 'import objects.pokemon',
+    'api': 'import api',
+    'one model': 'from objects.pokemon import Pokemon',
+    'all models': (
+        'import objects, objects.pokemon\n'
+        'for package in (objects, objects.pokemon):\n'
+        '    for name in package._models:\n'
+        '        getattr(package, name)'
+    ),
+}
+
+PROBE = """import sys, time
+started = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - started
+print(elapsed, sum(name.startswith('objects.') for name in sys.modules))
+"""
+
+
+def import_time(statement: str) -> tuple[float, int]:
+    """Runs `statement` in a new interpreter, returns its duration in seconds
+    and the number of submodules of `objects` loaded."""
+
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE.format(statement=statement)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    elapsed, modules = result.stdout.split()
+    return float(elapsed), int(modules)
+
+
+def parse_budget(value: str) -> dict[str, float]:
+    return {name: float(ms) for name, ms in (item.split('=') for item in value.split(','))}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=DESCRIPTION, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--budget', type=parse_budget, default={}, help='milliseconds allowed per statement')
+    parser.add_argument('--output', default=None, help='path of the JSON report')
+    args = parser.parse_args()
+
+    results: dict[str, dict[str, float]] = {}
+    over: list[str] = []
+    print(f'{"statement":<16} {"ms":>8} {"modules":>8} {"budget":>8}')
+
+    for name, statement in STATEMENTS.items():
+        runs = [import_time(statement) for _ in range(args.repeat)]
+        elapsed = min(elapsed for elapsed, _ in runs)
+        modules = runs[0][1]
+        budget: Optional[float] = args.budget.get(name)
+
+        results[name] = {'seconds': elapsed, 'modules': modules}
+        if budget is not None and elapsed * 1000 > budget:
+            over.append(name)
+
+        print(f'{name:<16} {elapsed * 1000:>8.1f} {modules:>8} {"-" if budget is None else f"{budget:.0f}":>8}')
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if over:
+        print(f'over budget: {", ".join(over)}', file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
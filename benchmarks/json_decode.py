@@ -0,0 +1,80 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import time
+from typing import Callable
+
+from benchmarks.payloads import load_payloads
+from decoder import DECODERS
+
+
+DESCRIPTION = """Compares the JSON decoders on recorded responses.
+
+    python -m benchmarks.json_decode <directory of responses> [--repeat N]
+
+`json (str)` is what `aiohttp.ClientResponse.json` does:
+decode the body into `str`, then parse it with the standard library.
+"""
+
+
+def measure(decode: Callable[[bytes], object], bodies: list[bytes], repeat: int) -> float:
+    """Returns the best time of `repeat` passes over all the bodies."""
+
+    best = float('inf')
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for body in bodies:
+            decode(body)
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=DESCRIPTION, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help='directory of recorded responses')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    bodies = list(load_payloads(args.path).values())
+    size = sum(map(len, bodies))
+
+    candidates: dict[str, Callable[[bytes], object]] = {
+        'json (str)': lambda body: json.loads(body.decode('utf-8')),
+        **DECODERS
+    }
+
+    print(f'{len(bodies)} responses, {size / 1024 ** 2:.1f} MiB')
+    baseline = None
+
+    for name, decode in candidates.items():
+        elapsed = measure(decode, bodies, args.repeat)
+        baseline = baseline or elapsed
+        print(f'{name:<12} {elapsed * 1000:9.1f} ms {size / elapsed / 1024 ** 2:9.1f} MiB/s {baseline / elapsed:6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,328 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import tempfile
+import time
+from typing import Any, Optional
+
+from api import Client
+from benchmarks.server import FakeServer, Faults, Latency, open_source
+from executor import DecodeExecutor
+from pool import ConnectionPool
+from transport import HttpTransport
+
+
+DESCRIPTION = """Load benchmark of `Client` against a local stand-in of pokeapi.co.
+
+    python -m benchmarks.load <api-data directory or cassette> \\
+        --concurrency 1,8,64,512 --cache cold,warm,disk-warm --mix pokemon=5,move=3,type=1 \\
+        --requests 2000 --output results.json
+
+Each run measures the throughput, the latency percentiles, the lag of the event loop
+and the peak RSS of the process during the run, sampled from `/proc` (where it is missing,
+the peak over the life of the process). The `cold` and `disk-warm` runs request each resource
+of the workload once, so that none is served by the memory cache. Use `--url` to target a server running in another process
+(`python -m benchmarks.server`) instead of the one started in this process.
+With `--offload BYTES`, the responses of at least BYTES are decoded in worker processes
+(see `executor.DecodeExecutor`) and each run also reports the decoding done on and off the loop.
+"""
+
+CACHE_STATES = ('cold', 'warm', 'disk-warm')
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """Parses `endpoint=weight,...`, such as `pokemon=5,move=3,type=1`."""
+
+    mix: dict[str, float] = {}
+
+    for item in spec.split(','):
+        endpoint, _, weight = item.partition('=')
+        mix[endpoint.strip()] = float(weight or 1)
+
+    return mix
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return {'p50': value, 'p95': value, 'p99': value, 'max': value}
+
+    q = statistics.quantiles(samples, n=100, method='inclusive')
+    return {'p50': q[49], 'p95': q[94], 'p99': q[98], 'max': max(samples)}
+
+
+def current_rss() -> Optional[int]:
+    """Returns the resident set size of the process in bytes, `None` without `/proc`."""
+
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return None
+
+
+def peak_rss() -> int:
+    """Returns the peak resident set size of the process in bytes, over its whole life."""
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if platform.system() == 'Darwin' else peak * 1024
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up a task sleeping `interval` seconds,
+    and samples the resident set size at the same time."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval: float = interval
+        self.samples: list[float] = []
+        self.start_rss: Optional[int] = current_rss()
+        self.peak_rss: Optional[int] = self.start_rss
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(time.perf_counter() - started - self.interval, 0.0))
+
+            if self.peak_rss is not None:
+                self.peak_rss = max(self.peak_rss, current_rss() or 0)
+
+    def start(self) -> None:
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> dict[str, float]:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        return percentiles(self.samples)
+
+
+async def list_ids(base_url: str, endpoints: list[str]) -> dict[str, list[str]]:
+    async with Client(transport=HttpTransport(base_url=base_url)) as client:
+        ids: dict[str, list[str]] = {}
+
+        for endpoint in endpoints:
+            if (resources := await client.get_resource_list(endpoint, limit=100_000)) is None:
+                raise ValueError(f'{endpoint} is not served')
+            ids[endpoint] = [resource._id for resource in resources.results]
+
+        return ids
+
+
+def workload(
+    ids: dict[str, list[str]],
+    mix: dict[str, float],
+    requests: int,
+    seed: int
+) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    endpoints = rng.choices(list(mix), weights=list(mix.values()), k=requests)
+    return [(endpoint, rng.choice(ids[endpoint])) for endpoint in endpoints]
+
+
+async def drive(client: Client, requests: list[tuple[str, str]], concurrency: int) -> dict[str, Any]:
+    queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+    for request in requests:
+        queue.put_nowait(request)
+
+    latencies: list[float] = []
+    errors: int = 0
+
+    async def worker() -> None:
+        nonlocal errors
+
+        while not queue.empty():
+            endpoint, id = queue.get_nowait()
+            started = time.perf_counter()
+
+            try:
+                await client._getters[endpoint](id)
+            except Exception:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - started)
+
+    monitor = LoopLagMonitor()
+    monitor.start()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    loop_lag = await monitor.stop()
+
+    return {
+        'requests': len(requests),
+        'errors': errors,
+        'elapsed': elapsed,
+        'throughput': len(latencies) / elapsed,
+        'latency': percentiles(latencies),
+        'loop_lag': loop_lag,
+        # sampled during the run, the peak of the whole process where `/proc` is missing
+        'peak_rss': monitor.peak_rss if monitor.peak_rss is not None else peak_rss(),
+        'rss_growth': monitor.peak_rss - monitor.start_rss if monitor.peak_rss is not None else None
+    }
+
+
+async def run(
+    base_url: str,
+    requests: list[tuple[str, str]],
+    concurrency: int,
+    cache: str,
+    limit: int,
+    offload: Optional[int] = None
+) -> dict[str, Any]:
+    executor = DecodeExecutor(threshold=offload) if offload is not None else None
+    # a given pool is not closed by its transport
+    pools: list[ConnectionPool] = []
+
+    def make_client(disk_cache: Optional[str] = None) -> Client:
+        pools.append(pool := ConnectionPool(limit=limit))
+        return Client(
+            transport=HttpTransport(pool=pool, base_url=base_url),
+            disk_cache=disk_cache,
+            concurrency=concurrency,
+            executor=executor
+        )
+
+    if cache != 'warm':
+        # each resource once, the repeated ones would be served by the memory cache of the run
+        requests = list(dict.fromkeys(requests))
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            disk_cache = os.path.join(directory, 'cache.sqlite') if cache == 'disk-warm' else None
+
+            if cache == 'disk-warm':
+                async with make_client(disk_cache) as client:
+                    await drive(client, requests, concurrency)
+
+            async with make_client(disk_cache) as client:
+                if cache == 'warm':
+                    await drive(client, requests, concurrency)
+
+                if executor is not None:
+                    executor.max_block = 0.0
+                before = executor.stats() if executor is not None else {}
+                result = await drive(client, requests, concurrency)
+
+                if executor is not None:
+                    result['decode'] = {key: value - before[key] for key, value in executor.stats().items()}
+
+                return result
+    finally:
+        for pool in pools:
+            await pool.close()
+
+        if executor is not None:
+            executor.close()
+
+
+async def main_async(args: argparse.Namespace) -> list[dict[str, Any]]:
+    server: Optional[FakeServer] = None
+    base_url: str = args.url
+
+    if base_url is None:
+        server = FakeServer(open_source(args.source), Faults(latency=args.latency, seed=args.seed))
+        base_url = await server.start()
+
+    try:
+        ids = await list_ids(base_url, list(args.mix))
+        requests = workload(ids, args.mix, args.requests, args.seed)
+        results: list[dict[str, Any]] = []
+
+        for cache in args.cache:
+            for concurrency in args.concurrency:
+                result = await run(base_url, requests, concurrency, cache, args.connections, args.offload)
+                result.update(cache=cache, concurrency=concurrency)
+                results.append(result)
+                print(
+                    f'{cache:<9} c={concurrency:<4} {result["throughput"]:9.1f} req/s '
+                    f'p50={result["latency"]["p50"] * 1000:7.2f}ms '
+                    f'p95={result["latency"]["p95"] * 1000:7.2f}ms '
+                    f'p99={result["latency"]["p99"] * 1000:7.2f}ms '
+                    f'lag p99={result["loop_lag"]["p99"] * 1000:6.2f}ms '
+                    f'rss={result["peak_rss"] / 1024 ** 2:7.1f}MiB '
+                    f'errors={result["errors"]}'
+                )
+                if (decode := result.get('decode')) is not None:
+                    print(
+                        f'{"":<16} offloaded={decode["offloaded"]:<6} '
+                        f'saved={decode["saved_seconds"] * 1000:8.1f}ms '
+                        f'inline={decode["inline_seconds"] * 1000:8.1f}ms '
+                        f'max block={decode["max_block"] * 1000:6.2f}ms'
+                    )
+
+        return results
+    finally:
+        if server is not None:
+            await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=DESCRIPTION, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('source', nargs='?', help='api-data directory or cassette served by the in-process server')
+    parser.add_argument('--url', default=None, help='base URL of an external server, such as http://127.0.0.1:8080/api/v2')
+    parser.add_argument('--concurrency', type=lambda s: [int(c) for c in s.split(',')], default=[1, 2, 4, 8, 16, 32, 64, 128, 256, 512])
+    parser.add_argument('--cache', type=lambda s: s.split(','), default=list(CACHE_STATES))
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('pokemon=5,pokemon-species=3,move=3,type=1,ability=1'))
+    parser.add_argument('--requests', type=int, default=2000, help='requests per run')
+    parser.add_argument('--connections', type=int, default=100, help='connection pool limit')
+    parser.add_argument('--latency', type=Latency.parse, default=Latency('constant', (0.02,)), help='latency of the in-process server')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--offload', type=int, default=None, help='decode the responses of at least this many bytes in processes')
+    parser.add_argument('--output', default=None, help='path of the JSON report')
+    args = parser.parse_args()
+
+    if args.url is None and args.source is None:
+        parser.error('either source or --url is required')
+    if unknown := set(args.cache) - set(CACHE_STATES):
+        parser.error(f'unknown cache states: {", ".join(unknown)}')
+
+    results = asyncio.run(main_async(args))
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'mix': args.mix,
+                'requests': args.requests,
+                'results': results
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
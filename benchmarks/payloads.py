@@ -0,0 +1,77 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import os
+
+import cassette
+
+
+def endpoint_of(path: str) -> str:
+    """Converts a path of the static PokeAPI dump, such as `api/v2/pokemon/1/index.json`,
+    into an endpoint such as `pokemon/1`."""
+
+    parts = [part for part in path.replace(os.sep, '/').split('/') if part]
+
+    if parts and parts[-1].endswith('.json'):
+        name = parts.pop()[:-len('.json')]
+        if name != 'index':
+            parts.append(name)
+
+    if parts[:2] == ['api', 'v2']:
+        parts = parts[2:]
+
+    return '/'.join(parts)
+
+
+def load_payloads(path: str) -> dict[str, bytes]:
+    """Loads recorded responses.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        a cassette recorded by :class:`cassette.RecordingTransport`,
+        or a directory whose `*.json` files are responses, such as a checkout of the static PokeAPI dump
+        (`api/v2/<endpoint>/<id>/index.json`)
+
+    Returns
+    -------
+    :class:`dict[str, bytes]`
+        the raw responses by endpoint, such as `pokemon/1`
+    """
+
+    if os.path.isfile(path):
+        return {
+            record.endpoint: record.response.body
+            for record in cassette.load(path) if record.response.status == 200
+        }
+
+    payloads: dict[str, bytes] = {}
+
+    for root, _, files in os.walk(path):
+        for file in files:
+            if file.endswith('.json'):
+                with open(full := os.path.join(root, file), 'rb') as f:
+                    payloads[endpoint_of(os.path.relpath(full, path))] = f.read()
+
+    return payloads
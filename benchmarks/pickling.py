@@ -0,0 +1,128 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import argparse
+import json
+import pickle
+import time
+from typing import Any, Callable
+
+from benchmarks.decode import MODELS, model_of
+from benchmarks.payloads import load_payloads
+import decoder
+from objects import lazy_decoding
+
+
+DESCRIPTION = """Benchmark of pickling the decoded models, as the worker processes and the `objects` snapshots do.
+The disk cache is not involved, it stores the raw JSON of the responses.
+
+    python -m benchmarks.pickling <api-data directory or cassette> [--only pokemon,move] [--output pickling.json]
+
+With `--lazy`, the large fields are pickled as raw JSON (see `objects.common.lazy_decoding`).
+For each endpoint, reports the pickled bytes per resource and the resources pickled and
+unpickled per second, next to the same numbers for the raw JSON as a baseline,
+and checks that every unpickled object has the same `to_dict` as the original.
+"""
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+def measure(values: list[Any], repeat: int, protocol: int) -> dict[str, float]:
+    pickled = [pickle.dumps(value, protocol) for value in values]
+    dumps = best_of(lambda: [pickle.dumps(value, protocol) for value in values], repeat)
+    loads = best_of(lambda: list(map(pickle.loads, pickled)), repeat)
+    n = len(values)
+
+    return {
+        'bytes_per_resource': sum(map(len, pickled)) / n,
+        'dumps_per_second': n / dumps,
+        'loads_per_second': n / loads
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=DESCRIPTION, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('source', help='api-data directory or cassette')
+    parser.add_argument('--only', type=lambda s: s.split(','), default=None, help='endpoints to measure')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--protocol', type=int, default=pickle.HIGHEST_PROTOCOL)
+    parser.add_argument('--lazy', action='store_true', help='keep the large fields as raw JSON')
+    parser.add_argument('--output', default=None, help='path of the JSON report')
+    args = parser.parse_args()
+
+    payloads: dict[str, list[Any]] = {}
+
+    for endpoint, body in load_payloads(args.source).items():
+        if (model := model_of(endpoint)) is not None and (args.only is None or model in args.only):
+            payloads.setdefault(model, []).append(decoder.loads(body))
+
+    results: dict[str, dict[str, Any]] = {}
+    print(
+        f'{"endpoint":<26} {"resources":>9} {"KiB/res":>9} {"dumps/s":>9} {"loads/s":>9} '
+        f'{"json KiB":>9} {"dumps/s":>9} {"loads/s":>9}'
+    )
+
+    for model in sorted(payloads):
+        with lazy_decoding(args.lazy):
+            decoded = list(map(MODELS[model], payloads[model]))
+
+        result = results[model] = {
+            'resources': len(decoded),
+            'objects': measure(decoded, args.repeat, args.protocol),
+            'json': measure(payloads[model], args.repeat, args.protocol)
+        }
+
+        # after measuring, as `to_dict` decodes the lazy fields
+        for obj in decoded:
+            copy = pickle.loads(pickle.dumps(obj, args.protocol))
+            if _to_dict(copy) != _to_dict(obj):
+                raise AssertionError(f'{model}: the unpickled object differs from the original')
+
+        objects, raw = result['objects'], result['json']
+        print(
+            f'{model:<26} {result["resources"]:>9} {objects["bytes_per_resource"] / 1024:>9.1f} '
+            f'{objects["dumps_per_second"]:>9.0f} {objects["loads_per_second"]:>9.0f} '
+            f'{raw["bytes_per_resource"] / 1024:>9.1f} {raw["dumps_per_second"]:>9.0f} {raw["loads_per_second"]:>9.0f}'
+        )
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+def _to_dict(value: Any) -> Any:
+    return [_to_dict(v) for v in value] if isinstance(value, list) else value.to_dict()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,288 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import argparse
+import asyncio
+import math
+import os
+import random
+import socket
+import struct
+from collections import Counter
+from typing import Optional
+
+from aiohttp import web
+
+from cassette import ReplayTransport
+from transport import FileSystemTransport, Transport
+
+
+DESCRIPTION = """Stand-in for pokeapi.co serving recorded data, with injected latency and failures.
+
+    python -m benchmarks.server <api-data directory or cassette> --port 8080 \\
+        --latency lognormal:0.03,0.6 --not-found 0.01 --throttle 0.02 --server-error 0.01 --reset 0.001
+
+Point a client at it with `Client(transport=HttpTransport(base_url='http://127.0.0.1:8080/api/v2'))`.
+The counters of the served responses are available at `/__stats__`.
+"""
+
+
+class Latency:
+    """Distribution of the latency added to every response.
+
+    Parameters
+    ----------
+    kind: :class:`str`
+        `constant` (seconds), `uniform` (low, high), `exponential` (mean)
+        or `lognormal` (median, sigma)
+    params: :class:`tuple[float, ...]`
+        the parameters of the distribution
+    """
+
+    def __init__(self, kind: str = 'constant', params: tuple[float, ...] = (0.0,)) -> None:
+        if kind not in ('constant', 'uniform', 'exponential', 'lognormal'):
+            raise ValueError(f'Unknown distribution: {kind}')
+
+        self.kind: str = kind
+        self.params: tuple[float, ...] = params
+
+    @classmethod
+    def parse(cls, spec: str) -> Latency:
+        """Parses `kind:param,param`, such as `lognormal:0.03,0.6`."""
+
+        kind, _, params = spec.partition(':')
+        return cls(kind, tuple(map(float, params.split(','))) if params else (0.0,))
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == 'uniform':
+            return rng.uniform(*self.params)
+        if self.kind == 'exponential':
+            return rng.expovariate(1 / self.params[0]) if self.params[0] > 0 else 0.0
+        if self.kind == 'lognormal':
+            return rng.lognormvariate(math.log(self.params[0]), self.params[1])
+        return self.params[0]
+
+
+class Faults:
+    """What :class:`FakeServer` injects into its responses.
+
+    The rates are probabilities per request and are checked in the order of the parameters.
+
+    Parameters
+    ----------
+    latency: :class:`Latency`
+        the latency added before answering
+    reset: :class:`float`
+        the rate of connections reset without any response
+    not_found: :class:`float`
+        the rate of `404`
+    throttle: :class:`float`
+        the rate of `429`, with a `Retry-After` of `retry_after` seconds
+    server_error: :class:`float`
+        the rate of `500`, `502` or `503`
+    bandwidth: :class:`Optional[int]`
+        the maximum bytes per second of each response, unlimited if `None`
+    retry_after: :class:`int`
+        the `Retry-After` of the `429`
+    seed: :class:`Optional[int]`
+        the seed of the random generator, for reproducible runs
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: Optional[Latency] = None,
+        reset: float = 0.0,
+        not_found: float = 0.0,
+        throttle: float = 0.0,
+        server_error: float = 0.0,
+        bandwidth: Optional[int] = None,
+        retry_after: int = 1,
+        seed: Optional[int] = None
+    ) -> None:
+        self.latency: Latency = latency if latency is not None else Latency()
+        self.reset: float = reset
+        self.not_found: float = not_found
+        self.throttle: float = throttle
+        self.server_error: float = server_error
+        self.bandwidth: Optional[int] = bandwidth
+        self.retry_after: int = retry_after
+        self.rng: random.Random = random.Random(seed)
+
+
+class FakeServer:
+    """aiohttp application serving the responses of a transport under `/api/v2/`.
+
+    Parameters
+    ----------
+    source: :class:`Transport`
+        where the responses come from, such as :class:`FileSystemTransport` or :class:`ReplayTransport`
+    faults: :class:`Optional[Faults]`
+        the injected latency and failures, none if `None`
+    """
+
+    CHUNK_SIZE: int = 16 * 1024
+
+    def __init__(self, source: Transport, faults: Optional[Faults] = None) -> None:
+        self.source: Transport = source
+        self.faults: Faults = faults if faults is not None else Faults()
+        self.stats: Counter[str] = Counter()
+        self.app: web.Application = web.Application()
+        self.app.router.add_get('/__stats__', self.handle_stats)
+        self.app.router.add_get('/api/v2/{path:.*}', self.handle)
+        self._runner: Optional[web.AppRunner] = None
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats)
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        faults = self.faults
+        rng = faults.rng
+        self.stats['requests'] += 1
+
+        if (delay := faults.latency.sample(rng)) > 0:
+            await asyncio.sleep(delay)
+
+        roll = rng.random()
+
+        if roll < (threshold := faults.reset):
+            self.stats['reset'] += 1
+            self._reset(request)
+            # nothing can be written on the aborted connection, aiohttp drops
+            # a cancelled handler quietly as when the client disconnects
+            raise asyncio.CancelledError
+
+        if roll < (threshold := threshold + faults.not_found):
+            self.stats['404'] += 1
+            return web.Response(status=404, text='Not Found')
+
+        if roll < (threshold := threshold + faults.throttle):
+            self.stats['429'] += 1
+            return web.Response(status=429, headers={'Retry-After': str(faults.retry_after)})
+
+        if roll < threshold + faults.server_error:
+            status = rng.choice((500, 502, 503))
+            self.stats[str(status)] += 1
+            return web.Response(status=status)
+
+        endpoint = request.match_info['path'].strip('/')
+        if request.query_string:
+            endpoint = f'{endpoint}?{request.query_string}'
+
+        response = await self.source.request(endpoint)
+        self.stats[str(response.status)] += 1
+
+        if response.status != 200:
+            return web.Response(status=response.status)
+
+        if faults.bandwidth is None:
+            return web.Response(body=response.body, content_type='application/json')
+
+        return await self._throttled(request, response.body, faults.bandwidth)
+
+    async def _throttled(self, request: web.Request, body: bytes, bandwidth: int) -> web.StreamResponse:
+        stream = web.StreamResponse(headers={'Content-Type': 'application/json'})
+        stream.content_length = len(body)
+        await stream.prepare(request)
+
+        for i in range(0, len(body), self.CHUNK_SIZE):
+            chunk = body[i:i + self.CHUNK_SIZE]
+            await stream.write(chunk)
+            await asyncio.sleep(len(chunk) / bandwidth)
+
+        await stream.write_eof()
+        return stream
+
+    @staticmethod
+    def _reset(request: web.Request) -> None:
+        """Closes the connection with a TCP RST."""
+
+        if (transport := request.transport) is None:
+            return
+
+        if (sock := transport.get_extra_info('socket')) is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+
+        transport.abort()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """Starts serving in the running event loop.
+
+        Returns
+        -------
+        :class:`str`
+            the base URL to give to :class:`HttpTransport`, such as `http://127.0.0.1:8080/api/v2`
+        """
+
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        return f'http://{host}:{port}/api/v2'
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+        await self.source.close()
+
+
+def open_source(path: str) -> Transport:
+    """Opens recorded data: a cassette file or a directory of the static dump."""
+
+    return ReplayTransport(path) if os.path.isfile(path) else FileSystemTransport(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=DESCRIPTION, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('source', help='api-data directory or cassette')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=Latency.parse, default=Latency(), help='such as constant:0.02, uniform:0.01,0.05, exponential:0.02 or lognormal:0.03,0.6')
+    parser.add_argument('--reset', type=float, default=0.0, help='rate of connection resets')
+    parser.add_argument('--not-found', type=float, default=0.0, help='rate of 404')
+    parser.add_argument('--throttle', type=float, default=0.0, help='rate of 429')
+    parser.add_argument('--server-error', type=float, default=0.0, help='rate of 5xx')
+    parser.add_argument('--bandwidth', type=int, default=None, help='bytes per second of each response')
+    parser.add_argument('--retry-after', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    server = FakeServer(open_source(args.source), Faults(
+        latency=args.latency,
+        reset=args.reset,
+        not_found=args.not_found,
+        throttle=args.throttle,
+        server_error=args.server_error,
+        bandwidth=args.bandwidth,
+        retry_after=args.retry_after,
+        seed=args.seed
+    ))
+    web.run_app(server.app, host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == '__main__':
+    main()
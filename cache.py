@@ -1,68 +1,486 @@
-"""
-The MIT License (MIT)
-
-Copyright (c) 2021-present beastmatser
-Copyright (c) 2023-present Yumax-panda
-
-Permission is hereby granted, free of charge, to any person obtaining a
-copy of this software and associated documentation files (the "Software"),
-to deal in the Software without restriction, including without limitation
-the rights to use, copy, modify, merge, publish, distribute, sublicense,
-and/or sell copies of the Software, and to permit persons to whom the
-Software is furnished to do so, subject to the following conditions:
-The above copyright notice and this permission notice shall be included in
-all copies or substantial portions of the Software.
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
-OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
-FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
-DEALINGS IN THE SOFTWARE.
-"""
-
-from __future__ import annotations
-from typing import (
-    Any,
-    Callable,
-    Coroutine,
-    TYPE_CHECKING,
-    TypeVar,
-    Union
-)
-U = TypeVar('U')
-Param = Union[str, int]
-
-if TYPE_CHECKING:
-    from api import Client
-
-
-class Cache:
-
-    cache: dict[str, Any] = {}
-
-    def get(self, key: Union[str, int]) -> Any:
-        return self.cache.get(str(key))
-
-    def put(self, key: Union[str, int], value: Any) -> None:
-        self.cache[str(key)] = value
-
-    def __str__(self) -> str:
-        return str(self.cache)
-
-
-def cached_resource(endpoint: str) -> Callable[['Client', Param], Coroutine[Any, Any, U]]:
-
-    def decorator(coroutine: Callable[['Client', Param], Coroutine[Any, Any, U]]):
-
-        async def wrapper(client: Client, id_or_name: Param) -> U:
-
-            if (url := f'{endpoint}/{id_or_name}') in client._cache.cache.keys():
-                return client._cache.get(url)
-
-            obj: U = await coroutine(client, id_or_name)
-            client._cache.put(url, obj)
-            return obj
-        return wrapper
-
-    return decorator
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present beastmatser
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+import asyncio
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Final,
+    Iterable,
+    Optional,
+    TYPE_CHECKING,
+    Type,
+    TypeVar,
+    Union
+)
+from objects.common import BaseObject, Lazy, peek
+import decoder
+U = TypeVar('U')
+Param = Union[str, int]
+JsonResponse = Union[list, dict[str, Any]]
+
+if TYPE_CHECKING:
+    from api import Client
+
+
+PERMANENT_ENDPOINTS: Final[frozenset[str]] = frozenset({
+    'berry-firmness',
+    'berry-flavor',
+    'contest-type',
+    'egg-group',
+    'encounter-method',
+    'evolution-trigger',
+    'gender',
+    'generation',
+    'growth-rate',
+    'language',
+    'move-ailment',
+    'move-battle-style',
+    'move-category',
+    'move-damage-class',
+    'move-learn-method',
+    'move-target',
+    'nature',
+    'pokeathlon-stat',
+    'pokemon-color',
+    'pokemon-habitat',
+    'pokemon-shape',
+    'region',
+    'stat',
+    'type',
+    'version',
+    'version-group',
+})
+
+
+def sizeof(obj: Any) -> int:
+    """Approximates the memory used by an object graph.
+
+    Parameters
+    ----------
+    obj: :class:`Any`
+        the object to measure
+
+    Returns
+    -------
+    :class:`int`
+        the sum of `sys.getsizeof` over every object reachable from `obj`,
+        counting shared objects once
+    """
+
+    size = 0
+    seen: set[int] = set()
+    stack: list[Any] = [obj]
+
+    while stack:
+        o = stack.pop()
+
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        size += sys.getsizeof(o)
+
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif isinstance(o, Lazy):
+            stack.append(o.data)
+        elif isinstance(o, BaseObject):
+            for cls in type(o).__mro__:
+                for attr in getattr(cls, '__slots__', ()):
+                    if attr != '__weakref__' and (var := peek(o, attr)) is not None:
+                        stack.append(var)
+            if hasattr(o, '__dict__'):
+                stack.append(o.__dict__)
+
+    return size
+
+
+class Cache:
+    """In-memory cache of resources with LRU eviction and per-endpoint TTLs.
+
+    Keys have the form `endpoint/id`. Resources of :data:`PERMANENT_ENDPOINTS`
+    never expire and are never evicted, they are small and do not change.
+
+    Parameters
+    ----------
+    max_entries: :class:`Optional[int]`
+        the maximum number of evictable entries, unlimited if `None`
+    max_bytes: :class:`Optional[int]`
+        the approximate maximum size of evictable entries, unlimited if `None`
+    ttl: :class:`Optional[float]`
+        the default lifetime of an entry in seconds, forever if `None`
+    ttls: :class:`Optional[dict[str, Optional[float]]]`
+        lifetimes overriding `ttl` for the given endpoints
+    permanent: :class:`Optional[frozenset[str]]`
+        endpoints which are never expired nor evicted,
+        :data:`PERMANENT_ENDPOINTS` if `None`
+    projections: :class:`bool`
+        whether to cache the resources fetched with `fields`,
+        under their own key such as `pokemon/1?fields=stats,types`
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        ttls: Optional[dict[str, Optional[float]]] = None,
+        permanent: Optional[frozenset[str]] = None,
+        projections: bool = False
+    ) -> None:
+        self.max_entries: Optional[int] = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.ttl: Optional[float] = ttl
+        self.ttls: dict[str, Optional[float]] = ttls or {}
+        self.permanent: frozenset[str] = PERMANENT_ENDPOINTS if permanent is None else permanent
+        self.projections: bool = projections
+
+        self.cache: OrderedDict[str, Any] = OrderedDict()
+        self.pinned: dict[str, Any] = {}
+        self.inflight: dict[str, asyncio.Future[Any]] = {}
+        self.size: int = 0
+        self.evictions: int = 0
+        self._expires: dict[str, float] = {}
+        self._sizes: dict[str, int] = {}
+
+    @staticmethod
+    def _endpoint(key: str) -> str:
+        return key.split('/', 1)[0]
+
+    def _expired(self, key: str) -> bool:
+        return (expires := self._expires.get(key)) is not None and expires <= time.monotonic()
+
+    def get(self, key: Union[str, int], default: Any = None) -> Any:
+        key = str(key)
+
+        if key in self.pinned:
+            return self.pinned[key]
+
+        if key not in self.cache:
+            return default
+
+        if self._expired(key):
+            self.remove(key)
+            return default
+
+        self.cache.move_to_end(key)
+        return self.cache[key]
+
+    def put(self, key: Union[str, int], value: Any) -> None:
+        key = str(key)
+        self.remove(key)
+
+        if (endpoint := self._endpoint(key)) in self.permanent:
+            self.pinned[key] = value
+            return
+
+        self.cache[key] = value
+
+        if (ttl := self.ttls.get(endpoint, self.ttl)) is not None:
+            self._expires[key] = time.monotonic() + ttl
+
+        if self.max_bytes is not None:
+            self._sizes[key] = sizeof(value)
+            self.size += self._sizes[key]
+
+        while self.cache and (
+            (self.max_entries is not None and len(self.cache) > self.max_entries)
+            or (self.max_bytes is not None and self.size > self.max_bytes)
+        ):
+            self.remove(next(iter(self.cache)))
+            self.evictions += 1
+
+    def remove(self, key: Union[str, int]) -> None:
+        key = str(key)
+        self.pinned.pop(key, None)
+
+        if key in self.cache:
+            del self.cache[key]
+            self._expires.pop(key, None)
+            self.size -= self._sizes.pop(key, 0)
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self.pinned.clear()
+        self._expires.clear()
+        self._sizes.clear()
+        self.size = 0
+
+    def __contains__(self, key: Union[str, int]) -> bool:
+        key = str(key)
+
+        if key in self.pinned:
+            return True
+
+        if key in self.cache and self._expired(key):
+            self.remove(key)
+
+        return key in self.cache
+
+    def __len__(self) -> int:
+        return len(self.pinned) + len(self.cache)
+
+    def __str__(self) -> str:
+        return str({**self.pinned, **self.cache})
+
+
+class NegativeCache:
+    """Set of endpoints known not to exist, with their own TTL and size limit.
+
+    Parameters
+    ----------
+    ttl: :class:`Optional[float]`
+        how many seconds an endpoint is considered inexistent, forever if `None`
+    max_entries: :class:`Optional[int]`
+        the maximum number of endpoints, the oldest ones are dropped first, unlimited if `None`
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: Optional[float] = 600.0,
+        max_entries: Optional[int] = 10_000
+    ) -> None:
+        self.ttl: Optional[float] = ttl
+        self.max_entries: Optional[int] = max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._expires: OrderedDict[str, Optional[float]] = OrderedDict()
+
+    def add(self, endpoint: str) -> None:
+        self._expires.pop(endpoint, None)
+        self._expires[endpoint] = None if self.ttl is None else time.monotonic() + self.ttl
+
+        while self.max_entries is not None and len(self._expires) > self.max_entries:
+            self._expires.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, endpoint: str) -> None:
+        self._expires.pop(endpoint, None)
+
+    def clear(self) -> None:
+        self._expires.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'size': len(self._expires),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def __contains__(self, endpoint: str) -> bool:
+        if endpoint not in self._expires:
+            self.misses += 1
+            return False
+
+        if (expires := self._expires[endpoint]) is not None and expires <= time.monotonic():
+            del self._expires[endpoint]
+            self.misses += 1
+            return False
+
+        self.hits += 1
+        return True
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+
+class DiskCache:
+    """Persistent cache of raw JSON responses stored in a SQLite file.
+
+    The database runs in WAL mode, so several processes can share the same file:
+    readers never block each other and writers wait up to `timeout` seconds for the lock.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        the path of the database file, created if it does not exist
+    timeout: :class:`float`
+        how many seconds to wait for another process to release the database
+    ttl: :class:`Optional[float]`
+        how many seconds a response is served after it was stored, forever if `None`;
+        an expired response is replaced by the next one stored under its key
+    """
+
+    def __init__(self, path: str, *, timeout: float = 30.0, ttl: Optional[float] = None) -> None:
+        self.path: str = path
+        self.ttl: Optional[float] = ttl
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: sqlite3.Connection = sqlite3.connect(
+            path,
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, '
+            'data BLOB NOT NULL, '
+            'fetched_at REAL NOT NULL'
+            ') WITHOUT ROWID'
+        )
+
+    def _oldest(self) -> float:
+        # responses stored before this time are expired
+        return float('-inf') if self.ttl is None else time.time() - self.ttl
+
+    def get_sync(self, key: str, *, raw: bool = False) -> Union[JsonResponse, bytes, None]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data FROM responses WHERE key = ? AND fetched_at >= ?',
+                (key, self._oldest())
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return bytes(row[0]) if raw else decoder.loads(row[0])
+
+    def put_sync(self, key: str, data: Union[JsonResponse, bytes]) -> None:
+        # a body is stored as it is
+        payload = data if isinstance(data, bytes) else decoder.dumps(data)
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (key, data, fetched_at) VALUES (?, ?, ?)',
+                (key, payload, time.time())
+            )
+
+    def put_many_sync(self, items: Iterable[tuple[str, Union[JsonResponse, bytes]]]) -> None:
+        """Stores many responses in a single transaction."""
+
+        fetched_at = time.time()
+        rows = [
+            (key, data if isinstance(data, bytes) else decoder.dumps(data), fetched_at)
+            for key, data in items
+        ]
+
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO responses (key, data, fetched_at) VALUES (?, ?, ?)',
+                    rows
+                )
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    async def get(self, key: str, *, raw: bool = False) -> Union[JsonResponse, bytes, None]:
+        """Returns the parsed response, or its body if `raw` is `True`."""
+
+        return await asyncio.to_thread(self.get_sync, key, raw=raw)
+
+    async def put(self, key: str, data: Union[JsonResponse, bytes]) -> None:
+        await asyncio.to_thread(self.put_sync, key, data)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                'SELECT 1 FROM responses WHERE key = ? AND fetched_at >= ?',
+                (key, self._oldest())
+            ).fetchone() is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def cached_resource(
+    endpoint: str,
+    model: Optional[Type[BaseObject]] = None
+) -> Callable[['Client', Param], Coroutine[Any, Any, U]]:
+
+    def decorator(coroutine: Callable[..., Coroutine[Any, Any, U]]):
+
+        async def fetch(client: Client, key: str, store: bool, *args: Any, **kwargs: Any) -> U:
+            obj: U = await coroutine(client, *args, **kwargs)
+
+            # missing resources are remembered by `HttpClient.inexistent_endpoints`,
+            # which expire unlike the entries of the cache
+            if obj is not None and store:
+                client._cache.put(key, obj)
+            return obj
+
+        async def shared(client: Client, key: str, store: bool, *args: Any, **kwargs: Any) -> U:
+            # Concurrent callers of the same key share a single request.
+            # It runs in its own task, so cancelling one caller (even the first)
+            # does not cancel it for the others, and the key is released
+            # as soon as it finishes, so a failure is retried by the next caller.
+            if (task := client._cache.inflight.get(key)) is None:
+                task = asyncio.ensure_future(fetch(client, key, store, *args, **kwargs))
+                client._cache.inflight[key] = task
+                task.add_done_callback(lambda _: client._cache.inflight.pop(key, None))
+
+            return await asyncio.shield(task)
+
+        async def wrapper(client: Client, id_or_name: Param, *, fields: Optional[Iterable[str]] = None) -> U:
+
+            # only the getters given a model, such as `get_pokemon`, decode a subset of the fields,
+            # which are checked before the cache so a cached resource does not hide a wrong field
+            if fields is not None:
+                if model is None:
+                    raise TypeError(f'{coroutine.__name__}() does not support fields')
+                fields = tuple(fields)
+                if unknown := set(fields) - set(model._fields):
+                    raise ValueError(f'{model.__name__} has no fields {", ".join(sorted(unknown))}')
+
+            if (url := f'{endpoint}/{id_or_name}') in client._cache:
+                return client._cache.get(url)
+
+            if fields is None:
+                return await shared(client, url, True, id_or_name)
+
+            # the whole resource is returned above if it is cached,
+            # otherwise only the requested fields are decoded
+            fields = tuple(sorted(set(fields)))
+
+            if (key := f'{url}?fields={",".join(fields)}') in client._cache:
+                return client._cache.get(key)
+
+            return await shared(client, key, client._cache.projections, id_or_name, fields=fields)
+
+        wrapper.endpoint = endpoint
+        return wrapper
+
+    return decorator
@@ -0,0 +1,185 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import asyncio
+import gzip
+import json
+import time
+from collections import deque
+from typing import Final, Iterator, Optional
+
+from transport import Headers, Response, Transport
+
+
+MAGIC: Final[bytes] = b'POKEAPI-CASSETTE 1\n'
+
+
+class Record:
+    """A response captured by :class:`RecordingTransport`.
+
+    Attributes
+    ----------
+    endpoint: :class:`str`
+        the requested endpoint
+    response: :class:`Response`
+        the response
+    latency: :class:`float`
+        how many seconds the request took
+    """
+
+    __slots__ = (
+        'endpoint',
+        'response',
+        'latency'
+    )
+
+    def __init__(
+        self,
+        endpoint: str,
+        response: Response,
+        latency: float
+    ) -> None:
+        self.endpoint: str = endpoint
+        self.response: Response = response
+        self.latency: float = latency
+
+
+def save(path: str, records: list[Record]) -> None:
+    """Writes records into a cassette.
+
+    A cassette is a gzip file starting with :data:`MAGIC`,
+    followed by one JSON line of metadata and the raw body for each record.
+    The names of the headers are stored in lower case.
+    """
+
+    with gzip.open(path, 'wb') as f:
+        f.write(MAGIC)
+
+        for record in records:
+            response = record.response
+            f.write(json.dumps({
+                'endpoint': record.endpoint,
+                'status': response.status,
+                'headers': {key.lower(): value for key, value in response.headers.items()},
+                'latency': record.latency,
+                'size': len(response.body)
+            }, separators=(',', ':')).encode() + b'\n')
+            f.write(response.body)
+
+
+def load(path: str) -> Iterator[Record]:
+    """Reads the records of a cassette, see :func:`save`.
+
+    Raises
+    ------
+    :class:`ValueError`
+        the file is not a cassette
+    """
+
+    with gzip.open(path, 'rb') as f:
+        if f.readline() != MAGIC:
+            raise ValueError(f'{path} is not a cassette')
+
+        while line := f.readline():
+            meta = json.loads(line)
+            yield Record(
+                meta['endpoint'],
+                Response(meta['status'], Headers(meta['headers']), f.read(meta['size'])),
+                meta['latency']
+            )
+
+
+class RecordingTransport(Transport):
+    """Records every response of another transport into a cassette.
+
+    Parameters
+    ----------
+    transport: :class:`Transport`
+        the transport actually doing the requests
+    path: :class:`str`
+        the cassette, written when the transport is closed
+    """
+
+    def __init__(self, transport: Transport, path: str) -> None:
+        self.transport: Transport = transport
+        self.path: str = path
+        self.records: list[Record] = []
+
+    async def request(self, endpoint: str) -> Response:
+        started = time.perf_counter()
+        response = await self.transport.request(endpoint)
+        self.records.append(Record(endpoint, response, time.perf_counter() - started))
+        return response
+
+    def save(self) -> None:
+        save(self.path, self.records)
+
+    async def close(self) -> None:
+        self.save()
+        await self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """Serves the responses of a cassette.
+
+    The responses of an endpoint are served in the recorded order, the last one is repeated once all are served.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        the cassette
+    latency_scale: :class:`Optional[float]`
+        how much the recorded latencies are scaled when replayed, responses are immediate if `None`
+    strict: :class:`bool`
+        whether to raise :class:`KeyError` for endpoints absent from the cassette instead of answering 404
+    """
+
+    NOT_FOUND: Final[Response] = Response(404, {}, b'')
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        latency_scale: Optional[float] = None,
+        strict: bool = False
+    ) -> None:
+        self.latency_scale: Optional[float] = latency_scale
+        self.strict: bool = strict
+        self._records: dict[str, deque[Record]] = {}
+
+        for record in load(path):
+            self._records.setdefault(record.endpoint, deque()).append(record)
+
+    async def request(self, endpoint: str) -> Response:
+        if (records := self._records.get(endpoint)) is None:
+            if self.strict:
+                raise KeyError(endpoint)
+            return self.NOT_FOUND
+
+        record = records.popleft() if len(records) > 1 else records[0]
+
+        if self.latency_scale is not None:
+            await asyncio.sleep(record.latency * self.latency_scale)
+
+        return record.response
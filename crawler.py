@@ -0,0 +1,435 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import argparse
+import asyncio
+import sqlite3
+import time
+from typing import Callable, Final, Iterable, Optional
+
+from api import Client, HTTPException
+from cache import DiskCache
+from ratelimit import RateLimiter
+from transport import BASE_URL, HttpTransport, Response, Transport, parse_page
+import decoder
+
+
+DESCRIPTION = """Fetches every resource of Poke API once into a single SQLite database.
+
+    python -m crawler pokeapi.sqlite [--endpoints pokemon,move] [--concurrency 10] [--rate 20]
+
+The crawl is resumable: run it again after an interruption and only the missing resources are fetched.
+The responses are stored in the format of `cache.DiskCache`, so the database can back a client,
+either as its disk cache (`Client(disk_cache='pokeapi.sqlite')`) or, without any network access,
+as its transport (`Client(transport=DatabaseTransport('pokeapi.sqlite'))`).
+"""
+
+# endpoints which are not listed themselves, but per resource of another endpoint
+DERIVED_ENDPOINTS: Final[dict[str, tuple[str, str]]] = {
+    'pokemon-encounters': ('pokemon', 'pokemon/{}/encounters'),
+}
+
+PENDING: Final[int] = 0
+FETCHED: Final[int] = 1
+MISSING: Final[int] = 2
+
+
+def list_endpoints() -> list[str]:
+    """Returns the endpoints having a getter in :class:`Client`, in the order they are defined."""
+
+    return [method.endpoint for method in vars(Client).values() if hasattr(method, 'endpoint')]
+
+
+def resource_path(endpoint: str, id: str) -> str:
+    """Returns the path of a resource, as it is requested and stored, such as `pokemon/1/encounters`."""
+
+    if (derived := DERIVED_ENDPOINTS.get(endpoint)) is not None:
+        return derived[1].format(id)
+
+    return f'{endpoint}/{id}'
+
+
+def _connect(path: str, timeout: float) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS endpoints ('
+        'endpoint TEXT PRIMARY KEY, '
+        'count INTEGER NOT NULL'
+        ') WITHOUT ROWID'
+    )
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS resources ('
+        'endpoint TEXT NOT NULL, '
+        'position INTEGER NOT NULL, '
+        'id TEXT NOT NULL, '
+        'name TEXT, '
+        'status INTEGER NOT NULL, '
+        'PRIMARY KEY (endpoint, position)'
+        ') WITHOUT ROWID'
+    )
+    conn.execute('CREATE INDEX IF NOT EXISTS resources_names ON resources (endpoint, name)')
+    return conn
+
+
+class Crawler:
+    """Fetches every resource of the given endpoints into a database.
+
+    The resources of each endpoint are listed first, then fetched concurrently
+    under the limits of the client (its `concurrency`, rate limiter and retries).
+    An endpoint is recorded only once all its pages are listed, otherwise it is listed again by the next crawl.
+    Every `checkpoint` resources, the responses and the progress are written to the database,
+    so an interrupted crawl resumes where it stopped, losing at most one checkpoint.
+    The resources which failed after all their retries are left pending for the next crawl.
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        the client fetching the resources
+    path: :class:`str`
+        the path of the database, created if it does not exist
+    endpoints: :class:`Optional[Iterable[str]]`
+        the endpoints to crawl, all of :func:`list_endpoints` if `None`
+    page_size: :class:`int`
+        the number of resources fetched per page when listing an endpoint
+    checkpoint: :class:`int`
+        the number of resources written to the database at once
+    progress: :class:`Optional[Callable[[dict[str, int]], None]]`
+        called with :meth:`stats` after each checkpoint
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        path: str,
+        *,
+        endpoints: Optional[Iterable[str]] = None,
+        page_size: int = 100,
+        checkpoint: int = 100,
+        progress: Optional[Callable[[dict[str, int]], None]] = None
+    ) -> None:
+        self.client: Client = client
+        self.path: str = path
+        self.endpoints: list[str] = list(endpoints) if endpoints is not None else list_endpoints()
+        self.page_size: int = page_size
+        self.checkpoint: int = checkpoint
+        self.progress: Optional[Callable[[dict[str, int]], None]] = progress
+        self.disk: DiskCache = DiskCache(path)
+        self.fetched: int = 0
+        self.missing: int = 0
+        self.failed: int = 0
+        self.pending: int = 0
+        self.unlisted: list[str] = []
+        self._conn: sqlite3.Connection = _connect(path, 30.0)
+        self._batch: list[tuple[str, int, str, Optional[bytes]]] = []
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+        if unknown := set(self.endpoints) - set(list_endpoints()):
+            raise ValueError(f'Unknown endpoints: {", ".join(sorted(unknown))}')
+
+    async def list_endpoint(self, endpoint: str) -> int:
+        """Lists the resources of an endpoint into the database, unless it was already done.
+
+        Returns
+        -------
+        :class:`int`
+            the number of resources of the endpoint
+
+        Raises
+        ------
+        :class:`HTTPException`
+            a page could not be fetched, or the pages do not add up to the count of the endpoint;
+            nothing is recorded, so that the next crawl lists it again
+        """
+
+        if (row := self._conn.execute('SELECT count FROM endpoints WHERE endpoint = ?', (endpoint,)).fetchone()):
+            return row[0]
+
+        listed = DERIVED_ENDPOINTS[endpoint][0] if endpoint in DERIVED_ENDPOINTS else endpoint
+        rows: list[tuple[str, int, str, Optional[str], int]] = []
+        count: Optional[int] = None
+
+        while count is None or len(rows) < count:
+            path = f'{listed}?limit={self.page_size}&offset={len(rows)}'
+
+            if (page := await self.client.get_resource_list(listed, limit=self.page_size, offset=len(rows))) is None:
+                raise HTTPException(
+                    path,
+                    404 if path in self.client.http.inexistent_endpoints else None,
+                    f'{endpoint} could not be listed'
+                )
+
+            count = page.count
+            rows.extend(
+                (endpoint, position, str(resource._id), getattr(resource, 'name', None), PENDING)
+                for position, resource in enumerate(page.results, len(rows))
+            )
+
+            if page.next is None or not page.results:
+                break
+
+        if len(rows) != count:
+            raise HTTPException(path, 200, f'{endpoint} has {count} resources, {len(rows)} were listed')
+
+        # recorded at once and only when complete, so that an interrupted listing starts again
+        await asyncio.to_thread(self._insert, endpoint, rows)
+        return len(rows)
+
+    def _insert(self, endpoint: str, rows: list[tuple[str, int, str, Optional[str], int]]) -> None:
+        self._conn.execute('BEGIN')
+        self._conn.execute('DELETE FROM resources WHERE endpoint = ?', (endpoint,))
+        self._conn.executemany('INSERT INTO resources VALUES (?, ?, ?, ?, ?)', rows)
+        self._conn.execute('INSERT INTO endpoints VALUES (?, ?)', (endpoint, len(rows)))
+        self._conn.execute('COMMIT')
+
+    async def fetch(self, endpoint: str, position: int, id: str) -> None:
+        """Fetches one resource, written to the database with the next checkpoint."""
+
+        path = resource_path(endpoint, id)
+
+        try:
+            body = await self.client.http.get(path, raw=True)
+        except Exception:
+            # HTTPException after all the retries, or any error the client does not retry,
+            # such as an incomplete body; the resource is left pending for the next crawl
+            self.failed += 1
+            self.pending -= 1
+            return
+
+        # `None` is also returned for the statuses which are not retried, such as 403,
+        # only a 404 recorded by the client makes the resource missing
+        if body is None and path not in self.client.http.inexistent_endpoints:
+            self.failed += 1
+            self.pending -= 1
+            return
+
+        self._batch.append((endpoint, position, path, body))
+
+        if len(self._batch) >= self.checkpoint:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Writes the fetched responses and the progress to the database."""
+
+        async with self._lock:
+            batch, self._batch = self._batch, []
+
+            if batch:
+                await asyncio.to_thread(self._write, batch)
+
+            for *_, body in batch:
+                if body is None:
+                    self.missing += 1
+                else:
+                    self.fetched += 1
+
+            self.pending -= len(batch)
+
+        if batch and self.progress is not None:
+            self.progress(self.stats())
+
+    def _write(self, batch: list[tuple[str, int, str, Optional[bytes]]]) -> None:
+        # the responses first, a crash in between only fetches them again
+        self.disk.put_many_sync((path, body) for _, _, path, body in batch if body is not None)
+        self._conn.execute('BEGIN')
+        self._conn.executemany(
+            'UPDATE resources SET status = ? WHERE endpoint = ? AND position = ?',
+            [(MISSING if body is None else FETCHED, endpoint, position) for endpoint, position, _, body in batch]
+        )
+        self._conn.execute('COMMIT')
+
+    async def crawl(self) -> dict[str, int]:
+        """Lists the endpoints, then fetches every pending resource.
+
+        Returns
+        -------
+        :class:`dict[str, int]`
+            see :meth:`stats`
+        """
+
+        for endpoint in self.endpoints:
+            try:
+                await self.list_endpoint(endpoint)
+            except HTTPException:
+                # its resources are fetched by the next crawl, once it is listed
+                self.unlisted.append(endpoint)
+
+        queue: asyncio.Queue[tuple[str, int, str]] = asyncio.Queue()
+
+        for row in self._conn.execute(
+            f'SELECT endpoint, position, id FROM resources WHERE status = ? '
+            f'AND endpoint IN ({", ".join("?" * len(self.endpoints))}) ORDER BY endpoint, position',
+            (PENDING, *self.endpoints)
+        ):
+            queue.put_nowait(row)
+
+        self.pending = queue.qsize()
+
+        async def worker() -> None:
+            while not queue.empty():
+                await self.fetch(*queue.get_nowait())
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(self.client.concurrency)))
+        finally:
+            await self.flush()
+
+        return self.stats()
+
+    def stats(self) -> dict[str, int]:
+        """Returns the number of resources fetched, missing (404) and failed by this crawl,
+        still pending, and the number of endpoints which could not be listed."""
+
+        return {
+            'fetched': self.fetched,
+            'missing': self.missing,
+            'failed': self.failed,
+            'pending': self.pending,
+            'unlisted': len(self.unlisted)
+        }
+
+    def close(self) -> None:
+        self._conn.close()
+        self.disk.close()
+
+
+class DatabaseTransport(Transport):
+    """Serves the resources of a database written by :class:`Crawler`, without any network access.
+
+    Names are resolved into ids and the paginated lists are served from the listed resources.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        the path of the database
+    """
+
+    NOT_FOUND: Final[Response] = Response(404, {}, b'')
+    BAD_REQUEST: Final[Response] = Response(400, {}, b'')
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self._conn: sqlite3.Connection = sqlite3.connect(f'file:{path}?mode=ro', uri=True, check_same_thread=False)
+
+    def _resolve(self, endpoint: str, name: str) -> Optional[str]:
+        if name.isdigit():
+            return name
+
+        # the derived endpoints are listed with the resources of their own
+        row = self._conn.execute(
+            'SELECT id FROM resources WHERE endpoint = ? AND name = ?',
+            (endpoint, name)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def _list(self, endpoint: str, query: str) -> Response:
+        if (row := self._conn.execute('SELECT count FROM endpoints WHERE endpoint = ?', (endpoint,)).fetchone()) is None:
+            return self.NOT_FOUND
+
+        if (page := parse_page(query)) is None:
+            return self.BAD_REQUEST
+
+        limit, offset = page
+        count, url = row[0], f'{BASE_URL}/{endpoint}'
+        results = [
+            {'name': name, 'url': f'{url}/{id}/'} if name is not None else {'url': f'{url}/{id}/'}
+            for id, name in self._conn.execute(
+                'SELECT id, name FROM resources WHERE endpoint = ? ORDER BY position LIMIT ? OFFSET ?',
+                (endpoint, limit, offset)
+            )
+        ]
+
+        return Response(200, {}, decoder.dumps({
+            'count': count,
+            'next': f'{url}?offset={offset + limit}&limit={limit}' if offset + limit < count else None,
+            'previous': f'{url}?offset={max(offset - limit, 0)}&limit={limit}' if offset > 0 else None,
+            'results': results
+        }))
+
+    async def request(self, endpoint: str) -> Response:
+        path, _, query = endpoint.partition('?')
+        parts = path.strip('/').split('/')
+
+        if len(parts) == 1:
+            return self._list(parts[0], query)
+
+        if (id := self._resolve(parts[0], parts[1])) is None:
+            return self.NOT_FOUND
+
+        row = self._conn.execute(
+            'SELECT data FROM responses WHERE key = ?',
+            ('/'.join([parts[0], id, *parts[2:]]),)
+        ).fetchone()
+        return Response(200, {}, bytes(row[0])) if row is not None else self.NOT_FOUND
+
+    async def close(self) -> None:
+        self._conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=DESCRIPTION, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help='the database, created or resumed')
+    parser.add_argument('--endpoints', type=lambda s: s.split(','), default=None, help='endpoints to crawl, all by default')
+    parser.add_argument('--concurrency', type=int, default=10, help='requests at the same time')
+    parser.add_argument('--rate', type=float, default=None, help='requests per second, unlimited by default')
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--checkpoint', type=int, default=100, help='resources written to the database at once')
+    parser.add_argument('--url', default=BASE_URL, help='base URL of the API')
+    args = parser.parse_args()
+
+    async def crawl() -> dict[str, int]:
+        started = time.perf_counter()
+
+        def progress(stats: dict[str, int]) -> None:
+            print(
+                f'{time.perf_counter() - started:8.1f}s  fetched {stats["fetched"]}  missing {stats["missing"]}  '
+                f'failed {stats["failed"]}  pending {stats["pending"]}'
+            )
+
+        async with Client(
+            transport=HttpTransport(base_url=args.url),
+            rate_limiter=RateLimiter(rate=args.rate),
+            concurrency=args.concurrency
+        ) as client:
+            crawler = Crawler(
+                client,
+                args.path,
+                endpoints=args.endpoints,
+                page_size=args.page_size,
+                checkpoint=args.checkpoint,
+                progress=progress
+            )
+            try:
+                return await crawler.crawl()
+            finally:
+                crawler.close()
+
+    stats = asyncio.run(crawl())
+    print(
+        f'done, {stats["failed"]} resources failed and {stats["unlisted"]} endpoints could not be listed'
+        + (', run again to retry them' if stats['failed'] or stats['unlisted'] else '')
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import json
+from typing import Any, Callable, Final, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+Decoder = Callable[[Union[bytes, str]], Any]
+Encoder = Callable[[Any], bytes]
+
+
+def _json_dumps(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+DECODERS: Final[dict[str, Decoder]] = {'json': json.loads}
+ENCODERS: Final[dict[str, Encoder]] = {'json': _json_dumps}
+
+if msgspec is not None:
+    DECODERS['msgspec'] = msgspec.json.decode
+    ENCODERS['msgspec'] = msgspec.json.encode
+
+if orjson is not None:
+    DECODERS['orjson'] = orjson.loads
+    ENCODERS['orjson'] = orjson.dumps
+
+FASTEST: Final[str] = next(name for name in ('orjson', 'msgspec', 'json') if name in DECODERS)
+
+
+def get_decoder(name: Optional[str] = None) -> Decoder:
+    """Returns a function parsing JSON from bytes.
+
+    Parameters
+    ----------
+    name: :class:`Optional[str]`
+        `orjson`, `msgspec` or `json`, the fastest installed one if `None`
+
+    Returns
+    -------
+    :class:`Decoder`
+        the function
+
+    Raises
+    ------
+    :class:`ValueError`
+        the library is not installed
+    """
+
+    if (decoder := DECODERS.get(name or FASTEST)) is None:
+        raise ValueError(f'{name} is not installed')
+
+    return decoder
+
+
+def get_encoder(name: Optional[str] = None) -> Encoder:
+    """Returns a function serializing JSON into bytes,
+    see :func:`get_decoder`."""
+
+    if (encoder := ENCODERS.get(name or FASTEST)) is None:
+        raise ValueError(f'{name} is not installed')
+
+    return encoder
+
+
+loads: Final[Decoder] = get_decoder()
+dumps: Final[Encoder] = get_encoder()
@@ -0,0 +1,230 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+import asyncio
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Optional, Type, TypeVar
+
+from decoder import Decoder, get_decoder
+from objects.common import compile_projection, interning, lazy_decoding
+
+T = TypeVar('T')
+
+
+def load(
+    cls: Type[T],
+    data: Any,
+    *,
+    lazy: bool = False,
+    intern: bool = False,
+    fields: Optional[Iterable[str]] = None
+) -> Any:
+    """Decodes a parsed response into models.
+
+    Parameters
+    ----------
+    cls: :class:`Type[T]`
+        the model of the response
+    data: :class:`Any`
+        the parsed JSON, a list is decoded into a list of models
+    lazy: :class:`bool`
+        whether the large fields are decoded on first access, see :func:`objects.lazy_decoding`
+    intern: :class:`bool`
+        whether identical small objects are shared, see :func:`objects.interning`
+    fields: :class:`Optional[Iterable[str]]`
+        the fields to keep, all if `None`
+
+    Returns
+    -------
+    :class:`T | list[T]`
+        the decoded response
+    """
+
+    with lazy_decoding(lazy), interning(intern):
+        if isinstance(data, list):
+            return cls.loads_list(data)
+        elif fields is not None:
+            # the other fields are not decoded at all
+            return compile_projection(cls, fields)(data)
+        else:
+            return cls.loads(data)
+
+
+def _decode(
+    cls: Type[T],
+    body: bytes,
+    decoder: Optional[str],
+    lazy: bool,
+    intern: bool,
+    fields: Optional[tuple[str, ...]]
+) -> tuple[bytes, float]:
+    # runs in a worker process, the models are pickled here so that
+    # unpickling them is the only work left to the event loop.
+    # Only parsing and decoding are timed, they are what the loop is spared
+    started = time.perf_counter()
+    obj = load(cls, get_decoder(decoder)(body), lazy=lazy, intern=intern, fields=fields)
+    elapsed = time.perf_counter() - started
+    return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL), elapsed
+
+
+class DecodeExecutor:
+    """Decodes the large responses in worker processes, so that they do not block the event loop.
+
+    Responses of at least `threshold` bytes are parsed and decoded into models in a
+    :class:`concurrent.futures.ProcessPoolExecutor`, and the models are sent back pickled.
+    Only unpickling them is left to the event loop. Smaller ones are decoded in place, since sending them to a process costs more
+    than decoding them. Identical objects are not shared across responses decoded in
+    different processes, even when the client interns them.
+
+    The processes are started on first use. An executor can be shared by several
+    :class:`Client`, it is not closed with them.
+
+    Parameters
+    ----------
+    threshold: :class:`int`
+        the size in bytes from which a response is decoded in a process
+    max_workers: :class:`Optional[int]`
+        the number of processes, the number of CPUs if `None`
+    decoder: :class:`Optional[str]`
+        the JSON library of the processes and of the responses decoded in place,
+        see :func:`decoder.get_decoder`
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: int = 64 * 1024,
+        max_workers: Optional[int] = None,
+        decoder: Optional[str] = None
+    ) -> None:
+        self.threshold: int = threshold
+        self.max_workers: Optional[int] = max_workers
+        self.decoder: Optional[str] = decoder
+        self._loads: Decoder = get_decoder(decoder)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        self.inline: int = 0
+        self.inline_seconds: float = 0.0
+        self.offloaded: int = 0
+        self.offloaded_bytes: int = 0
+        self.worker_seconds: float = 0.0
+        self.unpickle_seconds: float = 0.0
+        self.max_block: float = 0.0
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    async def decode(
+        self,
+        cls: Type[T],
+        body: bytes,
+        *,
+        lazy: bool = False,
+        intern: bool = False,
+        fields: Optional[Iterable[str]] = None
+    ) -> Any:
+        """Parses a response and decodes it with :func:`load`, in a process if it is large.
+
+        Parameters
+        ----------
+        cls: :class:`Type[T]`
+            the model of the response
+        body: :class:`bytes`
+            the body of the response
+        lazy: :class:`bool`
+            whether the large fields are decoded on first access
+        intern: :class:`bool`
+            whether identical small objects are shared, within a response decoded in a process
+        fields: :class:`Optional[Iterable[str]]`
+            the fields to keep, all if `None`
+
+        Returns
+        -------
+        :class:`T | list[T]`
+            the decoded response
+        """
+
+        fields = None if fields is None else tuple(fields)
+
+        if len(body) < self.threshold:
+            started = time.perf_counter()
+            obj = load(cls, self._loads(body), lazy=lazy, intern=intern, fields=fields)
+            elapsed = time.perf_counter() - started
+
+            self.inline += 1
+            self.inline_seconds += elapsed
+            self.max_block = max(self.max_block, elapsed)
+            return obj
+
+        loop = asyncio.get_running_loop()
+        payload, elapsed = await loop.run_in_executor(self.pool, _decode, cls, body, self.decoder, lazy, intern, fields)
+
+        started = time.perf_counter()
+        obj = pickle.loads(payload)
+        unpickled = time.perf_counter() - started
+
+        self.offloaded += 1
+        self.offloaded_bytes += len(body)
+        self.worker_seconds += elapsed
+        self.unpickle_seconds += unpickled
+        self.max_block = max(self.max_block, unpickled)
+        return obj
+
+    def stats(self) -> dict[str, float]:
+        """Returns how much decoding was done on and off the event loop.
+
+        Returns
+        -------
+        :class:`dict[str, float]`
+            the responses decoded in place and the seconds they blocked the loop,
+            the responses decoded in processes, their bytes, the seconds spent
+            unpickling them on the loop and the seconds saved, that is the time
+            of parsing and decoding them in the processes minus the time of unpickling them, and the longest
+            time the loop was blocked by a single response
+        """
+
+        return {
+            'inline': self.inline,
+            'inline_seconds': self.inline_seconds,
+            'offloaded': self.offloaded,
+            'offloaded_bytes': self.offloaded_bytes,
+            'unpickle_seconds': self.unpickle_seconds,
+            'saved_seconds': self.worker_seconds - self.unpickle_seconds,
+            'max_block': self.max_block
+        }
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self) -> DecodeExecutor:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -1,34 +1,131 @@
-"""
-The MIT License (MIT)
-
-Copyright (c) 2023-present Yumax-panda
-
-Permission is hereby granted, free of charge, to any person obtaining a
-copy of this software and associated documentation files (the "Software"),
-to deal in the Software without restriction, including without limitation
-the rights to use, copy, modify, merge, publish, distribute, sublicense,
-and/or sell copies of the Software, and to permit persons to whom the
-Software is furnished to do so, subject to the following conditions:
-The above copyright notice and this permission notice shall be included in
-all copies or substantial portions of the Software.
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
-OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
-FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
-DEALINGS IN THE SOFTWARE.
-"""
-
-from .berry import *
-from .common import *
-from .contest import *
-from .encounter import *
-from .evolution import *
-from .game import *
-from .item import *
-from .language import *
-from .location import *
-from .machine import *
-from .move import *
-from .models import *
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .common import *
+from .models import *
+
+if TYPE_CHECKING:
+    from .berry import *
+    from .contest import *
+    from .encounter import *
+    from .evolution import *
+    from .game import *
+    from .item import *
+    from .language import *
+    from .location import *
+    from .machine import *
+    from .move import *
+
+# the models are imported on first access (PEP 562), this keeps `import objects` cheap;
+# the names each module imports from elsewhere are listed after its models, they used to be star-imported
+_lazy_modules: dict[str, tuple[str, ...]] = {
+    'berry': (
+        'BerryFlavorMap',
+        'Berry',
+        'BerryFirmness',
+        'FlavorBerryMap',
+        'BerryFlavor'
+    ),
+    'contest': (
+        'ContestName',
+        'ContestType',
+        'ContestEffect',
+        'SuperContestEffect'
+    ),
+    'encounter': (
+        'EncounterMethod',
+        'EncounterCondition',
+        'EncounterConditionValue'
+    ),
+    'evolution': (
+        'EvolutionTrigger',
+        'EvolutionDetail',
+        'ChainLink',
+        'EvolutionChain'
+    ),
+    'game': (
+        'Generation',
+        'PokemonEntry',
+        'Pokedex',
+        'Version',
+        'VersionGroup'
+    ),
+    'item': (
+        'ItemHolderPokemonVersionDetail',
+        'ItemHolderPokemon',
+        'ItemSprites',
+        'Item',
+        'ItemAttribute',
+        'ItemCategory',
+        'ItemFlingEffect',
+        'ItemPocket'
+    ),
+    'language': ('Language',),
+    'location': (
+        'Location',
+        'PokemonEncounter',
+        'EncounterVersionDetails',
+        'EncounterMethodRate',
+        'LocationArea',
+        'PalParkEncounterSpecies',
+        'PalParkArea',
+        'Region'
+    ),
+    'machine': ('Machine',),
+    'move': (
+        'PastMoveStatValues',
+        'MoveStatChange',
+        'MoveMetaData',
+        'MoveFlavorText',
+        'ContestComboDetail',
+        'ContestComboSets',
+        'Move',
+        'MoveAilment',
+        'MoveBattleStyle',
+        'MoveCategory',
+        'MoveDamageClass',
+        'MoveLearnMethod',
+        'MoveTarget',
+        'AbilityEffectChange'
+    )
+}
+_models: dict[str, str] = {name: module for module, names in _lazy_modules.items() for name in names}
+_subpackages: tuple[str, ...] = ('pokemon',)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _subpackages or name in _lazy_modules:
+        return import_module(f'.{name}', __name__)
+
+    if (module := _models.get(name)) is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = globals()[name] = getattr(import_module(f'.{module}', __name__), name)
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_lazy_modules, *_models})
@@ -1,72 +1,527 @@
-"""
-The MIT License (MIT)
-
-Copyright (c) 2023-present Yumax-panda
-
-Permission is hereby granted, free of charge, to any person obtaining a
-copy of this software and associated documentation files (the "Software"),
-to deal in the Software without restriction, including without limitation
-the rights to use, copy, modify, merge, publish, distribute, sublicense,
-and/or sell copies of the Software, and to permit persons to whom the
-Software is furnished to do so, subject to the following conditions:
-The above copyright notice and this permission notice shall be included in
-all copies or substantial portions of the Software.
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
-OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
-FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
-DEALINGS IN THE SOFTWARE.
-"""
-
-from typing import Type, TypeVar, Any
-
-T = TypeVar('T')
-
-
-class BaseObject:
-
-    __slots__ = ()
-
-    def to_dict(self) -> dict[str, Any]:
-        """Converts this object into a dict.
-        Returns
-        -------
-        Dict
-            A dictionary of :class:`str` keys bound to the respective value.
-        """
-
-        ret = {}
-
-        for attr in self.__slots__:
-            var = getattr(self, attr)
-
-            if isinstance(var, BaseObject):
-                ret[attr] = var.to_dict()
-            elif isinstance(var, list):
-                items = []
-                for item in var:
-                    if isinstance(item, BaseObject):
-                        items.append(item.to_dict())
-                    else:
-                        items.append(item)
-                ret[attr] = items
-            else:
-                ret[attr] = var
-
-        return ret
-
-
-    def __str__(self):
-        return f'<{self.__class__.__name__}>: {str({attr: getattr(self, attr) for attr in self.__slots__})}'
-
-
-    @classmethod
-    def loads(cls: Type[T], data: dict) -> T:
-        return cls(**{attr: data.get(attr) for attr in cls.__slots__})
-
-
-    @classmethod
-    def loads_list(cls: Type[T], data: list[dict]) -> list[T]:
-        return list(map(lambda x: cls.loads(x), data))
\ No newline at end of file
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import sys
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial, wraps
+from typing import (
+    Type,
+    TypeVar,
+    Any,
+    Callable,
+    ForwardRef,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+    get_args,
+    get_origin
+)
+
+__all__ = [
+    'Lazy',
+    'LazyField',
+    'lazy_decoding',
+    'interning',
+    'intern',
+    'interned_count',
+    'deferred',
+    'peek',
+    'BaseObject',
+    'Interned',
+    'compile_loads',
+    'compile_projection'
+]
+
+T = TypeVar('T')
+Schema = dict[str, Any]
+
+_lazy: ContextVar[bool] = ContextVar('lazy', default=False)
+_interning: ContextVar[bool] = ContextVar('interning', default=False)
+_interned: weakref.WeakValueDictionary[tuple[Any, ...], Any] = weakref.WeakValueDictionary()
+
+
+class Lazy:
+    """Raw JSON of a field, decoded by `loads` on first access"""
+
+    __slots__ = (
+        'data',
+        'loads'
+    )
+
+    def __init__(self, data: Any, loads: Callable[[Any], Any]) -> None:
+        self.data: Any = data
+        self.loads: Callable[[Any], Any] = loads
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return Lazy, (self.data, self.loads)
+
+
+class LazyField:
+    """Descriptor replacing the slot of a field listed in `_lazy_slots`.
+    It decodes a :class:`Lazy` value on first access and stores the result in the slot."""
+
+    __slots__ = ('slot',)
+
+    def __init__(self, slot: Any) -> None:
+        self.slot: Any = slot
+
+    def __get__(self, obj: Any, cls: Any = None) -> Any:
+        if obj is None:
+            return self
+
+        if type(value := self.slot.__get__(obj, cls)) is Lazy:
+            value = value.loads(value.data)
+            self.slot.__set__(obj, value)
+
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        self.slot.__set__(obj, value)
+
+    def peek(self, obj: Any) -> Any:
+        """Returns the value of the slot without decoding it"""
+
+        return self.slot.__get__(obj, type(obj))
+
+
+@contextmanager
+def lazy_decoding(enabled: bool = True) -> Iterator[None]:
+    """Within this context, the `loads` methods keep the large fields
+    (`Pokemon.moves`, `Type.pokemon`, ...) as raw JSON until they are accessed."""
+
+    token = _lazy.set(enabled)
+    try:
+        yield
+    finally:
+        _lazy.reset(token)
+
+
+@contextmanager
+def interning(enabled: bool = True) -> Iterator[None]:
+    """Within this context, the `loads` methods of the :class:`Interned` models
+    return a shared instance for structurally identical objects."""
+
+    token = _interning.set(enabled)
+    try:
+        yield
+    finally:
+        _interning.reset(token)
+
+
+def intern(obj: T) -> T:
+    """Returns the shared instance equal to `obj`, which becomes the shared one if there is none.
+    Objects holding unhashable values, such as lists, are returned as is."""
+
+    try:
+        return _interned.setdefault((type(obj), *[getattr(obj, attr, None) for attr in obj._fields]), obj)
+    except TypeError:
+        return obj
+
+
+def interned_count() -> int:
+    """Returns the number of shared instances still alive."""
+
+    return len(_interned)
+
+
+def _load_interned(loads: Callable[[Any], T], data: Any) -> T:
+    with interning():
+        return loads(data)
+
+
+def deferred(loads: Callable[[Any], T], data: Any) -> T:
+    """Decodes `data` with `loads`, or later on first access inside :func:`lazy_decoding`."""
+
+    if not _lazy.get():
+        return loads(data)
+
+    # decoded later, but interned if it would have been now
+    return Lazy(data, partial(_load_interned, loads) if _interning.get() else loads)
+
+
+def peek(obj: Any, attr: str) -> Any:
+    """Returns an attribute without decoding it if it is lazy, `None` if it is unset."""
+
+    try:
+        if isinstance(field := getattr(type(obj), attr, None), LazyField):
+            return field.peek(obj)
+
+        return getattr(obj, attr)
+    except AttributeError:
+        return None
+
+
+def _slots_of(cls: type) -> tuple[str, ...]:
+    slots = cls.__dict__.get('__slots__', ())
+    return (slots,) if isinstance(slots, str) else tuple(slots)
+
+
+def _peek_slot(obj: Any, attr: str) -> Any:
+    try:
+        return getattr(type(obj), attr).peek(obj)
+    except AttributeError:
+        return ...
+
+
+def _rebuild(cls: Type[T], values: tuple[Any, ...]) -> T:
+    # slow path for the objects with unset slots, such as the projected ones
+    obj = cls.__new__(cls)
+
+    for attr, value in zip(cls._fields, values):
+        if value is not ...:
+            setattr(obj, attr, value)
+
+    return obj
+
+
+class Rebuilder:
+    """Descriptor generating, on first access, the function that rebuilds an
+    unpickled object of the class from its slot values.
+
+    The function is named after the attribute of the class, so that pickle can
+    store it by reference and find it again in another process.
+    """
+
+    __slots__ = ('rebuilders',)
+
+    def __init__(self) -> None:
+        self.rebuilders: dict[type, Callable[..., Any]] = {}
+
+    def __get__(self, obj: Any, cls: type) -> Callable[..., Any]:
+        if (rebuild := self.rebuilders.get(cls)) is not None:
+            return rebuild
+
+        args = ', '.join(f'_{i}' for i in range(len(cls._fields)))
+        lines = [f'def rebuild({args}):', '    obj = new(cls)']
+        lines.extend(f'    obj.{attr} = _{i}' for i, attr in enumerate(cls._fields))
+        lines.append('    return obj')
+
+        env: dict[str, Any] = {'new': object.__new__, 'cls': cls}
+        exec(compile('\n'.join(lines), f'<rebuild of {cls.__qualname__}>', 'exec'), env)
+        rebuild = self.rebuilders[cls] = env['rebuild']
+        rebuild.__module__ = cls.__module__
+        rebuild.__qualname__ = f'{cls.__qualname__}._rebuild'
+        return rebuild
+
+
+class BaseObject:
+
+    __slots__ = ()
+    _lazy_slots: tuple[str, ...] = ()
+    _schema: Optional[Schema] = None
+    _fields: tuple[str, ...] = ()
+    _lazy_fields: frozenset[str] = frozenset()
+    _rebuild = Rebuilder()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # every slot of the class and its bases, in order
+        cls._fields = tuple(
+            attr
+            for klass in reversed(cls.__mro__)
+            for attr in _slots_of(klass)
+            if attr != '__weakref__'
+        )
+
+        for attr in cls.__dict__.get('_lazy_slots', ()):
+            setattr(cls, attr, LazyField(cls.__dict__[attr]))
+
+        cls._lazy_fields = frozenset(attr for attr in cls._fields if isinstance(getattr(cls, attr), LazyField))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # the values of the slots, unset ones as `...`, lazy ones still undecoded
+        if self._lazy_fields:
+            values = tuple([
+                _peek_slot(self, attr) if attr in self._lazy_fields else getattr(self, attr, ...)
+                for attr in self._fields
+            ])
+        else:
+            values = tuple([getattr(self, attr, ...) for attr in self._fields])
+
+        if ... in values:
+            return _rebuild, (self.__class__, values)
+
+        return self._rebuild, values
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts this object into a dict.
+        Returns
+        -------
+        Dict
+            A dictionary of :class:`str` keys bound to the respective value.
+        """
+
+        ret = {}
+
+        for attr in self.__slots__:
+            if not hasattr(self, attr):
+                continue
+
+            var = getattr(self, attr)
+
+            if isinstance(var, BaseObject):
+                ret[attr] = var.to_dict()
+            elif isinstance(var, list):
+                items = []
+                for item in var:
+                    if isinstance(item, BaseObject):
+                        items.append(item.to_dict())
+                    else:
+                        items.append(item)
+                ret[attr] = items
+            else:
+                ret[attr] = var
+
+        return ret
+
+
+    def __str__(self):
+        return f'<{self.__class__.__name__}>: {str({attr: getattr(self, attr) for attr in self.__slots__ if hasattr(self, attr)})}'
+
+
+    def project(self: T, fields: Iterable[str]) -> T:
+        """Returns a copy of this object with only the given fields,
+        the others are left unset.
+
+        Parameters
+        ----------
+        fields: :class:`Iterable[str]`
+            the names of the fields to keep
+
+        Returns
+        -------
+        :class:`T`
+            the copy, of the same class
+
+        Raises
+        ------
+        ValueError
+            a field does not exist
+        """
+
+        if unknown := set(fields := tuple(fields)) - set(self._fields):
+            raise ValueError(f'{self.__class__.__name__} has no fields {", ".join(sorted(unknown))}')
+
+        obj = self.__class__.__new__(self.__class__)
+
+        for attr in fields:
+            setattr(obj, attr, getattr(self, attr))
+
+        return obj
+
+
+    @classmethod
+    def loads(cls: Type[T], data: dict) -> T:
+        """Decodes `data` with the function generated from the `_schema` of the class,
+        see :func:`compile_loads`. It replaces this method on first use."""
+
+        return compile_loads(cls)(data)
+
+
+    @classmethod
+    def loads_list(cls: Type[T], data: list[dict]) -> list[T]:
+        return list(map(cls.loads, data))
+
+
+class Interned(BaseObject):
+    """Base of the small immutable models repeated across resources,
+    such as names, references and version details.
+
+    Inside :func:`interning`, their `loads` returns the instance already decoded
+    for the same values if it is still alive. Such instances are shared
+    and must not be modified.
+    """
+
+    __slots__ = ('__weakref__',)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if isinstance(loads := cls.__dict__.get('loads'), staticmethod):
+            cls.loads = staticmethod(_interned_loads(loads.__func__))
+
+
+def _interned_loads(loads: Callable[[Any], T]) -> Callable[[Any], T]:
+    @wraps(loads)
+    def wrapper(data: Any) -> T:
+        obj = loads(data)
+        return intern(obj) if _interning.get() else obj
+
+    return wrapper
+
+
+_loaders: dict[type, Callable[[Any], Any]] = {}
+_projections: dict[tuple[type, tuple[str, ...]], Callable[[Any], Any]] = {}
+_compiling: set[type] = set()
+
+
+def _is_generated(cls: type) -> bool:
+    owner = next(klass for klass in cls.__mro__ if 'loads' in klass.__dict__)
+    return owner is BaseObject or owner in _loaders
+
+
+def _parse_field(spec: Any, namespace: dict[str, Any]) -> tuple[bool, bool, Any]:
+    """Returns whether a field of a schema is optional, whether it is a list,
+    and its model, `None` for plain JSON values."""
+
+    optional = many = False
+
+    if get_origin(spec) is Union:
+        optional = True
+        spec, = [arg for arg in get_args(spec) if arg is not type(None)]
+    if get_origin(spec) is list:
+        many = True
+        spec, = get_args(spec)
+    if isinstance(spec, ForwardRef):
+        spec = spec.__forward_arg__
+    if isinstance(spec, str):
+        spec = namespace[spec]
+
+    return optional, many, spec if isinstance(spec, type) and issubclass(spec, BaseObject) else None
+
+
+def compile_loads(cls: Type[T]) -> Callable[[Any], T]:
+    """Generates the `loads` function of a model from its `_schema` and installs it on the class.
+
+    The schema maps each slot to its type: a JSON value (`int`, `str`, ...), a model,
+    `list[Model]` or `Optional[...]` of one of them. Models not defined yet are
+    given by name. Without a schema, every slot is an optional JSON value.
+    The function sets the slots of a new instance one after the other,
+    without calling `__init__`, and honours :func:`lazy_decoding` and :func:`interning`.
+
+    Parameters
+    ----------
+    cls: :class:`Type[T]`
+        the model
+
+    Returns
+    -------
+    :class:`Callable[[Any], T]`
+        the `loads` function, the hand-written one if the class has one
+    """
+
+    if (loads := _loaders.get(cls)) is not None:
+        return loads
+    if not _is_generated(cls):
+        return cls.loads
+    if cls in _compiling:
+        # a recursive model, such as `ChainLink`, reaches itself through the class
+        return lambda data: cls.loads(data)
+
+    _compiling.add(cls)
+
+    try:
+        loads = _loaders[cls] = _generate(cls, _schema_of(cls), f'<loads of {cls.__qualname__}>')
+        cls.loads = staticmethod(loads)
+    finally:
+        _compiling.discard(cls)
+
+    return loads
+
+
+def compile_projection(cls: Type[T], fields: Iterable[str]) -> Callable[[Any], T]:
+    """Generates a function decoding only the given fields of a model, see :func:`compile_loads`.
+
+    The other fields are neither read nor decoded, and are left unset.
+    A model with a hand-written `loads` is decoded whole, then projected with :meth:`BaseObject.project`.
+
+    Parameters
+    ----------
+    cls: :class:`Type[T]`
+        the model
+    fields: :class:`Iterable[str]`
+        the names of the fields to decode
+
+    Returns
+    -------
+    :class:`Callable[[Any], T]`
+        the function
+
+    Raises
+    ------
+    ValueError
+        a field does not exist
+    """
+
+    if unknown := set(fields := tuple(fields)) - set(cls._fields):
+        raise ValueError(f'{cls.__name__} has no fields {", ".join(sorted(unknown))}')
+
+    if (loads := _projections.get((cls, fields))) is not None:
+        return loads
+
+    if _is_generated(cls):
+        schema = {attr: spec for attr, spec in _schema_of(cls).items() if attr in fields}
+        # a partial object is never interned, it would be shared with whole ones
+        loads = _generate(cls, schema, f'<loads of {cls.__qualname__} projected on {",".join(fields)}>', interned=False)
+    else:
+        loads = lambda data: cls.loads(data).project(fields)
+
+    _projections[(cls, fields)] = loads
+    return loads
+
+
+def _schema_of(cls: type) -> Schema:
+    return cls._schema if '_schema' in cls.__dict__ else {attr: Optional[Any] for attr in cls.__slots__}
+
+
+def _generate(cls: type, schema: Schema, filename: str, interned: bool = True) -> Callable[[Any], Any]:
+    namespace = vars(sys.modules[cls.__module__])
+    env: dict[str, Any] = {
+        'new': object.__new__,
+        'cls': cls,
+        'deferred': deferred,
+        'intern': intern,
+        'interning': _interning
+    }
+    lines = ['def loads(data):', '    obj = new(cls)']
+
+    for i, (attr, spec) in enumerate(schema.items()):
+        optional, many, model = _parse_field(spec, namespace)
+        value = f'data.get({attr!r})' if optional else f'data[{attr!r}]'
+
+        if model is None:
+            lines.append(f'    obj.{attr} = {value}')
+            continue
+
+        if attr in cls._lazy_slots:
+            env[f'f{i}'] = model.loads_list if many else model.loads
+            expr = f'deferred(f{i}, {{}})'
+        else:
+            env[f'f{i}'] = compile_loads(model)
+            expr = f'list(map(f{i}, {{}}))' if many else f'f{i}({{}})'
+
+        if optional:
+            lines.append(f'    obj.{attr} = None if (v := {value}) is None else {expr.format("v")}')
+        else:
+            lines.append(f'    obj.{attr} = {expr.format(value)}')
+
+    if interned and issubclass(cls, Interned):
+        lines.append('    return intern(obj) if interning.get() else obj')
+    else:
+        lines.append('    return obj')
+
+    exec(compile('\n'.join(lines), filename, 'exec'), env)
+    return env['loads']
@@ -0,0 +1,95 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+from typing import Optional
+import aiohttp
+
+
+class ConnectionPool:
+    """Connection pool which can be shared by several :class:`Client`.
+
+    Connections are reused across the clients, so the total number of sockets
+    is bounded by `limit` and addresses are resolved once for all of them.
+    aiohttp already enables `TCP_NODELAY` on every connection.
+    The session is created on first use, inside the running event loop.
+    A pool passed to a :class:`Client` is not closed with it,
+    the owner of the pool closes it once all its clients are closed.
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        the maximum number of connections, unlimited if `0`
+    limit_per_host: :class:`int`
+        the maximum number of connections to the same host, unlimited if `0`
+    keepalive_timeout: :class:`Optional[float]`
+        how many seconds an idle connection is kept open
+    dns_cache_ttl: :class:`Optional[int]`
+        how many seconds resolved addresses are cached, forever if `None`
+    timeout: :class:`Optional[float]`
+        the maximum number of seconds a request may take, unlimited if `None`
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: Optional[float] = 30.0,
+        dns_cache_ttl: Optional[int] = 300,
+        timeout: Optional[float] = 300.0
+    ) -> None:
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: Optional[float] = keepalive_timeout
+        self.dns_cache_ttl: Optional[int] = dns_cache_ttl
+        self.timeout: Optional[float] = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> ConnectionPool:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
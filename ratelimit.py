@@ -0,0 +1,239 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+
+class TokenBucket:
+    """Limits the number of operations per second.
+
+    Parameters
+    ----------
+    rate: :class:`float`
+        how many tokens are added per second
+    capacity: :class:`Optional[float]`
+        the maximum number of tokens, which is the largest allowed burst, `rate` but at least 1 if `None`
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate: float = rate
+        self.capacity: float = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens: float = self.capacity
+        self._updated: float = time.monotonic()
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+
+            self.tokens -= 1
+
+
+class AdaptiveLimiter:
+    """Limits the number of concurrent operations with an AIMD window.
+
+    The window grows by about one slot per window of successful operations
+    as long as their latency stays close to the best latency seen,
+    and is multiplied by `decrease` when an operation is throttled.
+
+    Parameters
+    ----------
+    initial: :class:`int`
+        the initial window
+    minimum: :class:`int`
+        the smallest window
+    maximum: :class:`int`
+        the largest window
+    decrease: :class:`float`
+        the factor applied to the window when an operation is throttled
+    tolerance: :class:`float`
+        how many times slower than the best latency an operation can be
+        while the window keeps growing
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 8,
+        minimum: int = 1,
+        maximum: int = 64,
+        decrease: float = 0.5,
+        tolerance: float = 2.0
+    ) -> None:
+        self.window: float = float(initial)
+        self.minimum: int = minimum
+        self.maximum: int = maximum
+        self.decrease: float = decrease
+        self.tolerance: float = tolerance
+        self.in_flight: int = 0
+        self.throttled: int = 0
+        self.best_latency: Optional[float] = None
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        return max(self.minimum, int(self.window))
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was granted right before the cancellation
+                self.discard()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: float, throttled: bool = False) -> None:
+        """Frees a slot and adapts the window.
+
+        Parameters
+        ----------
+        latency: :class:`float`
+            how many seconds the operation took
+        throttled: :class:`bool`
+            whether the operation was rate limited or timed out
+        """
+
+        self.in_flight -= 1
+
+        if throttled:
+            self.throttled += 1
+            self.window = max(float(self.minimum), self.window * self.decrease)
+        else:
+            if self.best_latency is None or latency < self.best_latency:
+                self.best_latency = latency
+
+            if latency <= self.best_latency * self.tolerance:
+                self.window = min(float(self.maximum), self.window + 1 / self.window)
+
+        self._wake()
+
+    def discard(self) -> None:
+        """Frees a slot without adapting the window, for cancelled operations."""
+
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class RateLimiter:
+    """Limits the requests of :class:`HttpClient`,
+    both in requests per second and in concurrent requests.
+
+    Parameters
+    ----------
+    rate: :class:`Optional[float]`
+        the maximum number of requests per second, unlimited if `None`
+    burst: :class:`Optional[float]`
+        the maximum number of requests sent at once after an idle period, `rate` but at least 1 if `None`
+    concurrency: :class:`Optional[AdaptiveLimiter]`
+        the concurrency window, unlimited if `None`
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        concurrency: Optional[AdaptiveLimiter] = None
+    ) -> None:
+        self.bucket: Optional[TokenBucket] = TokenBucket(rate, burst) if rate is not None else None
+        self.concurrency: Optional[AdaptiveLimiter] = concurrency
+
+    async def acquire(self) -> None:
+        if self.concurrency is not None:
+            await self.concurrency.acquire()
+
+        if self.bucket is not None:
+            try:
+                await self.bucket.acquire()
+            except asyncio.CancelledError:
+                if self.concurrency is not None:
+                    self.concurrency.discard()
+                raise
+
+    def release(self, latency: float, throttled: bool = False) -> None:
+        if self.concurrency is not None:
+            self.concurrency.release(latency, throttled)
+
+    def discard(self) -> None:
+        if self.concurrency is not None:
+            self.concurrency.discard()
+
+    def stats(self) -> dict[str, float]:
+        """Returns the current state, to be graphed.
+
+        Returns
+        -------
+        :class:`dict[str, float]`
+            the concurrency window, the number of requests in flight and waiting,
+            the number of throttled requests and the available tokens
+        """
+
+        ret: dict[str, float] = {}
+
+        if (limiter := self.concurrency) is not None:
+            ret.update(
+                window=limiter.window,
+                in_flight=limiter.in_flight,
+                queue_depth=limiter.queue_depth,
+                throttled=limiter.throttled
+            )
+
+        if self.bucket is not None:
+            ret['tokens'] = self.bucket.tokens
+
+        return ret
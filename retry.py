@@ -0,0 +1,143 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Final, Optional
+
+
+RETRYABLE_STATUSES: Final[frozenset[int]] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a `Retry-After` header.
+
+    Parameters
+    ----------
+    value: :class:`Optional[str]`
+        the header, either a number of seconds or an HTTP date
+
+    Returns
+    -------
+    :class:`Optional[float]`
+        how many seconds to wait, `None` if the header is missing or malformed
+    """
+
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """How :class:`HttpClient` retries failed requests.
+
+    Retryable statuses and connection errors are retried with exponential backoff
+    and full jitter, or after the delay given by `Retry-After` if the response has one.
+
+    Parameters
+    ----------
+    max_retries: :class:`int`
+        the maximum number of retries of a request
+    backoff: :class:`float`
+        the base delay in seconds, doubled on each retry
+    max_backoff: :class:`float`
+        the maximum delay between two attempts
+    budget: :class:`Optional[float]`
+        the maximum number of seconds a request may spend waiting between attempts,
+        unlimited if `None`
+    statuses: :class:`frozenset[int]`
+        the statuses which are retried
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        budget: Optional[float] = 120.0,
+        statuses: frozenset[int] = RETRYABLE_STATUSES
+    ) -> None:
+        self.max_retries: int = max_retries
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.budget: Optional[float] = budget
+        self.statuses: frozenset[int] = statuses
+
+    def is_retryable(self, status: int) -> bool:
+        return status in self.statuses
+
+    def delay(
+        self,
+        attempt: int,
+        waited: float,
+        retry_after: Optional[float] = None
+    ) -> Optional[float]:
+        """Computes how long to wait before the next attempt.
+
+        Parameters
+        ----------
+        attempt: :class:`int`
+            how many retries have already been made
+        waited: :class:`float`
+            how many seconds have already been spent waiting
+        retry_after: :class:`Optional[float]`
+            the delay asked by the server
+
+        Returns
+        -------
+        :class:`Optional[float]`
+            the delay in seconds, `None` if the request must not be retried anymore
+        """
+
+        if attempt >= self.max_retries:
+            return None
+
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+        if self.budget is not None and waited + delay > self.budget:
+            return None
+
+        return delay
+
+
+NO_RETRY: Final[RetryPolicy] = RetryPolicy(max_retries=0)
@@ -0,0 +1,220 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import os
+import pickle
+import struct
+import zlib
+from contextlib import suppress
+from importlib import import_module
+from typing import Any, Final
+
+import objects
+import objects.pokemon
+from cache import Cache
+from executor import load as load_resource
+from objects.common import BaseObject
+import decoder
+
+
+MAGIC: Final[bytes] = b'POKEAPI-SNAPSHOT'
+VERSION: Final[int] = 1
+FORMATS: Final[tuple[str, ...]] = ('objects', 'json')
+
+# magic, version, format, fingerprint of the models, crc32 and length of the payload
+HEADER: Final[struct.Struct] = struct.Struct('<16sHBxIIQ')
+
+
+def fingerprint() -> int:
+    """Returns a checksum of the fields of every model.
+
+    Pickled models are rebuilt from the values of their slots in order,
+    so a snapshot of objects can only be loaded by models with the same fingerprint.
+    """
+
+    # every model is imported, so that the result does not depend on the ones used so far
+    for package in (objects, objects.pokemon):
+        for name in dir(package):
+            getattr(package, name)
+
+    models: list[type] = []
+    stack: list[type] = [BaseObject]
+
+    while stack:
+        models.append(cls := stack.pop())
+        stack.extend(cls.__subclasses__())
+
+    return zlib.crc32(repr(sorted(
+        (cls.__module__, cls.__qualname__, cls._fields) for cls in models
+    )).encode())
+
+
+def _model_path(cls: type) -> str:
+    return f'{cls.__module__}:{cls.__qualname__}'
+
+
+def _model(path: str) -> type:
+    module, _, qualname = path.partition(':')
+    cls: Any = import_module(module)
+
+    for name in qualname.split('.'):
+        cls = getattr(cls, name)
+
+    if not (isinstance(cls, type) and issubclass(cls, BaseObject)):
+        raise ValueError(f'{path} is not a model')
+
+    return cls
+
+
+def _to_json(key: str, value: Any) -> list[Any]:
+    if isinstance(value, list):
+        return [key, _model_path(type(value[0])) if value else None, [item.to_dict() for item in value]]
+
+    return [key, _model_path(type(value)), value.to_dict()]
+
+
+def save(path: str, cache: Cache, *, format: str = 'objects') -> int:
+    """Writes the entries of a cache into a snapshot file.
+
+    A snapshot is a :data:`HEADER` followed by a zlib-compressed payload.
+    With the `objects` format, the payload is the pickled models, which are the fastest to load
+    but only by the same models, see :func:`fingerprint`.
+    With the `json` format, it is their JSON, decoded again when loaded,
+    and the projected resources are left out.
+    The file is replaced atomically, expired entries are left out.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        the path of the snapshot
+    cache: :class:`Cache`
+        the cache to write
+    format: :class:`str`
+        one of :data:`FORMATS`
+
+    Returns
+    -------
+    :class:`int`
+        the number of entries written
+    """
+
+    if format not in FORMATS:
+        raise ValueError(f'Unknown snapshot format: {format}')
+
+    entries = [(key, cache.pinned[key]) for key in cache.pinned]
+    entries.extend((key, value) for key, value in cache.cache.items() if not cache._expired(key))
+
+    if format == 'objects':
+        payload = pickle.dumps(entries, pickle.HIGHEST_PROTOCOL)
+    else:
+        # projected resources cannot be decoded from their partial JSON
+        entries = [(key, value) for key, value in entries if '?' not in key]
+        payload = decoder.dumps([_to_json(key, value) for key, value in entries])
+
+    payload = zlib.compress(payload, 1)
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        FORMATS.index(format),
+        fingerprint() if format == 'objects' else 0,
+        zlib.crc32(payload),
+        len(payload)
+    )
+
+    try:
+        with open(tmp := f'{path}.tmp', 'wb') as f:
+            f.write(header)
+            f.write(payload)
+
+        os.replace(tmp, path)
+    except BaseException:
+        # the previous snapshot, if any, is left as it was
+        with suppress(FileNotFoundError):
+            os.remove(tmp)
+        raise
+    return len(entries)
+
+
+def load(path: str, cache: Cache, *, lazy: bool = False, intern: bool = False) -> int:
+    """Puts the entries of a snapshot, see :func:`save`, into a cache.
+
+    Their lifetimes start again from now.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        the path of the snapshot
+    cache: :class:`Cache`
+        the cache to fill
+    lazy: :class:`bool`
+        whether the large fields of a `json` snapshot are decoded on first access
+    intern: :class:`bool`
+        whether identical small objects of a `json` snapshot are shared
+
+    Returns
+    -------
+    :class:`int`
+        the number of entries read
+
+    Raises
+    ------
+    :class:`ValueError`
+        the file is not a snapshot, is corrupted, or was written by another version or other models
+    """
+
+    with open(path, 'rb') as f:
+        header = f.read(HEADER.size)
+
+        if len(header) < HEADER.size or header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f'{path} is not a snapshot')
+
+        _, version, format, models, checksum, length = HEADER.unpack(header)
+
+        if version != VERSION:
+            raise ValueError(f'{path} is a snapshot of version {version}, not {VERSION}')
+
+        # the header is not covered by the checksum
+        if format >= len(FORMATS) or length != os.fstat(f.fileno()).st_size - HEADER.size:
+            raise ValueError(f'{path} is corrupted')
+
+        if zlib.crc32(payload := f.read(length)) != checksum:
+            raise ValueError(f'{path} is corrupted')
+
+    payload = zlib.decompress(payload)
+
+    if FORMATS[format] == 'objects':
+        if models != fingerprint():
+            raise ValueError(f'{path} was written by other models, save it with the json format')
+
+        entries = pickle.loads(payload)
+    else:
+        entries = [
+            (key, [] if model is None else load_resource(_model(model), data, lazy=lazy, intern=intern))
+            for key, model, data in decoder.loads(payload)
+        ]
+
+    for key, value in entries:
+        cache.put(key, value)
+
+    return len(entries)
@@ -0,0 +1,145 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import itertools
+import sys
+from typing import Any, Callable, Mapping, Optional
+
+from objects import NamedAPIResource, Url
+from objects.common import BaseObject, Interned, _is_generated, _parse_field, _schema_of
+from objects.pokemon.type import TypeRelations
+from transport import BASE_URL, Response, Transport
+import decoder
+import objects
+import objects.pokemon
+
+
+def reference(endpoint: str, id: int, name: Optional[str] = None) -> dict[str, Any]:
+    """Returns the JSON of a `NamedAPIResource`, or of an `APIResource` without `name`."""
+
+    url = {'url': f'{BASE_URL}/{endpoint}/{id}/'}
+    return url if name is None else {'name': name, **url}
+
+
+class MemoryTransport(Transport):
+    """Serves JSON documents keyed by endpoint, and records the requests.
+
+    Parameters
+    ----------
+    documents: :class:`Mapping[str, Any]`
+        the documents, a :class:`Response` is served as it is
+    """
+
+    def __init__(self, documents: Mapping[str, Any]) -> None:
+        self.documents: Mapping[str, Any] = documents
+        self.requests: list[str] = []
+
+    async def request(self, endpoint: str) -> Response:
+        self.requests.append(endpoint)
+
+        if (document := self.documents.get(endpoint)) is None:
+            return Response(404, {}, b'')
+        if isinstance(document, Response):
+            return document
+
+        return Response(200, {}, decoder.dumps(document))
+
+
+def models() -> list[type]:
+    """Returns every model, with the ones of the modules not imported yet."""
+
+    for package in (objects, objects.pokemon):
+        for name in dir(package):
+            getattr(package, name)
+
+    found: list[type] = []
+    stack: list[type] = [BaseObject]
+
+    while stack:
+        found.append(cls := stack.pop())
+        stack.extend(cls.__subclasses__())
+
+    return sorted((cls for cls in found if cls not in (BaseObject, Interned)), key=lambda cls: (cls.__module__, cls.__qualname__))
+
+
+_ids = itertools.count(1)
+
+
+def _hand_written(model: type, value: Callable[[], str]) -> Optional[dict[str, Any]]:
+    # the documents of the models whose `loads` is written by hand
+    if model is TypeRelations:
+        return {attr: [reference('type', next(_ids), value())] for attr in TypeRelations.__slots__}
+    return None
+
+
+def synthesize(cls: type, items: int = 2, depth: int = 2) -> dict[str, Any]:
+    """Returns a document of a model built from its `_schema`,
+    with distinct values and `items` items in every list.
+
+    Parameters
+    ----------
+    cls: :class:`type`
+        the model
+    items: :class:`int`
+        the number of items in every list
+    depth: :class:`int`
+        how many times a model may contain itself, recursive lists are empty below it
+
+    Raises
+    ------
+    :class:`LookupError`
+        the model contains a model with a hand-written `loads` this function does not know
+    """
+
+    namespace = vars(sys.modules[cls.__module__])
+    data: dict[str, Any] = {}
+
+    for attr, spec in _schema_of(cls).items():
+        _, many, model = _parse_field(spec, namespace)
+        count = items
+
+        def value() -> str:
+            return f'{attr}-{next(_ids)}'
+
+        if model is None:
+            make: Callable[[], Any] = value
+        elif issubclass(model, Url):
+            endpoint = attr.replace('_', '-')
+            if issubclass(model, NamedAPIResource):
+                make = lambda: reference(endpoint, next(_ids), value())
+            else:
+                make = lambda: reference(endpoint, next(_ids))
+        elif not _is_generated(model):
+            if _hand_written(model, value) is None:
+                raise LookupError(f'{model.__qualname__} has a hand-written loads')
+            make = lambda: _hand_written(model, value)
+        elif model is cls:
+            count = items if depth > 0 else 0
+            make = lambda: synthesize(model, items, depth - 1)
+        else:
+            make = lambda: synthesize(model, items, depth)
+
+        data[attr] = [make() for _ in range(count)] if many else make()
+
+    return data
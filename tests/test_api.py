@@ -0,0 +1,124 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import asyncio
+
+import pytest
+
+from api import Client, HTTPException
+from helpers import MemoryTransport, reference
+from transport import Response
+import objects.pokemon
+
+
+def gender(id: int, name: str) -> dict:
+    return {
+        'id': id,
+        'name': name,
+        'pokemon_species_details': [{'rate': 1, 'pokemon_species': reference('pokemon-species', 1, 'bulbasaur')}],
+        'required_for_evolution': [reference('pokemon-species', 2, 'ivysaur')]
+    }
+
+
+DOCUMENTS = {
+    'gender/1': gender(1, 'female'),
+    'gender/2': gender(2, 'male'),
+    'pokemon-shape/1': {
+        'id': 1,
+        'name': 'ball',
+        'awesome_names': [{'awesome_name': 'Pomaceous', 'language': reference('language', 9, 'en')}],
+        'names': [{'name': 'Ball', 'language': reference('language', 9, 'en')}],
+        'pokemon_species': [reference('pokemon-species', 1, 'bulbasaur')]
+    }
+}
+
+
+def test_get_many_awaits_every_getter():
+    async def main():
+        async with Client(transport=MemoryTransport(DOCUMENTS)) as client:
+            genders = await client.get_many('gender', [1, 2, 3])
+            shape = await client.get_pokemon_shape(1)
+            # the cached resources are the models too
+            return genders, shape, await client.get_gender(1)
+
+    (female, male, missing), shape, cached = asyncio.run(main())
+
+    assert isinstance(female, objects.pokemon.Gender) and female.name == 'female'
+    assert male.name == 'male' and missing is None
+    assert cached is female
+    assert isinstance(shape, objects.pokemon.PokemonShape) and shape.awesome_names[0].awesome_name == 'Pomaceous'
+
+
+def test_get_many_concurrency():
+    async def main(concurrency):
+        async with Client(transport=MemoryTransport(DOCUMENTS)) as client:
+            return await client.get_many('gender', [1, 2], concurrency=concurrency)
+
+    assert len(asyncio.run(main(1))) == 2
+
+    with pytest.raises(ValueError):
+        asyncio.run(main(0))
+
+
+def listing(offset: int, count: int, names: list) -> dict:
+    return {
+        'count': count,
+        'next': f'https://pokeapi.co/api/v2/gender?offset={offset + 2}&limit=2' if offset + 2 < count else None,
+        'previous': None,
+        'results': [reference('gender', offset + i + 1, name) for i, name in enumerate(names)]
+    }
+
+
+def list_genders(documents: dict) -> list:
+    async def main():
+        async with Client(transport=MemoryTransport(documents)) as client:
+            return [resource.name async for resource in client.iter_resources('gender', page_size=2)]
+
+    return asyncio.run(main())
+
+
+def test_iter_resources():
+    documents = {
+        'gender?limit=2&offset=0': listing(0, 3, ['female', 'male']),
+        'gender?limit=2&offset=2': listing(2, 3, ['genderless'])
+    }
+
+    assert list_genders(documents) == ['female', 'male', 'genderless']
+    # an endpoint which does not exist is empty
+    assert list_genders({}) == []
+
+
+@pytest.mark.parametrize('status', [403, 404])
+def test_iter_resources_of_a_missing_page(status):
+    documents = {
+        'gender?limit=2&offset=0': listing(0, 3, ['female', 'male']),
+        'gender?limit=2&offset=2': Response(status, {}, b'')
+    }
+
+    # a listing is never cut short silently
+    with pytest.raises(HTTPException) as info:
+        list_genders(documents)
+
+    assert info.value.endpoint == 'gender?limit=2&offset=2'
+    assert info.value.status == (404 if status == 404 else None)
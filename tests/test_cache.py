@@ -0,0 +1,206 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import asyncio
+
+import pytest
+
+from api import Client
+from cache import Cache, NegativeCache
+from helpers import MemoryTransport
+from transport import Response
+import cache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_lru_eviction():
+    c = Cache(max_entries=2)
+    c.put('pokemon/1', 'a')
+    c.put('pokemon/2', 'b')
+    c.get('pokemon/1')
+    c.put('pokemon/3', 'c')
+
+    assert 'pokemon/2' not in c
+    assert c.get('pokemon/1') == 'a' and c.get('pokemon/3') == 'c'
+    assert c.evictions == 1 and len(c) == 2
+
+
+def test_permanent_endpoints_are_never_evicted():
+    c = Cache(max_entries=1, ttl=1)
+    c.put('type/1', 'normal')
+    c.put('pokemon/1', 'a')
+    c.put('pokemon/2', 'b')
+
+    assert c.get('type/1') == 'normal'
+    assert 'pokemon/1' not in c and c.get('pokemon/2') == 'b'
+    assert len(c) == 2
+
+
+def test_ttl(clock):
+    c = Cache(ttl=10, ttls={'move': 100, 'item': None})
+    c.put('pokemon/1', 'a')
+    c.put('move/1', 'b')
+    c.put('item/1', 'c')
+
+    clock[0] += 11
+    assert 'pokemon/1' not in c and c.get('pokemon/1') is None
+    assert c.get('move/1') == 'b'
+
+    clock[0] += 100
+    assert c.get('move/1', 'default') == 'default'
+    assert c.get('item/1') == 'c'
+
+
+def test_put_again_renews_the_ttl(clock):
+    c = Cache(ttl=10)
+    c.put('pokemon/1', 'a')
+    clock[0] += 8
+    c.put('pokemon/1', 'b')
+    clock[0] += 8
+
+    assert c.get('pokemon/1') == 'b'
+
+
+def test_max_bytes():
+    c = Cache(max_bytes=cache.sizeof(['x' * 100]) * 2)
+    for i in range(5):
+        c.put(f'pokemon/{i}', ['x' * 100])
+
+    assert len(c) == 2 and 'pokemon/4' in c
+    assert c.size == sum(c._sizes.values()) <= c.max_bytes
+
+    c.remove('pokemon/4')
+    c.clear()
+    assert c.size == 0 and len(c) == 0
+
+
+
+
+def test_negative_cache_ttl(clock):
+    c = NegativeCache(ttl=10)
+    c.add('pokemon/0')
+
+    assert 'pokemon/0' in c
+    clock[0] += 11
+    assert 'pokemon/0' not in c and len(c) == 0
+    assert c.stats() == {'size': 0, 'hits': 1, 'misses': 1, 'evictions': 0}
+
+
+def test_negative_cache_max_entries():
+    c = NegativeCache(ttl=None, max_entries=2)
+    for i in range(3):
+        c.add(f'pokemon/{i}')
+
+    assert 'pokemon/0' not in c and 'pokemon/2' in c
+    assert c.evictions == 1
+
+    c.discard('pokemon/2')
+    assert 'pokemon/2' not in c and len(c) == 1
+
+
+def test_missing_resources_are_remembered_until_they_expire(clock):
+    async def main():
+        transport = MemoryTransport({})
+
+        async with Client(transport=transport, negative_cache=NegativeCache(ttl=10)) as client:
+            assert await client.get_gender(0) is None
+            assert await client.get_gender(0) is None
+            requests = len(transport.requests)
+
+            # the 404 expired, the endpoint is requested again
+            clock[0] += 11
+            transport.documents['gender/0'] = GENDER
+            gender = await client.get_gender(0)
+            return requests, transport.requests, gender, 'gender/0' in client.http.inexistent_endpoints
+
+    requests, all_requests, gender, missing = asyncio.run(main())
+
+    assert requests == 1
+    assert all_requests == ['gender/0', 'gender/0']
+    assert gender.name == 'female' and not missing
+
+
+GENDER = {'id': 1, 'name': 'female', 'pokemon_species_details': [], 'required_for_evolution': []}
+
+
+class Gated(MemoryTransport):
+    """Holds every request until `open` is set."""
+
+    def __init__(self, documents):
+        super().__init__(documents)
+        self.open = asyncio.Event()
+
+    async def request(self, endpoint: str) -> Response:
+        await self.open.wait()
+        return await super().request(endpoint)
+
+
+def test_concurrent_gets_share_one_request():
+    async def main():
+        transport = Gated({'gender/1': GENDER})
+
+        async with Client(transport=transport) as client:
+            tasks = [asyncio.ensure_future(client.get_gender(1)) for _ in range(5)]
+            await asyncio.sleep(0)
+            transport.open.set()
+            genders = await asyncio.gather(*tasks)
+
+            assert client._cache.inflight == {}
+            return transport.requests, genders
+
+    requests, genders = asyncio.run(main())
+
+    assert requests == ['gender/1']
+    assert all(gender is genders[0] for gender in genders) and genders[0].name == 'female'
+
+
+def test_cancelling_a_caller_keeps_the_shared_request():
+    async def main():
+        transport = Gated({'gender/1': GENDER})
+
+        async with Client(transport=transport) as client:
+            first = asyncio.ensure_future(client.get_gender(1))
+            others = [asyncio.ensure_future(client.get_gender(1)) for _ in range(2)]
+            await asyncio.sleep(0)
+
+            # the first caller started the request
+            first.cancel()
+            await asyncio.sleep(0)
+            transport.open.set()
+            genders = await asyncio.gather(*others)
+
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return transport.requests, genders, client._cache.get('gender/1')
+
+    requests, genders, cached = asyncio.run(main())
+
+    assert requests == ['gender/1']
+    assert genders[0] is genders[1] is cached
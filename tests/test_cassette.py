@@ -0,0 +1,63 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import asyncio
+
+from api import Client
+from cassette import RecordingTransport, ReplayTransport, load
+from retry import RetryPolicy
+from transport import Response, Transport
+
+
+class Throttled(Transport):
+    """Throttles the first request with a lower-case `retry-after`, as some servers send it."""
+
+    def __init__(self) -> None:
+        self.responses = [
+            Response(429, {'retry-after': '0'}, b''),
+            Response(200, {'Content-Type': 'application/json'}, b'{"id": 9, "name": "en"}')
+        ]
+
+    async def request(self, endpoint: str) -> Response:
+        return self.responses.pop(0)
+
+
+def test_replayed_headers_are_case_insensitive(tmp_path):
+    path = str(tmp_path / 'test.cassette')
+    recorder = RecordingTransport(Throttled(), path)
+    asyncio.run(recorder.request('language/9'))
+    asyncio.run(recorder.request('language/9'))
+    recorder.save()
+
+    throttled, ok = (record.response for record in load(path))
+    assert throttled.headers.get('Retry-After') == '0'
+    assert ok.headers['content-type'] == 'application/json'
+
+    async def main():
+        # without the `Retry-After` of the cassette, the backoff would wait for minutes
+        retry = RetryPolicy(backoff=600, max_backoff=600, budget=None)
+        async with Client(transport=ReplayTransport(path), retry=retry) as client:
+            return await asyncio.wait_for(client.http.get('language/9'), 5)
+
+    assert asyncio.run(main()) == {'id': 9, 'name': 'en'}
@@ -0,0 +1,145 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+from __future__ import annotations
+import asyncio
+import sqlite3
+
+import aiohttp
+import pytest
+
+from api import Client
+from crawler import FETCHED, MISSING, PENDING, Crawler, DatabaseTransport
+from helpers import MemoryTransport, reference
+from transport import Response
+import decoder
+
+
+def gender(id: int, name: str) -> dict:
+    return {'id': id, 'name': name, 'pokemon_species_details': [], 'required_for_evolution': []}
+
+
+DOCUMENTS = {
+    'gender?limit=100&offset=0': {
+        'count': 4,
+        'next': None,
+        'previous': None,
+        'results': [reference('gender', id, name) for id, name in enumerate(['female', 'male', 'genderless', 'unknown'], 1)]
+    },
+    'gender/1': gender(1, 'female'),
+    'gender/2': Response(403, {}, b''),
+    # gender/3 does not exist
+}
+
+
+class Broken(MemoryTransport):
+    async def request(self, endpoint: str) -> Response:
+        if endpoint == 'gender/4':
+            raise aiohttp.ClientPayloadError('incomplete body')
+        return await super().request(endpoint)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'pokeapi.sqlite')
+
+
+def crawl(path: str, documents: dict, page_size: int = 100) -> dict[str, int]:
+    async def main():
+        async with Client(transport=Broken(documents)) as client:
+            crawler = Crawler(client, path, endpoints=['gender'], page_size=page_size, checkpoint=1)
+            try:
+                return await crawler.crawl()
+            finally:
+                crawler.close()
+
+    return asyncio.run(main())
+
+
+def statuses(path: str) -> list[tuple[str, int]]:
+    with sqlite3.connect(path) as conn:
+        return conn.execute('SELECT id, status FROM resources ORDER BY position').fetchall()
+
+
+def test_failures_stay_pending(path):
+    # a 403 and an incomplete body fail without aborting the crawl, only the 404 is missing
+    assert crawl(path, DOCUMENTS) == {'fetched': 1, 'missing': 1, 'failed': 2, 'pending': 0, 'unlisted': 0}
+    assert statuses(path) == [('1', FETCHED), ('2', PENDING), ('3', MISSING), ('4', PENDING)]
+
+    # the next crawl fetches them again
+    assert crawl(path, {**DOCUMENTS, 'gender/2': gender(2, 'male')}) == {'fetched': 1, 'missing': 0, 'failed': 1, 'pending': 0, 'unlisted': 0}
+    assert statuses(path) == [('1', FETCHED), ('2', FETCHED), ('3', MISSING), ('4', PENDING)]
+
+
+def page(offset: int, names: list[str]) -> dict:
+    return {
+        'count': 4,
+        'next': f'https://pokeapi.co/api/v2/gender?offset={offset + 2}&limit=2' if offset + 2 < 4 else None,
+        'previous': None,
+        'results': [reference('gender', offset + i + 1, name) for i, name in enumerate(names)]
+    }
+
+
+PAGES = {
+    'gender?limit=2&offset=0': page(0, ['female', 'male']),
+    'gender?limit=2&offset=2': page(2, ['genderless', 'unknown']),
+    **{f'gender/{id}': gender(id, name) for id, name in enumerate(['female', 'male', 'genderless', 'unknown'], 1)}
+}
+
+
+@pytest.mark.parametrize('failure', [Response(403, {}, b''), None])
+def test_resume_after_a_failed_page(path, failure):
+    # the second page fails, then a missing first page
+    documents = {**PAGES, 'gender?limit=2&offset=2': failure}
+
+    assert crawl(path, documents, 2) == {'fetched': 0, 'missing': 0, 'failed': 0, 'pending': 0, 'unlisted': 1}
+    assert crawl(path, {}, 2)['unlisted'] == 1
+    assert statuses(path) == []
+
+    # nothing was recorded, the endpoint is listed again once the pages are back (gender/4 is broken)
+    assert crawl(path, PAGES, 2) == {'fetched': 3, 'missing': 0, 'failed': 1, 'pending': 0, 'unlisted': 0}
+    assert statuses(path) == [('1', FETCHED), ('2', FETCHED), ('3', FETCHED), ('4', PENDING)]
+
+
+def test_listing_short_of_the_count(path):
+    documents = {**PAGES, 'gender?limit=2&offset=2': {**page(2, ['genderless']), 'next': None}}
+
+    assert crawl(path, documents, 2)['unlisted'] == 1
+    assert statuses(path) == []
+
+
+def test_database_transport(path):
+    crawl(path, DOCUMENTS)
+
+    async def main():
+        # closed with the client
+        async with Client(transport=(transport := DatabaseTransport(path))) as client:
+            female = await client.get_gender('female')
+            names = [resource.name async for resource in client.iter_resources('gender', page_size=3)]
+            return female, names, [await transport.request(f'gender?{query}') for query in ('limit=x', 'limit=-1', 'offset=1&limit=2')]
+
+    female, names, (bad, negative, page) = asyncio.run(main())
+
+    assert female.name == 'female'
+    assert names == ['female', 'male', 'genderless', 'unknown']
+    assert bad.status == negative.status == 400
+    assert page.status == 200
+    assert [result['name'] for result in decoder.loads(page.body)['results']] == ['male', 'genderless']
@@ -0,0 +1,94 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+from __future__ import annotations
+import importlib.util
+import json
+import sys
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+import decoder
+
+
+def fake_orjson() -> ModuleType:
+    module = ModuleType('orjson')
+    module.loads = lambda data: ('orjson', json.loads(data))
+    module.dumps = lambda data: b'orjson'
+    return module
+
+
+def fake_msgspec() -> ModuleType:
+    module = ModuleType('msgspec')
+    module.json = SimpleNamespace(
+        decode=lambda data: ('msgspec', json.loads(data)),
+        encode=lambda data: b'msgspec'
+    )
+    return module
+
+
+def load(monkeypatch, **modules) -> ModuleType:
+    """Imports a new copy of `decoder` with the given optional modules, `None` for a missing one."""
+
+    for name, module in modules.items():
+        # a `None` entry of sys.modules makes the import raise ImportError
+        monkeypatch.setitem(sys.modules, name, module)
+
+    spec = importlib.util.spec_from_file_location('fresh_decoder', decoder.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_orjson_is_preferred(monkeypatch):
+    module = load(monkeypatch, orjson=fake_orjson(), msgspec=fake_msgspec())
+
+    assert module.FASTEST == 'orjson'
+    assert module.loads(b'[1]') == ('orjson', [1]) and module.dumps([1]) == b'orjson'
+    assert module.get_decoder('msgspec')(b'[1]') == ('msgspec', [1])
+    assert module.get_encoder('json')([1]) == b'[1]'
+
+
+def test_msgspec_without_orjson(monkeypatch):
+    module = load(monkeypatch, orjson=None, msgspec=fake_msgspec())
+
+    assert module.FASTEST == 'msgspec'
+    assert module.loads(b'[1]') == ('msgspec', [1]) and module.dumps([1]) == b'msgspec'
+
+    with pytest.raises(ValueError):
+        module.get_decoder('orjson')
+
+
+def test_json_fallback(monkeypatch):
+    module = load(monkeypatch, orjson=None, msgspec=None)
+
+    assert module.FASTEST == 'json'
+    assert sorted(module.DECODERS) == sorted(module.ENCODERS) == ['json']
+    assert module.loads(b'{"name": "p\\u00e9"}') == {'name': 'pé'}
+    # compact and UTF-8, as the other libraries write it
+    assert module.dumps({'name': 'pé', 'id': 1}) == '{"name":"pé","id":1}'.encode()
+
+    for name in ('orjson', 'msgspec', 'simdjson'):
+        with pytest.raises(ValueError):
+            module.get_decoder(name)
+        with pytest.raises(ValueError):
+            module.get_encoder(name)
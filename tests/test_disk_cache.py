@@ -0,0 +1,101 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+from __future__ import annotations
+import asyncio
+import sqlite3
+
+import pytest
+
+from api import Client
+from cache import DiskCache
+from helpers import MemoryTransport
+import cache
+
+
+GENDER = {'id': 1, 'name': 'female', 'pokemon_species_details': [], 'required_for_evolution': []}
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'cache.sqlite')
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(cache.time, 'time', lambda: now[0])
+    return now
+
+
+def test_round_trip(path):
+    disk = DiskCache(path)
+    disk.put_sync('gender/1', GENDER)
+    disk.put_sync('gender/2', b'{"id": 2}')
+    disk.put_many_sync([('gender/3', {'id': 3}), ('gender/4', b'{"id": 4}')])
+
+    assert disk.get_sync('gender/1') == GENDER
+    # a body is stored and returned as it is
+    assert disk.get_sync('gender/2', raw=True) == b'{"id": 2}'
+    assert disk.get_sync('gender/4') == {'id': 4}
+    assert disk.get_sync('gender/5') is None
+    assert 'gender/3' in disk and 'gender/5' not in disk
+    assert len(disk) == 4
+    assert asyncio.run(disk.get('gender/1')) == GENDER
+
+    disk.close()
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+
+def test_expiry(path, clock):
+    disk = DiskCache(path, ttl=60)
+    disk.put_sync('gender/1', GENDER)
+
+    clock[0] += 59
+    assert disk.get_sync('gender/1') == GENDER
+
+    clock[0] += 2
+    assert disk.get_sync('gender/1') is None and 'gender/1' not in disk
+
+    # stored again, it is served again
+    disk.put_sync('gender/1', GENDER)
+    assert disk.get_sync('gender/1') == GENDER
+
+    # without a ttl, a response never expires
+    clock[0] += 10 ** 6
+    assert DiskCache(path).get_sync('gender/1') == GENDER
+
+
+def test_a_new_client_reads_the_responses_of_an_earlier_one(path):
+    async def get(documents):
+        transport = MemoryTransport(documents)
+
+        async with Client(transport=transport, disk_cache=path) as client:
+            return await client.get_gender(1), transport.requests
+
+    first, requests = asyncio.run(get({'gender/1': GENDER}))
+    assert first.name == 'female' and requests == ['gender/1']
+
+    # served from the file, without any request
+    second, requests = asyncio.run(get({}))
+    assert second.name == 'female' and requests == []
@@ -0,0 +1,73 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+from __future__ import annotations
+import asyncio
+
+import pytest
+
+from executor import DecodeExecutor
+from helpers import reference, synthesize
+import decoder
+import objects.pokemon
+
+
+# a response repeating a small object
+POKEMON = synthesize(objects.pokemon.Pokemon)
+POKEMON['types'] = [{'slot': 1, 'type': reference('type', 12, 'grass')}] * 2
+BODY = decoder.dumps(POKEMON)
+
+
+@pytest.fixture(scope='module')
+def executor():
+    # every response is decoded in a process
+    with DecodeExecutor(threshold=0, max_workers=1) as executor:
+        yield executor
+
+
+def decode(executor, **kwargs):
+    return asyncio.run(executor.decode(objects.pokemon.Pokemon, BODY, **kwargs))
+
+
+def test_offloaded_objects_are_interned(executor):
+    first, second = decode(executor, intern=True).types
+    assert first is second
+
+    first, second = decode(executor).types
+    assert first is not second
+    assert first.to_dict() == second.to_dict() == POKEMON['types'][0]
+
+
+def test_offloaded_projection(executor):
+    pokemon = decode(executor, fields=['name'])
+
+    assert pokemon.name == POKEMON['name']
+    assert not hasattr(pokemon, 'types')
+
+
+def test_stats(executor):
+    offloaded = executor.stats()['offloaded']
+    decode(executor)
+    stats = executor.stats()
+
+    assert stats['offloaded'] == offloaded + 1
+    assert stats['inline'] == 0
+    assert stats['unpickle_seconds'] > 0
@@ -0,0 +1,157 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+from __future__ import annotations
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from helpers import models, reference, synthesize
+from objects import Url
+from objects.common import BaseObject, Lazy, _is_generated, _parse_field, _schema_of, lazy_decoding, peek
+import objects
+import objects.pokemon
+
+
+GENERATED = [cls for cls in models() if _is_generated(cls)]
+
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+def describe(obj: Any) -> Any:
+    # the decoded objects as JSON: the model and the fields set of every object,
+    # the endpoint, id and name of every reference
+    if isinstance(obj, Url):
+        return {'model': type(obj).__name__, 'endpoint': obj._endpoint, 'id': obj._id, 'name': getattr(obj, 'name', None)}
+    if isinstance(obj, BaseObject):
+        return {'model': type(obj).__qualname__, **{attr: describe(getattr(obj, attr)) for attr in obj._fields if hasattr(obj, attr)}}
+    if isinstance(obj, list):
+        return [describe(item) for item in obj]
+    return obj
+
+
+def assert_same(a: Any, b: Any, path: str = '') -> None:
+    assert type(a) is type(b), path
+
+    if isinstance(a, BaseObject):
+        for attr in a._fields:
+            assert hasattr(a, attr) == hasattr(b, attr), f'{path}.{attr}'
+            if hasattr(a, attr):
+                assert_same(getattr(a, attr), getattr(b, attr), f'{path}.{attr}')
+    elif isinstance(a, list):
+        assert len(a) == len(b), path
+        for i, (x, y) in enumerate(zip(a, b)):
+            assert_same(x, y, f'{path}[{i}]')
+    else:
+        assert a == b, path
+
+
+def document(cls: type) -> dict[str, Any]:
+    try:
+        return synthesize(cls)
+    except LookupError as e:
+        pytest.skip(str(e))
+
+
+def decodes_whole(cls: type) -> bool:
+    # whether every model the class contains has a generated loader
+    namespace = vars(sys.modules[cls.__module__])
+    models = [_parse_field(spec, namespace)[2] for spec in _schema_of(cls).values()]
+    return all(model is cls or _is_generated(model) and decodes_whole(model) for model in models if model is not None)
+
+
+@pytest.mark.parametrize('name, cls', [
+    pytest.param('move-1', objects.Move, id='move-1'),
+    pytest.param('pokemon-1', objects.pokemon.Pokemon, id='pokemon-1'),
+    pytest.param('type-12', objects.pokemon.Type, id='type-12')
+])
+def test_generated_loads(name, cls):
+    # the expected objects are written down in `<name>.expected.json`
+    data = json.loads((FIXTURES / f'{name}.json').read_text(encoding='utf-8'))
+    expected = json.loads((FIXTURES / f'{name}.expected.json').read_text(encoding='utf-8'))
+
+    assert describe(cls.loads(data)) == expected
+
+    with lazy_decoding():
+        assert describe(cls.loads(data)) == expected
+
+
+def test_generated_loads_of_a_move():
+    move = objects.Move.loads(json.loads((FIXTURES / 'move-1.json').read_text(encoding='utf-8')))
+
+    assert move.name == 'pound' and move.power == 40 and move.effect_chance is None
+    assert [resource.name for resource in move.contest_combos.normal.use_before] == ['double-slap', 'headbutt']
+    assert move.contest_combos.normal.use_after is None and move.contest_combos.super.use_before is None
+    assert move.contest_effect.url == 'https://pokeapi.co/api/v2/contest-effect/1/'
+    assert move.effect_entries[0].short_effect == 'Inflicts regular damage with no additional effect.'
+    assert move.meta.min_hits is None and move.meta.ailment.name == 'none'
+    assert move.learned_by_pokemon[1].name == 'jigglypuff'
+
+
+@pytest.mark.parametrize('cls', [cls for cls in GENERATED if decodes_whole(cls)], ids=lambda cls: cls.__qualname__)
+def test_to_dict_round_trip(cls):
+    data = document(cls)
+    assert cls.loads(data).to_dict() == data
+
+
+def test_generated_loads_of_optional_fields():
+    data = document(objects.pokemon.PokemonSpecies)
+    data['evolves_from_species'] = None
+    del data['habitat']
+
+    species = objects.pokemon.PokemonSpecies.loads(data)
+    assert species.evolves_from_species is None and species.habitat is None
+
+    with pytest.raises(KeyError):
+        del data['name']
+        objects.pokemon.PokemonSpecies.loads(data)
+
+
+def test_generated_loads_of_a_pokemon():
+    data = document(objects.pokemon.Pokemon)
+    data['species'] = reference('pokemon-species', 25, 'pikachu')
+    pokemon = objects.pokemon.Pokemon.loads(data)
+
+    assert pokemon.species.name == 'pikachu'
+    assert pokemon.species.url == data['species']['url']
+    assert pokemon.stats[1].base_stat == data['stats'][1]['base_stat']
+    assert pokemon.moves[0].version_group_details[1].level_learned_at == data['moves'][0]['version_group_details'][1]['level_learned_at']
+
+
+@pytest.mark.parametrize('cls', [cls for cls in GENERATED if cls._lazy_fields], ids=lambda cls: cls.__qualname__)
+def test_lazy_round_trip(cls):
+    data = document(cls)
+
+    with lazy_decoding():
+        obj = cls.loads(data)
+
+    # the lazy fields are kept as JSON until they are accessed
+    for attr in cls._lazy_fields:
+        assert type(peek(obj, attr)) is Lazy and peek(obj, attr).data is data[attr]
+
+    assert_same(obj, cls.loads(data))
+
+    for attr in cls._lazy_fields:
+        assert type(peek(obj, attr)) is not Lazy
@@ -0,0 +1,74 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+from __future__ import annotations
+import subprocess
+import sys
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+import objects
+import objects.pokemon
+
+
+@pytest.mark.parametrize('package', [objects, objects.pokemon], ids=lambda package: package.__name__)
+def test_lazy_names(package):
+    for module, names in package._lazy_modules.items():
+        submodule = import_module(f'.{module}', package.__name__)
+        assert getattr(package, module) is submodule
+
+        for name in names:
+            assert getattr(package, name) is getattr(submodule, name)
+            assert name in dir(package)
+
+    with pytest.raises(AttributeError):
+        package.Nothing
+
+
+def test_names_imported_by_the_modules():
+    # re-exported by the star imports of earlier versions
+    assert objects.AbilityEffectChange is objects.pokemon.AbilityEffectChange
+    assert objects.pokemon.NamedAPIResource is objects.NamedAPIResource
+    assert objects.pokemon.Name is objects.Name
+    assert objects.pokemon.BaseObject is objects.BaseObject
+    assert objects.berry.Berry is objects.Berry
+
+
+
+@pytest.mark.parametrize('module', ['objects.common', 'objects.models'])
+def test_star_imports(module):
+    namespace = {}
+    exec(f'from {module} import *', namespace)
+    del namespace['__builtins__']
+
+    assert sorted(namespace) == sorted(import_module(module).__all__)
+    # neither the modules nor the typing helpers they use are re-exported
+    assert not {'sys', 'weakref', 'partial', 'wraps', 'ContextVar', 'Optional', 'TypeVar'} & set(namespace)
+    assert all(getattr(objects, name) is value for name, value in namespace.items())
+
+
+def test_models_are_imported_on_first_access():
+    code = 'import sys, objects, objects.pokemon; print(*sorted(name for name in sys.modules if name.startswith("objects.")))'
+    output = subprocess.run([sys.executable, '-c', code], cwd=Path(__file__).parent.parent, capture_output=True, text=True, check=True).stdout
+
+    assert output.split() == ['objects.common', 'objects.models', 'objects.pokemon']
@@ -0,0 +1,105 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+from __future__ import annotations
+import copy
+import pickle
+
+import pytest
+
+from helpers import models, reference, synthesize
+from objects import APIResource, NamedAPIResource
+from objects.common import Lazy, _is_generated, interning, lazy_decoding, peek
+import objects.pokemon
+
+
+PROTOCOLS = range(2, pickle.HIGHEST_PROTOCOL + 1)
+
+
+def document(cls):
+    try:
+        return synthesize(cls)
+    except LookupError as e:
+        pytest.skip(str(e))
+
+
+def round_trip(obj, protocol=pickle.HIGHEST_PROTOCOL):
+    return pickle.loads(pickle.dumps(obj, protocol))
+
+
+@pytest.mark.parametrize('cls', [cls for cls in models() if _is_generated(cls)], ids=lambda cls: cls.__qualname__)
+def test_round_trip(cls):
+    obj = cls.loads(document(cls))
+    copied = round_trip(obj)
+
+    assert type(copied) is cls
+    assert copied.to_dict() == obj.to_dict()
+    assert copy.deepcopy(obj).to_dict() == obj.to_dict()
+
+
+@pytest.mark.parametrize('protocol', PROTOCOLS)
+def test_round_trip_protocols(protocol):
+    data = document(objects.pokemon.Pokemon)
+    pokemon = objects.pokemon.Pokemon.loads(data)
+
+    assert round_trip(pokemon, protocol).to_dict() == pokemon.to_dict()
+
+
+def test_lazy_fields_stay_undecoded():
+    data = document(objects.pokemon.Pokemon)
+
+    with lazy_decoding():
+        pokemon = objects.pokemon.Pokemon.loads(data)
+
+    copied = round_trip(pokemon)
+    assert type(peek(copied, 'moves')) is Lazy
+    assert copied.moves[0].move.name == data['moves'][0]['move']['name']
+    assert copied.to_dict() == objects.pokemon.Pokemon.loads(data).to_dict()
+
+
+def test_unset_fields_stay_unset():
+    pokemon = objects.pokemon.Pokemon.loads(document(objects.pokemon.Pokemon)).project(['name', 'stats'])
+    copied = round_trip(pokemon)
+
+    assert copied.name == pokemon.name
+    assert copied.stats[0].base_stat == pokemon.stats[0].base_stat
+    assert not hasattr(copied, 'moves')
+
+
+def test_references():
+    named = NamedAPIResource.loads(reference('type', 12, 'grass'))
+    unnamed = APIResource.loads(reference('evolution-chain', 1))
+
+    assert round_trip(named).to_dict() == named.to_dict()
+    assert round_trip(unnamed).url == unnamed.url
+    # a reference pickles as its endpoint, id and name, not its url
+    assert b'pokeapi.co' not in pickle.dumps(named, pickle.HIGHEST_PROTOCOL)
+
+
+def test_shared_objects_stay_shared():
+    data = document(objects.pokemon.Pokemon)
+    data['types'] = [{'slot': 1, 'type': reference('type', 12, 'grass')}] * 2
+
+    with interning():
+        pokemon = objects.pokemon.Pokemon.loads(data)
+
+    first, second = round_trip(pokemon).types
+    assert first is second
@@ -0,0 +1,100 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+from __future__ import annotations
+import asyncio
+
+import pytest
+
+from api import Client
+from helpers import MemoryTransport, reference, synthesize
+from objects import NamedAPIResource
+from objects.common import compile_projection
+import objects.pokemon
+
+
+def test_projection_decodes_only_the_fields():
+    species = synthesize(objects.pokemon.PokemonSpecies)
+    # the other fields are neither read nor decoded
+    projected = compile_projection(objects.pokemon.PokemonSpecies, ('name', 'color'))({'name': 'bulbasaur', 'color': species['color']})
+
+    assert projected.name == 'bulbasaur'
+    assert projected.color.name == species['color']['name']
+    assert not hasattr(projected, 'varieties')
+
+    with pytest.raises(KeyError):
+        objects.pokemon.PokemonSpecies.loads({'name': 'bulbasaur'})
+
+
+def test_projection_matches_project():
+    data = synthesize(objects.pokemon.Pokemon)
+    fields = ('stats', 'types', 'id')
+    projected = compile_projection(objects.pokemon.Pokemon, fields)(data)
+
+    assert projected.to_dict() == objects.pokemon.Pokemon.loads(data).project(fields).to_dict()
+    assert compile_projection(objects.pokemon.Pokemon, fields) is compile_projection(objects.pokemon.Pokemon, fields)
+
+
+def test_project_inherited_fields():
+    # `_endpoint` and `_id` are declared on the base of `NamedAPIResource`
+    resource = NamedAPIResource.loads(reference('type', 10, 'fire'))
+    projected = resource.project(['_id', 'name'])
+
+    assert '_id' not in NamedAPIResource.__slots__
+    assert projected._id == 10 and projected.name == 'fire'
+
+    with pytest.raises(ValueError):
+        resource.project(['nickname'])
+    with pytest.raises(ValueError):
+        compile_projection(objects.pokemon.Type, ['nickname'])
+
+
+def test_fields_of_unsupported_getters():
+    gender = {'id': 1, 'name': 'female', 'pokemon_species_details': [], 'required_for_evolution': [reference('pokemon-species', 2, 'ivysaur')]}
+
+    async def main():
+        async with Client(transport=MemoryTransport({'gender/1': gender})) as client:
+            with pytest.raises(TypeError):
+                await client.get_gender(1, fields=['name'])
+            # rejected on a cache hit too
+            await client.get_gender(1)
+            with pytest.raises(TypeError):
+                await client.get_gender(1, fields=['name'])
+
+    asyncio.run(main())
+
+
+def test_unknown_fields_of_a_cached_resource():
+    pokemon = synthesize(objects.pokemon.Pokemon)
+    transport = MemoryTransport({'pokemon/1': pokemon})
+
+    async def main():
+        async with Client(transport=transport) as client:
+            with pytest.raises(ValueError):
+                await client.get_pokemon(1, fields=['bogus'])
+            # rejected before the cache, which holds the whole resource
+            await client.get_pokemon(1)
+            with pytest.raises(ValueError):
+                await client.get_pokemon(1, fields=['name', 'bogus'])
+            assert (await client.get_pokemon(1, fields=['name'])).name == pokemon['name']
+
+    asyncio.run(main())
+    assert transport.requests == ['pokemon/1']
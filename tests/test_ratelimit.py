@@ -0,0 +1,156 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+from __future__ import annotations
+import asyncio
+
+import pytest
+
+from ratelimit import AdaptiveLimiter, RateLimiter, TokenBucket
+import ratelimit
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    slept = []
+    sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+        await sleep(0)
+
+    monkeypatch.setattr(ratelimit.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(ratelimit.asyncio, 'sleep', fake_sleep)
+    return now, slept
+
+
+def test_capacity_defaults_to_the_rate():
+    assert TokenBucket(5).capacity == 5
+    assert TokenBucket(0.5).capacity == 1
+    assert TokenBucket(5, 2).capacity == 2
+    assert RateLimiter(rate=5, burst=10).bucket.capacity == 10
+
+
+def test_burst_then_refill(clock):
+    now, slept = clock
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    async def main():
+        # the burst is served at once
+        for _ in range(3):
+            await bucket.acquire()
+        assert slept == []
+
+        # then one token every 1 / rate seconds
+        await bucket.acquire()
+        await bucket.acquire()
+
+    asyncio.run(main())
+
+    assert slept == [0.5, 0.5]
+    assert bucket.tokens == 0
+
+
+def test_refill_is_capped(clock):
+    now, _ = clock
+    bucket = TokenBucket(rate=2, capacity=3)
+    bucket.tokens = 0
+
+    now[0] += 1
+    bucket._refill()
+    assert bucket.tokens == 2
+
+    now[0] += 100
+    bucket._refill()
+    assert bucket.tokens == 3
+
+
+def test_window_grows_additively():
+    limiter = AdaptiveLimiter(initial=4, maximum=5)
+
+    async def operations(count):
+        for _ in range(count):
+            await limiter.acquire()
+            limiter.release(0.1)
+
+    # a full window of fast operations grows it by about one slot
+    asyncio.run(operations(4))
+    assert 4.9 < limiter.window < 5 and limiter.limit == 4
+
+    # up to the maximum
+    asyncio.run(operations(10))
+    assert limiter.window == limiter.limit == 5
+
+
+def test_slow_operations_do_not_grow_the_window():
+    limiter = AdaptiveLimiter(initial=4, tolerance=2.0)
+    limiter.in_flight = 2
+    limiter.release(0.1)
+    window = limiter.window
+    limiter.release(0.3)
+
+    assert limiter.window == window
+    assert limiter.best_latency == 0.1
+
+
+def test_window_shrinks_multiplicatively_on_429():
+    limiter = AdaptiveLimiter(initial=16, minimum=2, decrease=0.5)
+    limiter.in_flight = 4
+
+    limiter.release(0.1, throttled=True)
+    assert limiter.window == 8
+    limiter.release(0.1, throttled=True)
+    limiter.release(0.1, throttled=True)
+    limiter.release(0.1, throttled=True)
+    assert limiter.window == 2 and limiter.throttled == 4
+
+
+def test_waiters_are_served_as_the_window_allows():
+    limiter = AdaptiveLimiter(initial=2, minimum=1, decrease=0.5)
+
+    async def main():
+        await limiter.acquire()
+        await limiter.acquire()
+        waiters = [asyncio.ensure_future(limiter.acquire()) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 2
+
+        # a 429 halves the window, the slot it frees is not given away
+        limiter.release(0.1, throttled=True)
+        await asyncio.sleep(0)
+        assert limiter.in_flight == 1 and limiter.queue_depth == 2
+
+        # a success grows the window of 1 back to 2
+        limiter.release(0.1)
+        await asyncio.sleep(0)
+        assert all(waiter.done() for waiter in waiters)
+        assert limiter.in_flight == limiter.limit == 2
+
+        # a cancelled waiter leaves the queue
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 0 and limiter.in_flight == 2
+
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import asyncio
+
+import pytest
+
+from api import Client, HTTPException
+from benchmarks.server import FakeServer, Faults
+from helpers import MemoryTransport
+from retry import RetryPolicy
+from transport import HttpTransport
+
+LANGUAGE = {'id': 9, 'name': 'en', 'official': True, 'iso639': 'en', 'iso3166': 'us', 'names': []}
+
+
+def serve(faults: Faults, endpoint: str, retries: int = 0):
+    async def main():
+        server = FakeServer(MemoryTransport({'language/9': LANGUAGE}), faults)
+        url = await server.start()
+
+        try:
+            async with Client(
+                transport=HttpTransport(base_url=url),
+                retry=RetryPolicy(max_retries=retries, backoff=0)
+            ) as client:
+                try:
+                    return await client.http.get(endpoint), server.stats
+                except HTTPException as e:
+                    return e, server.stats
+        finally:
+            await server.stop()
+
+    return asyncio.run(main())
+
+
+def test_responses_and_bandwidth():
+    assert serve(Faults(), 'language/9')[0] == LANGUAGE
+    assert serve(Faults(bandwidth=64), 'language/9')[0] == LANGUAGE
+    assert serve(Faults(), 'language/10')[0] is None
+
+
+@pytest.mark.parametrize('faults, status', [
+    (Faults(reset=1.0), None),
+    (Faults(throttle=1.0, retry_after=0), 429),
+    (Faults(server_error=1.0, seed=0), (500, 502, 503))
+])
+def test_faults_are_retried(faults, status):
+    error, stats = serve(faults, 'language/9', retries=2)
+
+    assert isinstance(error, HTTPException)
+    assert error.status in status if isinstance(status, tuple) else error.status == status
+    assert stats['requests'] >= 3
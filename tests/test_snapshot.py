@@ -0,0 +1,173 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+from __future__ import annotations
+import os
+
+import pytest
+
+from cache import Cache
+from helpers import models, synthesize
+from objects.common import _is_generated
+import objects.pokemon
+import snapshot
+
+
+POKEMON = synthesize(objects.pokemon.Pokemon)
+TYPE = synthesize(objects.pokemon.Type)
+
+
+def filled() -> Cache:
+    cache = Cache()
+    cache.put('pokemon/1', objects.pokemon.Pokemon.loads(POKEMON))
+    cache.put('type/1', objects.pokemon.Type.loads(TYPE))
+    cache.put('pokemon/1/encounters', [])
+    cache.put('pokemon/1?fields=name', objects.pokemon.Pokemon.loads(POKEMON).project(['name']))
+    return cache
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / 'cache.snapshot')
+    assert snapshot.save(path, filled()) == 4
+    return path
+
+
+def corrupt(path: str, offset: int, value: bytes) -> None:
+    with open(path, 'r+b') as f:
+        f.seek(offset)
+        f.write(value)
+
+
+def test_objects_round_trip(path):
+    cache = Cache()
+
+    assert snapshot.load(path, cache) == 4
+    assert cache.get('pokemon/1').to_dict() == POKEMON
+    assert cache.get('type/1').to_dict() == TYPE
+    assert cache.get('pokemon/1/encounters') == []
+    assert cache.get('pokemon/1?fields=name').name == POKEMON['name']
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_json_round_trip(tmp_path, lazy):
+    path = str(tmp_path / 'cache.snapshot')
+    cache = Cache()
+
+    # the projected resource is left out
+    assert snapshot.save(path, filled(), format='json') == 3
+    assert snapshot.load(path, cache, lazy=lazy) == 3
+    assert cache.get('pokemon/1').to_dict() == POKEMON
+    assert cache.get('type/1').to_dict() == TYPE
+    assert cache.get('pokemon/1/encounters') == []
+    assert 'pokemon/1?fields=name' not in cache
+
+
+@pytest.mark.parametrize('cls', [cls for cls in models() if _is_generated(cls)], ids=lambda cls: cls.__qualname__)
+def test_json_round_trip_of_every_model(tmp_path, cls):
+    try:
+        data = synthesize(cls)
+    except LookupError as e:
+        pytest.skip(str(e))
+
+    path, cache = str(tmp_path / 'cache.snapshot'), Cache()
+    cache.put('resource/1', cls.loads(data))
+    snapshot.save(path, cache, format='json')
+    snapshot.load(path, cache := Cache())
+
+    # nothing is lost on the way through to_dict
+    assert type(cache.get('resource/1')) is cls
+    assert cache.get('resource/1').to_dict() == data
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        snapshot.save(str(tmp_path / 'cache.snapshot'), filled(), format='yaml')
+
+
+def test_bad_magic(path):
+    corrupt(path, 0, b'NOT-A-SNAPSHOT!!')
+
+    with pytest.raises(ValueError, match='not a snapshot'):
+        snapshot.load(path, Cache())
+
+
+def test_short_file(tmp_path):
+    (path := tmp_path / 'cache.snapshot').write_bytes(snapshot.MAGIC)
+
+    with pytest.raises(ValueError, match='not a snapshot'):
+        snapshot.load(str(path), Cache())
+
+
+def test_other_version(path):
+    corrupt(path, len(snapshot.MAGIC), (snapshot.VERSION + 1).to_bytes(2, 'little'))
+
+    with pytest.raises(ValueError, match='version'):
+        snapshot.load(path, Cache())
+
+
+def test_bad_format(path):
+    corrupt(path, len(snapshot.MAGIC) + 2, bytes([len(snapshot.FORMATS)]))
+
+    with pytest.raises(ValueError, match='corrupted'):
+        snapshot.load(path, Cache())
+
+
+@pytest.mark.parametrize('size', [-1, 1])
+def test_bad_length(path, size):
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) + size)
+
+    with pytest.raises(ValueError, match='corrupted'):
+        snapshot.load(path, Cache())
+
+
+def test_bad_checksum(path):
+    corrupt(path, snapshot.HEADER.size, b'\xff')
+
+    with pytest.raises(ValueError, match='corrupted'):
+        snapshot.load(path, Cache())
+
+
+def test_other_models(path, monkeypatch):
+    monkeypatch.setattr(snapshot, 'fingerprint', lambda: 0)
+    cache = Cache()
+
+    with pytest.raises(ValueError, match='other models'):
+        snapshot.load(path, cache)
+    assert len(cache) == 0
+
+
+def test_failed_save_keeps_the_snapshot(path, monkeypatch):
+    with open(path, 'rb') as f:
+        saved = f.read()
+
+    def replace(src, dst):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(snapshot.os, 'replace', replace)
+
+    with pytest.raises(OSError):
+        snapshot.save(path, Cache())
+
+    assert not os.path.exists(f'{path}.tmp')
+    with open(path, 'rb') as f:
+        assert f.read() == saved
@@ -0,0 +1,91 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import asyncio
+import json
+import os
+
+import pytest
+
+from helpers import reference
+from transport import FileSystemTransport, Transport
+import decoder
+
+
+@pytest.fixture
+def dump(tmp_path):
+    def write(path, document):
+        os.makedirs(directory := os.path.join(tmp_path, 'api', 'v2', path), exist_ok=True)
+        with open(os.path.join(directory, 'index.json'), 'w') as f:
+            json.dump(document, f)
+
+    results = [reference('pokemon', i, name) for i, name in enumerate(('bulbasaur', 'ivysaur', 'venusaur'), 1)]
+    write('pokemon', {'count': 3, 'next': None, 'previous': None, 'results': results})
+    write('pokemon/1', {'id': 1, 'name': 'bulbasaur'})
+    write('pokemon/1/encounters', [])
+    return tmp_path
+
+
+def request(transport, endpoint):
+    return asyncio.run(transport.request(endpoint))
+
+
+def test_transport_is_abstract():
+    with pytest.raises(TypeError):
+        Transport()
+
+
+def test_resources_and_names(dump):
+    transport = FileSystemTransport(str(dump))
+
+    assert decoder.loads(request(transport, 'pokemon/bulbasaur').body)['id'] == 1
+    assert request(transport, 'pokemon/1/encounters').body == b'[]'
+    assert request(transport, 'pokemon/2').status == 404
+    assert request(transport, 'pokemon/mew').status == 404
+    assert request(transport, 'pokemon/../pokemon').status == 404
+
+
+def test_lists(dump):
+    transport = FileSystemTransport(str(dump))
+    page = decoder.loads(request(transport, 'pokemon?limit=2&offset=1').body)
+
+    assert page['count'] == 3 and page['next'] is None
+    assert [result['name'] for result in page['results']] == ['ivysaur', 'venusaur']
+
+    # the list is parsed once, and reused for every page and name
+    os.remove(os.path.join(dump, 'api', 'v2', 'pokemon', 'index.json'))
+    assert decoder.loads(request(transport, 'pokemon?limit=1').body)['results'][0]['name'] == 'bulbasaur'
+    assert request(transport, 'pokemon/bulbasaur').status == 200
+
+
+@pytest.mark.parametrize('query', ['limit=abc', 'offset=1.5', 'limit=-1'])
+def test_malformed_list_query(dump, query):
+    assert request(FileSystemTransport(str(dump)), f'pokemon?{query}').status == 400
+
+
+def test_unreadable_file_is_a_server_error(dump):
+    # a directory where a file is expected fails with `IsADirectoryError`
+    os.makedirs(os.path.join(dump, 'api', 'v2', 'pokemon', '2', 'index.json'))
+
+    assert request(FileSystemTransport(str(dump)), 'pokemon/2').status == 500
@@ -0,0 +1,266 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2023-present Yumax-panda
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Final, Iterator, Mapping, Optional
+from urllib.parse import parse_qsl
+import aiohttp
+
+from pool import ConnectionPool
+import decoder
+
+
+BASE_URL: Final[str] = 'https://pokeapi.co/api/v2'
+
+
+class Headers(Mapping[str, str]):
+    """Read-only headers looked up case-insensitively, as the ones of aiohttp.
+
+    Parameters
+    ----------
+    headers: :class:`Mapping[str, str]`
+        the headers, in any case
+    """
+
+    __slots__ = ('_headers',)
+
+    def __init__(self, headers: Mapping[str, str]) -> None:
+        self._headers: dict[str, str] = {key.lower(): value for key, value in headers.items()}
+
+    def __getitem__(self, key: str) -> str:
+        return self._headers[key.lower()]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._headers)
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def __repr__(self) -> str:
+        return f'Headers({self._headers!r})'
+
+
+class Response:
+    """A raw response of a :class:`Transport`.
+
+    Attributes
+    ----------
+    status: :class:`int`
+        the HTTP status
+    headers: :class:`Mapping[str, str]`
+        the headers, looked up case-insensitively (see :class:`Headers`)
+    body: :class:`bytes`
+        the body, empty unless the status is 200
+    """
+
+    __slots__ = (
+        'status',
+        'headers',
+        'body'
+    )
+
+    def __init__(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes
+    ) -> None:
+        self.status: int = status
+        self.headers: Mapping[str, str] = headers
+        self.body: bytes = body
+
+
+def parse_page(query: str) -> Optional[tuple[int, int]]:
+    """Returns the `limit` and `offset` of the query of a list, `None` if they are not valid."""
+
+    params = dict(parse_qsl(query))
+
+    try:
+        limit, offset = int(params.get('limit', 20)), int(params.get('offset', 0))
+    except ValueError:
+        return None
+
+    return (limit, offset) if limit >= 0 and offset >= 0 else None
+
+
+class Transport(ABC):
+    """Where :class:`HttpClient` gets its responses from."""
+
+    @abstractmethod
+    async def request(self, endpoint: str) -> Response:
+        """Requests an endpoint.
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            the endpoint, such as `pokemon/1` or `pokemon?limit=20&offset=0`
+
+        Returns
+        -------
+        :class:`Response`
+            the response
+        """
+
+    async def close(self) -> None:
+        pass
+
+
+class HttpTransport(Transport):
+    """Requests Poke API over HTTP.
+
+    Parameters
+    ----------
+    session: :class:`Optional[aiohttp.ClientSession]`
+        the session to use, closed with the transport
+    pool: :class:`Optional[ConnectionPool]`
+        the pool to use if no session is given, a private one if `None`
+    base_url: :class:`str`
+        the URL of the API
+    """
+
+    def __init__(
+        self,
+        *,
+        session: Optional[aiohttp.ClientSession] = None,
+        pool: Optional[ConnectionPool] = None,
+        base_url: str = BASE_URL
+    ) -> None:
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._pool: ConnectionPool = pool if pool is not None else ConnectionPool()
+        self._owns_pool: bool = pool is None
+        self.base_url: str = base_url
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self._session if self._session is not None else self._pool.session
+
+    async def request(self, endpoint: str) -> Response:
+        async with self.session.get(f'{self.base_url}/{endpoint}') as response:
+            return Response(
+                response.status,
+                response.headers,
+                await response.read() if response.status == 200 else b''
+            )
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+        if self._owns_pool:
+            await self._pool.close()
+
+
+class FileSystemTransport(Transport):
+    """Serves a local copy of the static Poke API dump
+    (https://github.com/PokeAPI/api-data), without any network access.
+
+    Resources are read from `<root>/api/v2/<endpoint>/<id>/index.json`,
+    names are resolved into ids with the list of the endpoint (`<root>/api/v2/<endpoint>/index.json`),
+    which also serves the paginated lists. The lists are read once.
+    Malformed list queries are answered with 400, and files which cannot be read with 500.
+
+    Parameters
+    ----------
+    root: :class:`str`
+        the directory containing `api/v2`, or `api/v2` itself
+    """
+
+    NOT_FOUND: Final[Response] = Response(404, {}, b'')
+    BAD_REQUEST: Final[Response] = Response(400, {}, b'')
+    SERVER_ERROR: Final[Response] = Response(500, {}, b'')
+
+    def __init__(self, root: str) -> None:
+        if os.path.isdir(v2 := os.path.join(root, 'api', 'v2')):
+            root = v2
+        self.root: str = root
+        self._indices: dict[str, Optional[list[dict[str, Any]]]] = {}
+        self._ids: dict[str, dict[str, str]] = {}
+
+    def _read(self, *parts: str) -> Optional[bytes]:
+        try:
+            with open(os.path.join(self.root, *parts, 'index.json'), 'rb') as f:
+                return f.read()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def _index(self, endpoint: str) -> Optional[list[dict[str, Any]]]:
+        if endpoint not in self._indices:
+            body = self._read(endpoint)
+            self._indices[endpoint] = decoder.loads(body)['results'] if body is not None else None
+
+        return self._indices[endpoint]
+
+    def _resolve(self, endpoint: str, name: str) -> Optional[str]:
+        if name.isdigit():
+            return name
+
+        if (ids := self._ids.get(endpoint)) is None:
+            ids = self._ids[endpoint] = {
+                result['name']: result['url'].rstrip('/').rsplit('/', 1)[-1]
+                for result in self._index(endpoint) or () if 'name' in result
+            }
+
+        return ids.get(name)
+
+    def _list(self, endpoint: str, query: str) -> Response:
+        if (results := self._index(endpoint)) is None:
+            return self.NOT_FOUND
+
+        if (page := parse_page(query)) is None:
+            return self.BAD_REQUEST
+
+        limit, offset = page
+        url = f'{BASE_URL}/{endpoint}'
+
+        return Response(200, {}, decoder.dumps({
+            'count': len(results),
+            'next': f'{url}?offset={offset + limit}&limit={limit}' if offset + limit < len(results) else None,
+            'previous': f'{url}?offset={max(offset - limit, 0)}&limit={limit}' if offset > 0 else None,
+            'results': results[offset:offset + limit]
+        }))
+
+    async def request(self, endpoint: str) -> Response:
+        try:
+            return self._request(endpoint)
+        except OSError:
+            # such as a permission error, retried by `HttpClient` like any server error
+            return self.SERVER_ERROR
+
+    def _request(self, endpoint: str) -> Response:
+        path, _, query = endpoint.partition('?')
+        parts = path.strip('/').split('/')
+
+        if any(part in ('', '.', '..') or os.sep in part for part in parts):
+            return self.NOT_FOUND
+
+        if len(parts) == 1:
+            return self._list(parts[0], query)
+
+        if (id := self._resolve(parts[0], parts[1])) is None:
+            return self.NOT_FOUND
+
+        if (body := self._read(parts[0], id, *parts[2:])) is None:
+            return self.NOT_FOUND
+
+        return Response(200, {}, body)